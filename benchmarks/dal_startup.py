@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module benchmarks the startup cost of the DALs, i.e., instantiating the
+`DalClinicalTrials`, `DalMesh`, `DalPubmed`, and `DalApp` classes and, when a
+database configuration is provided, executing a first query through each of
+them with separate and shared engines.
+
+Usage:
+    python -m benchmarks.dal_startup [--config CONFIG] [--repeat REPEAT]
+"""
+
+import json
+import time
+import argparse
+import statistics
+from typing import Callable, Dict, List
+
+import sqlalchemy
+
+from fform.dal_base import DalBase
+from fform.dals_ct import DalClinicalTrials
+from fform.dals_mt import DalMesh
+from fform.dals_pubmed import DalPubmed
+from fform.dals_app import DalApp
+
+
+DAL_CLASSES = [DalClinicalTrials, DalMesh, DalPubmed, DalApp]
+
+
+def create_dals(cfg: Dict, **kwargs) -> List[DalBase]:
+    """Instantiates one DAL of each type."""
+
+    return [
+        dal_class(
+            sql_username=cfg["sql_username"],
+            sql_password=cfg["sql_password"],
+            sql_host=cfg["sql_host"],
+            sql_port=cfg["sql_port"],
+            sql_db=cfg["sql_db"],
+            **kwargs
+        ) for dal_class in DAL_CLASSES
+    ]
+
+
+def query_dals(dals: List[DalBase]) -> None:
+    """Executes a first query through each DAL."""
+
+    for dal in dals:
+        with dal.session_scope() as session:
+            session.execute(sqlalchemy.text("SELECT 1"))
+
+
+def time_it(func: Callable, repeat: int) -> List[float]:
+    """Times `repeat` calls of `func` in milliseconds."""
+
+    durations = []
+    for _ in range(repeat):
+        time_beg = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - time_beg) * 1000.0)
+
+    return durations
+
+
+def report(name: str, durations: List[float]) -> None:
+    """Prints the median and minimum of the durations."""
+
+    print(
+        f"{name:<40} median {statistics.median(durations):8.3f} ms  "
+        f"min {min(durations):8.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--config",
+        help="JSON configuration with `sql_*` keys. When omitted only the "
+             "DAL instantiation is benchmarked.",
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    cfg = {
+        "sql_username": "fightfor",
+        "sql_password": "fightfor",
+        "sql_host": "localhost",
+        "sql_port": 5432,
+        "sql_db": "fightfor",
+    }
+    if args.config:
+        with open(args.config) as finp:
+            cfg.update(json.load(finp))
+
+    report(
+        "instantiate 4 DALs",
+        time_it(lambda: create_dals(cfg), args.repeat),
+    )
+
+    if not args.config:
+        return
+
+    def separate():
+        dals = create_dals(cfg)
+        query_dals(dals)
+        for dal in dals:
+            dal.dispose()
+
+    def shared():
+        query_dals(create_dals(cfg, sql_engine_shared=True))
+
+    report(
+        "instantiate + query 4 DALs (separate)",
+        time_it(separate, args.repeat),
+    )
+    report(
+        "instantiate + query 4 DALs (shared)",
+        time_it(shared, args.repeat),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module benchmarks the import cost of the `fform` package and its DAL
+modules by importing each of them in a fresh interpreter under
+`python -X importtime` and reporting the cumulative import time. Results can
+be appended as JSON lines to a history file so that the import cost can be
+tracked over time.
+
+Usage:
+    python -m benchmarks.import_time [--repeat REPEAT] [--output OUTPUT]
+"""
+
+import sys
+import json
+import argparse
+import datetime
+import statistics
+import subprocess
+
+
+MODULES = [
+    "fform",
+    "fform.dals_ct",
+    "fform.dals_mt",
+    "fform.dals_pubmed",
+    "fform.dals_app",
+    "fform.dals_mp",
+]
+
+
+def measure_import_time(module: str) -> float:
+    """Imports a module in a fresh interpreter and returns its cumulative
+    import time in milliseconds."""
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    # Lines are formatted as `import time: <self> | <cumulative> | <name>`
+    # with the imported module itself being reported last.
+    for line in reversed(process.stderr.splitlines()):
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000.0
+
+    raise ValueError(f"Import time of module '{module}' was not reported.")
+
+
+def get_revision() -> str:
+    """Returns the current git revision or an empty string outside a git
+    repository."""
+
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+    return process.stdout.strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output",
+        help="File the results are appended to as a JSON line.",
+    )
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.modules:
+        durations = [
+            measure_import_time(module) for _ in range(args.repeat)
+        ]
+        results[module] = statistics.median(durations)
+        print(
+            f"{module:<24} median {results[module]:8.1f} ms  "
+            f"min {min(durations):8.1f} ms"
+        )
+
+    if args.output:
+        with open(args.output, "a") as fout:
+            record = {
+                "timestamp": datetime.datetime.utcnow().isoformat(),
+                "revision": get_revision(),
+                "python": sys.version.split()[0],
+                "import_time_ms": results,
+            }
+            fout.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main()
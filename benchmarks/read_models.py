@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module benchmarks the hydration time and memory of read-model records
+against ORM objects when retrieving `Study` records. The benchmark uses an
+in-memory SQLite database with the `clinicaltrials` schema attached so that it
+can run without a PostgreSQL server.
+
+Usage:
+    python -m benchmarks.read_models [--studies STUDIES] [--repeat REPEAT]
+"""
+
+import time
+import argparse
+import datetime
+import statistics
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import sqlalchemy
+import sqlalchemy.event
+import sqlalchemy.orm
+
+from fform.orm_ct import Study
+from fform.orm_ct import OverallStatusType
+from fform.orm_ct import PhaseType
+from fform.orm_ct import StudyType
+from fform.read_models import select_read_model
+from fform.read_models import rows_to_records
+
+
+def create_engine(num_studies: int) -> sqlalchemy.engine.Engine:
+    """Creates an in-memory SQLite database populated with `Study` records."""
+
+    engine = sqlalchemy.create_engine(
+        "sqlite://",
+        poolclass=sqlalchemy.pool.StaticPool,
+    )
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def attach_schema(dbapi_connection, connection_record):
+        dbapi_connection.execute(
+            "ATTACH DATABASE ':memory:' AS clinicaltrials"
+        )
+
+    Study.__table__.create(engine)
+
+    engine.execute(
+        Study.__table__.insert(),
+        [
+            {
+                "study_id": idx,
+                "org_study_id": "org_study_id_{}".format(idx),
+                "nct_id": "NCT{:08d}".format(idx),
+                "brief_title": "brief_title",
+                "official_title": "official_title",
+                "source": "source",
+                "brief_summary": "brief_summary " * 50,
+                "overall_status": OverallStatusType.RECRUITING,
+                "start_date": datetime.date(2019, 1, 1),
+                "completion_date": datetime.date(2021, 1, 1),
+                "phase": PhaseType.PHASE_1,
+                "study_type": StudyType.INTERVENTIONAL,
+                "oversight_info_id": idx,
+                "expanded_access_info_id": idx,
+                "study_design_info_id": idx,
+                "enrollment_id": idx,
+                "eligibility_id": idx,
+                "contact_primary_id": idx,
+                "contact_backup_id": idx,
+                "study_dates_id": idx,
+                "responsible_party_id": idx,
+                "patient_data_id": idx,
+            } for idx in range(num_studies)
+        ],
+    )
+
+    return engine
+
+
+def measure(func: Callable, repeat: int) -> Tuple[List[float], int]:
+    """Times `repeat` calls of `func` in milliseconds and measures the memory
+    held by its result in bytes."""
+
+    durations = []
+    for _ in range(repeat):
+        time_beg = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - time_beg) * 1000.0)
+
+    tracemalloc.start()
+    result = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return durations, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--studies", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(num_studies=args.studies)
+    session_factory = sqlalchemy.orm.sessionmaker(bind=engine)
+
+    def orm_objects():
+        session = session_factory()
+        objs = session.query(Study).all()
+        session.close()
+        return objs
+
+    def read_model_records():
+        with engine.connect() as connection:
+            result = connection.execute(select_read_model(Study))
+            return rows_to_records(orm_class=Study, rows=result)
+
+    for name, func in [
+        ("ORM objects", orm_objects),
+        ("read-model records", read_model_records),
+    ]:
+        durations, size = measure(func, args.repeat)
+        print(
+            f"{name:<20} x {args.studies}: "
+            f"median {statistics.median(durations):9.2f} ms  "
+            f"memory {size / args.studies:8.0f} bytes/record"
+        )
+
+
+if __name__ == "__main__":
+    main()
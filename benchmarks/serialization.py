@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module benchmarks the `OrmBase.to_dict` method, which uses serializers
+precompiled per mapped class, against the reference implementation which
+inspected the class and converted values on every call. The outputs of both
+implementations are asserted to be identical.
+
+Note:
+    Only shallow serialization is benchmarked. `to_dict(deep=True)` skips
+    objects already being serialized higher up the tree, which bounds its
+    recursion over bidirectional relationships, but the reference
+    implementation has no such guard and recurses indefinitely over them.
+
+Usage:
+    python -m benchmarks.serialization [--studies STUDIES] [--repeat REPEAT]
+"""
+
+import time
+import inspect
+import argparse
+import datetime
+import statistics
+from typing import Callable, List
+
+import sqlalchemy
+
+from fform.orm_base import OrmBase
+from fform.orm_ct import Study
+from fform.orm_ct import StudyDates
+from fform.orm_ct import Enrollment
+from fform.orm_ct import Keyword
+from fform.orm_ct import OverallStatusType
+from fform.orm_ct import PhaseType
+from fform.orm_ct import StudyType
+from fform.orm_ct import ActualType
+
+
+def to_dict_reference(obj, deep=False, serialisable=False):
+    """Reference implementation of `OrmBase.to_dict` prior to the
+    serializers being precompiled."""
+
+    attributes = {}
+    column_inspection = sqlalchemy.inspect(type(obj)).c
+    relationship_inspection = sqlalchemy.inspect(type(obj)).relationships
+    for member_name, member_value in obj.__dict__.items():
+        if member_name.startswith("_"):
+            continue
+        if inspect.isfunction(member_value) or inspect.ismethod(member_value):
+            continue
+        if member_name in column_inspection:
+            member_inspection = column_inspection[member_name]
+        elif member_name in relationship_inspection:
+            member_inspection = relationship_inspection[member_name]
+        else:
+            continue
+        attributes[member_name] = (member_inspection, member_value)
+
+    results = {}
+    for attr_name, (attr_column, attr_value) in attributes.items():
+        if isinstance(attr_value, OrmBase):
+            if not deep:
+                continue
+            val = to_dict_reference(attr_value, deep, serialisable)
+        elif isinstance(attr_value, list):
+            if not deep:
+                continue
+            val = [to_dict_reference(v, deep, serialisable) for v in attr_value]
+        elif isinstance(attr_value, dict):
+            if not deep:
+                continue
+            val = {
+                k: to_dict_reference(v, deep, serialisable)
+                for k, v in attr_value.items()
+            }
+        else:
+            val = OrmBase._dictify_scalar(
+                scalar=attr_value,
+                column=attr_column,
+                serialisable=serialisable,
+            )
+        results[attr_name] = val
+
+    return results
+
+
+def create_studies(num_studies: int) -> List[Study]:
+    """Creates transient `Study` objects with related records."""
+
+    studies = []
+    for idx in range(num_studies):
+        study = Study(
+            study_id=idx,
+            org_study_id="org_study_id_{}".format(idx),
+            nct_id="NCT{:08d}".format(idx),
+            brief_title="brief_title",
+            official_title="official_title",
+            source="source",
+            brief_summary="brief_summary " * 50,
+            detailed_description="detailed_description " * 200,
+            overall_status=OverallStatusType.RECRUITING,
+            start_date=datetime.date(2019, 1, 1),
+            completion_date=datetime.date(2021, 1, 1),
+            verification_date=datetime.date(2019, 6, 1),
+            phase=PhaseType.PHASE_1,
+            study_type=StudyType.INTERVENTIONAL,
+        )
+        study.study_dates = StudyDates(
+            study_first_submitted=datetime.date(2018, 1, 1),
+            last_update_posted=datetime.date(2019, 1, 1),
+        )
+        study.enrollment = Enrollment(
+            value=100,
+            enrollment_type=ActualType.ACTUAL,
+        )
+        study.keywords = [
+            Keyword(keyword_id=kidx, keyword="keyword_{}".format(kidx))
+            for kidx in range(5)
+        ]
+        studies.append(study)
+
+    return studies
+
+
+def time_it(func: Callable, repeat: int) -> List[float]:
+    """Times `repeat` calls of `func` in milliseconds."""
+
+    durations = []
+    for _ in range(repeat):
+        time_beg = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - time_beg) * 1000.0)
+
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--studies", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    studies = create_studies(num_studies=args.studies)
+
+    objs = [
+        obj
+        for study in studies
+        for obj in [study, study.study_dates, study.enrollment] + study.keywords
+    ]
+
+    for serialisable in [False, True]:
+        for obj in objs:
+            assert obj.to_dict(serialisable=serialisable) == to_dict_reference(
+                obj, serialisable=serialisable,
+            )
+
+        durations_ref = time_it(
+            lambda: [to_dict_reference(s, serialisable=serialisable)
+                     for s in studies],
+            args.repeat,
+        )
+        durations_new = time_it(
+            lambda: [s.to_dict(serialisable=serialisable) for s in studies],
+            args.repeat,
+        )
+        duration_ref = statistics.median(durations_ref)
+        duration_new = statistics.median(durations_new)
+        print(
+            f"to_dict(serialisable={serialisable!s:<5}) x {args.studies}: "
+            f"reference {duration_ref:8.2f} ms  "
+            f"precompiled {duration_new:8.2f} ms  "
+            f"speedup {duration_ref / duration_new:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
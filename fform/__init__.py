@@ -1,23 +1,69 @@
 # -*- coding: utf-8 -*-
 
-"""Top-level package for fightfor-orm."""
+"""Top-level package for fightfor-orm.
+
+Submodules, and the ORM classes they define, are imported lazily upon first
+access as package attributes, e.g., `fform.dals_ct` or `fform.Study`, so that
+importing a single submodule doesn't load the entire package.
+"""
+
+import importlib
 
 __author__ = """Adamos Kyriakou"""
 __email__ = 'adam@bearnd.io'
 __version__ = '0.24.3'
 
-from fform import loggers
-from fform import utils
-from fform import orm_base
-from fform import orm_ct
-from fform import dal_base
-from fform import dals_ct
-from fform import orm_app
-from fform import dals_app
-from fform import orm_mp
-from fform import dals_mp
-from fform.orm_mt import *
-from fform.orm_ct import *
-from fform.orm_pubmed import *
-from fform.orm_app import *
-from fform.orm_mp import *
+# Submodules accessible as package attributes.
+_submodules = [
+    "loggers",
+    "utils",
+    "excs",
+    "orm_base",
+    "orm_ct",
+    "orm_mt",
+    "orm_pubmed",
+    "orm_app",
+    "orm_mp",
+    "dal_base",
+    "dals_ct",
+    "dals_mt",
+    "dals_pubmed",
+    "dals_app",
+    "dals_mp",
+    "executors",
+    "encoders",
+    "server_md5",
+    "read_models",
+    "columnar",
+    "lazy_loads",
+]
+
+# ORM modules whose public names are exported as package attributes in order of
+# precedence should a name be defined in multiple modules.
+_orm_modules = [
+    "fform.orm_mp",
+    "fform.orm_app",
+    "fform.orm_pubmed",
+    "fform.orm_ct",
+    "fform.orm_mt",
+]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("fform." + name)
+
+    if not name.startswith("_"):
+        for module_name in _orm_modules:
+            module = importlib.import_module(module_name)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                # Cache the value so that subsequent lookups are direct.
+                globals()[name] = value
+                return value
+
+    raise AttributeError(f"module 'fform' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(list(globals().keys()) + _submodules)
@@ -0,0 +1,248 @@
+# coding: utf-8
+
+""" Columnar conversion module.
+
+This module contains functions converting the rows of a Core select into
+columnar data, i.e., NumPy arrays or Arrow tables, for analytics jobs that
+retrieve a few columns for a large number of records. Enumeration columns are
+selected as their raw labels, so that no enumeration members are created per
+row, and mapped to the values of their `EnumBase` members once per distinct
+label. Date and date-time columns are mapped to `datetime64` arrays.
+
+The `numpy` and `pyarrow` packages are optional dependencies and are only
+imported when columnar data is requested in their format.
+"""
+
+import importlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import sqlalchemy
+import sqlalchemy.types
+from sqlalchemy.sql import ColumnElement
+
+
+def _import_optional(module_name: str) -> Any:
+    """Imports an optional dependency raising an informative error when it
+    is not installed."""
+
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        msg = (f"The `{module_name}` package is required for this columnar "
+               f"format.")
+        raise ImportError(msg) from exc
+
+
+def get_column_kind(column_type: sqlalchemy.types.TypeEngine) -> str:
+    """Returns the kind of columnar data a column type maps to.
+
+    Args:
+        column_type (sqlalchemy.types.TypeEngine): The column type.
+
+    Returns:
+        str: One of `enum`, `datetime`, `date`, `boolean`, `integer`, `float`,
+            `string`, or `object`.
+    """
+
+    if isinstance(column_type, sqlalchemy.types.Enum):
+        return "enum"
+    if isinstance(column_type, sqlalchemy.types.DateTime):
+        return "datetime"
+    if isinstance(column_type, sqlalchemy.types.Date):
+        return "date"
+    if isinstance(column_type, sqlalchemy.types.Boolean):
+        return "boolean"
+    if isinstance(column_type, sqlalchemy.types.Integer):
+        return "integer"
+    if isinstance(column_type, (sqlalchemy.types.Float,
+                                sqlalchemy.types.Numeric)):
+        return "float"
+    if isinstance(column_type, sqlalchemy.types.String):
+        return "string"
+
+    return "object"
+
+
+def prepare_columns(
+    columns: List[Any],
+) -> Tuple[List[ColumnElement], List[str], List[str], List[Optional[Type]]]:
+    """Prepares the columns of a columnar select.
+
+    Enumeration columns are coerced to strings so that their raw labels are
+    returned instead of enumeration members and numeric columns are coerced to
+    floats so that no `Decimal` objects are created.
+
+    Args:
+        columns (List[Any]): The ORM attributes or Core columns to be selected,
+            e.g., `[Study.start_date, Study.phase]`.
+
+    Returns:
+        Tuple[List[ColumnElement], List[str], List[str], List[Optional[Type]]]:
+            - The labelled columns to be selected.
+            - The names of the columns, i.e., the attribute keys.
+            - The kinds of the columns as per `get_column_kind`.
+            - The enumeration classes of the enumeration columns.
+    """
+
+    selected = []
+    names = []
+    kinds = []
+    enum_classes = []
+    for column in columns:
+        name = column.key
+        column_type = column.type
+        kind = get_column_kind(column_type)
+
+        enum_class = None
+        if kind == "enum":
+            enum_class = column_type.enum_class
+            column = sqlalchemy.type_coerce(column, sqlalchemy.types.Unicode())
+        elif kind == "float":
+            column = sqlalchemy.type_coerce(column, sqlalchemy.types.Float())
+
+        selected.append(column.label(name))
+        names.append(name)
+        kinds.append(kind)
+        enum_classes.append(enum_class)
+
+    return selected, names, kinds, enum_classes
+
+
+def _get_enum_labels(enum_class: Optional[Type]) -> Dict[str, Any]:
+    """Returns the values of the enumeration members keyed by their label as
+    stored in the database, i.e., their name for `EnumBase` classes."""
+
+    if enum_class is None:
+        return {}
+
+    return {
+        name: member.value for name, member in enum_class.__members__.items()
+    }
+
+
+def to_numpy_array(
+    values: Sequence[Any],
+    kind: str,
+    enum_class: Optional[Type] = None,
+) -> Any:
+    """Converts the values of a column into a NumPy array.
+
+    Integer and boolean columns holding `None` values are converted into
+    `float64` and `object` arrays respectively while `None` values of date
+    and date-time columns are converted into `NaT`.
+
+    Args:
+        values (Sequence[Any]): The column values.
+        kind (str): The kind of the column as per `get_column_kind`.
+        enum_class (Type, optional): The enumeration class of an enumeration
+            column. Defaults to `None`.
+
+    Returns:
+        numpy.ndarray: The column array.
+    """
+
+    numpy = _import_optional("numpy")
+
+    if kind == "enum":
+        labels = _get_enum_labels(enum_class)
+        array = numpy.array(values, dtype=object)
+        return numpy.frompyfunc(labels.get, 1, 1)(array).astype(object)
+    if kind == "date":
+        return numpy.array(values, dtype="datetime64[D]")
+    if kind == "datetime":
+        return numpy.array(values, dtype="datetime64[us]")
+    if kind == "integer":
+        dtype = numpy.float64 if None in values else numpy.int64
+        return numpy.array(values, dtype=dtype)
+    if kind == "float":
+        return numpy.array(values, dtype=numpy.float64)
+    if kind == "boolean":
+        dtype = object if None in values else numpy.bool_
+        return numpy.array(values, dtype=dtype)
+
+    return numpy.array(values, dtype=object)
+
+
+def to_arrow_array(
+    values: Sequence[Any],
+    kind: str,
+    enum_class: Optional[Type] = None,
+) -> Any:
+    """Converts the values of a column into an Arrow array.
+
+    Enumeration columns are converted into dictionary arrays whose dictionary
+    holds the values of the enumeration members.
+
+    Args:
+        values (Sequence[Any]): The column values.
+        kind (str): The kind of the column as per `get_column_kind`.
+        enum_class (Type, optional): The enumeration class of an enumeration
+            column. Defaults to `None`.
+
+    Returns:
+        pyarrow.Array: The column array.
+    """
+
+    pyarrow = _import_optional("pyarrow")
+
+    if kind == "enum":
+        labels = _get_enum_labels(enum_class)
+        array = pyarrow.array(values, type=pyarrow.string()).dictionary_encode()
+        # Map each distinct label once.
+        dictionary = pyarrow.array(
+            [labels.get(label) for label in array.dictionary.to_pylist()],
+            type=pyarrow.string(),
+        )
+        return pyarrow.DictionaryArray.from_arrays(array.indices, dictionary)
+
+    types = {
+        "date": pyarrow.date32(),
+        "datetime": pyarrow.timestamp("us"),
+        "integer": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "boolean": pyarrow.bool_(),
+        "string": pyarrow.string(),
+    }
+
+    return pyarrow.array(values, type=types.get(kind))
+
+
+def rows_to_columnar(
+    rows: List[Sequence[Any]],
+    names: List[str],
+    kinds: List[str],
+    enum_classes: List[Optional[Type]],
+    do_arrow: bool = False,
+) -> Any:
+    """Converts a chunk of rows into columnar data.
+
+    Args:
+        rows (List[Sequence[Any]]): The rows of a select prepared through
+            `prepare_columns`.
+        names (List[str]): The names of the columns.
+        kinds (List[str]): The kinds of the columns.
+        enum_classes (List[Optional[Type]]): The enumeration classes of the
+            columns.
+        do_arrow (bool, optional): Whether to return an Arrow table instead of
+            NumPy arrays. Defaults to `False`.
+
+    Returns:
+        Union[Dict[str, numpy.ndarray], pyarrow.Table]: The NumPy arrays keyed
+            by column name or the Arrow table.
+    """
+
+    # Transpose the rows into columns.
+    columns = list(zip(*rows)) if rows else [() for _ in names]
+
+    convert = to_arrow_array if do_arrow else to_numpy_array
+
+    arrays = [
+        convert(values=list(values), kind=kind, enum_class=enum_class)
+        for values, kind, enum_class in zip(columns, kinds, enum_classes)
+    ]
+
+    if do_arrow:
+        pyarrow = _import_optional("pyarrow")
+        return pyarrow.Table.from_arrays(arrays, names=names)
+
+    return dict(zip(names, arrays))
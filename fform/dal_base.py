@@ -6,16 +6,32 @@ This module contains the `DalBase` class which is meant to facilitate safe
 interaction between SQLAlchemy and SQL-servers.
 """
 
+import os
+import time
+import random
 import inspect
+import logging
+import collections
+import threading
 import contextlib
-from typing import Dict, List, Any, Type, Optional
+import concurrent.futures
+from typing import Dict, List, Any, Type, Optional, Callable, Tuple, Iterator
 
 import decorator
 import sqlalchemy
+import sqlalchemy.exc
+import sqlalchemy.event
 import sqlalchemy.orm
+from sqlalchemy.dialects.postgresql import Insert
 
 from fform.orm_base import OrmBase
 from fform.orm_base import OrmFightForBase
+from fform.read_models import select_read_model
+from fform.read_models import rows_to_records
+from fform.columnar import prepare_columns
+from fform.columnar import rows_to_columnar
+from fform.lazy_loads import get_session_kwargs
+from fform.lazy_loads import get_repeated_lazy_loads
 from fform.loggers import create_logger
 from fform.excs import MissingAttributeError
 from fform.excs import InvalidArgumentsError
@@ -23,6 +39,111 @@ from fform.excs import RecordMissingError
 from fform.excs import RelationshipDoesNotExist
 
 
+# PostgreSQL error codes (SQLSTATE) denoting transient errors after which the
+# transaction is rolled back and can be safely retried.
+TRANSIENT_ERROR_CODES = {
+    # serialization_failure
+    "40001",
+    # deadlock_detected
+    "40P01",
+}
+
+
+def is_transient_error(exc: Exception) -> bool:
+    """Checks whether an exception raised by the database is transient, i.e.,
+    a deadlock or serialization failure, and the transaction can be retried.
+
+    Args:
+        exc (Exception): The exception to be checked.
+
+    Returns:
+        bool: Whether the exception is transient.
+    """
+
+    if not isinstance(exc, sqlalchemy.exc.DBAPIError):
+        return False
+
+    return getattr(exc.orig, "pgcode", None) in TRANSIENT_ERROR_CODES
+
+
+# The outcomes of IODU statements counted by the `DalFightForBase` class.
+IODU_OUTCOMES = ("inserted", "updated", "unchanged")
+
+
+def get_distinct_clause(
+    table: sqlalchemy.Table,
+    set_: Dict[str, Any],
+) -> sqlalchemy.sql.ClauseElement:
+    """Returns the `WHERE` clause of an `ON CONFLICT DO UPDATE` statement which
+    only allows the update when any of the updated columns would change.
+
+    Args:
+        table (sqlalchemy.Table): The table the statement inserts into.
+        set_ (Dict[str, Any]): The values the columns are updated to keyed by
+            column key, i.e., the `set_` argument of `on_conflict_do_update`.
+
+    Returns:
+        sqlalchemy.sql.ClauseElement: The `IS DISTINCT FROM` clause.
+    """
+
+    return sqlalchemy.or_(*[
+        table.c[key].is_distinct_from(value) for key, value in set_.items()
+    ])
+
+
+def get_is_inserted_column() -> sqlalchemy.sql.ColumnElement:
+    """Returns the column returned by `ON CONFLICT DO UPDATE` statements which
+    denotes whether the record was inserted rather than updated.
+
+    Note:
+        Relies on the `xmax` system column which is `0` for rows inserted by
+        the current statement and set to the updating transaction otherwise.
+
+    Returns:
+        sqlalchemy.sql.ColumnElement: The labelled column.
+    """
+
+    return sqlalchemy.literal_column(
+        "xmax = 0",
+        type_=sqlalchemy.Boolean,
+    ).label("is_inserted")
+
+
+# Engines shared across DALs keyed by their URL and engine arguments.
+_engines_shared = {}  # type: Dict[Tuple, sqlalchemy.engine.Engine]
+_engines_shared_lock = threading.Lock()
+
+
+def protect_engine_from_fork(engine: sqlalchemy.engine.Engine) -> None:
+    """Adds event listeners to an SQLAlchemy engine that prevent pooled
+    connections from being shared across processes.
+
+    Connections are tagged with the PID of the process that opened them and
+    connections inherited by a forked child process are invalidated upon
+    checkout forcing the pool to open a new connection in the child.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): The engine to be protected.
+    """
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+
+    @sqlalchemy.event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            # Detach the connection from the pool without closing it as it is
+            # still in use by the parent process.
+            connection_record.connection = connection_proxy.connection = None
+            raise sqlalchemy.exc.DisconnectionError(
+                f"Connection record belongs to PID "
+                f"{connection_record.info['pid']}, attempting to check out in "
+                f"PID {pid}."
+            )
+
+
 def with_session_scope(**dec_kwargs):
     """Decorator factory, takes arguments accepted by the `session_scope` method
     of the `self` object of its wrapped function.
@@ -38,6 +159,13 @@ def with_session_scope(**dec_kwargs):
         If call to wrapped function doesn't pass a session, will create a new
         session according to the args passed to the decorator factory.
         Otherwise, will leave session alone and become a noop.
+
+        When the decorator creates the session it also owns the transaction
+        so should the wrapped function fail due to a transient error (see
+        `is_transient_error`) the whole call is retried in a new session up to
+        `sql_retry_attempts` times with an exponential backoff. Calls through
+        a caller-provided session are never retried as the caller's
+        transaction has already been aborted.
     """
 
     @decorator.decorator
@@ -47,9 +175,105 @@ def with_session_scope(**dec_kwargs):
         if "session" in kwargs and kwargs["session"]:
             return target(**kwargs)
         else:
-            with kwargs["self"].session_scope(**dec_kwargs) as session:
-                kwargs["session"] = session
-                return target(**kwargs)
+            dal = kwargs["self"]
+            attempt = 0
+            while True:
+                try:
+                    with dal.session_scope(**dec_kwargs) as session:
+                        kwargs["session"] = session
+                        return target(**kwargs)
+                except sqlalchemy.exc.DBAPIError as exc:
+                    attempt += 1
+                    if (
+                        not is_transient_error(exc) or
+                        attempt > dal.sql_retry_attempts
+                    ):
+                        raise exc
+                    dal.wait_before_retry(attempt=attempt, exc=exc)
+
+    return wrapper
+
+
+def _call_bisecting(
+    target,
+    callargs: Dict[str, Any],
+    batch_args: List[str],
+) -> Any:
+    """Calls `target` with `callargs` and, should the call fail with a
+    transient error, splits the batch arguments in halves and recursively
+    calls `target` on each half.
+
+    Args:
+        target: The callable to be called.
+        callargs (Dict[str, Any]): The complete name:value pairs of the
+            arguments `target` will be called with.
+        batch_args (List[str]): The names of the equal-length `list` arguments
+            holding the batch. Any other argument is passed to both halves as
+            is.
+
+    Returns:
+        Any: The result of the call, i.e., the concatenated `list` results or
+            merged `dict` results of the halves when the batch was split.
+    """
+
+    try:
+        return target(**callargs)
+    except sqlalchemy.exc.DBAPIError as exc:
+        # A caller-provided session has been aborted by the error so the batch
+        # cannot be retried within it.
+        if callargs.get("session") or not is_transient_error(exc):
+            raise exc
+
+        length = len(callargs[batch_args[0]]) if batch_args else 0
+
+        # A batch of a single row cannot be split any further.
+        if length < 2:
+            raise exc
+
+        callargs["self"].logger.warning(
+            f"Splitting batch of {length} rows after transient error: {exc}."
+        )
+
+        results = []
+        for idx_beg, idx_end in [(0, length // 2), (length // 2, length)]:
+            callargs_half = dict(callargs)
+            for name in batch_args:
+                callargs_half[name] = callargs[name][idx_beg:idx_end]
+            results.append(_call_bisecting(target, callargs_half, batch_args))
+
+        result_first, result_second = results
+        if isinstance(result_first, list):
+            return result_first + result_second
+        elif isinstance(result_first, dict):
+            return dict(result_first, **result_second)
+
+        return None
+
+
+def with_batch_bisection(batch_args: List[str]):
+    """Decorator factory that splits the batch of a bulk method in halves and
+    retries each half separately when the batch keeps failing due to transient
+    errors.
+
+    Args:
+        batch_args (List[str]): The names of the equal-length `list` arguments
+            holding the batch, e.g., `["study_ids", "keyword_ids"]`. Only these
+            arguments are split so that other `list` arguments, e.g., filters
+            or column names, are passed to each half unchanged.
+
+    Note:
+        Meant for the `biodi_*` methods of `DalFightForBase` derived classes
+        which return either `None`, a `list` aligned to the batch, or a
+        `dict`. The decorator should be applied over `with_session_scope` so
+        that each half is retried in its own session before being split any
+        further.
+    """
+
+    @decorator.decorator
+    def wrapper(target, *args, **kwargs):
+        callargs = inspect.getcallargs(target, *args, **kwargs)
+
+        return _call_bisecting(target, callargs, batch_args)
 
     return wrapper
 
@@ -96,16 +320,82 @@ class DalBase(object):
         )
         self.sql_engine_echo = kwargs.get("sql_engine_echo", False)
         self.expire_on_commit = kwargs.get("expire_on_commit", False)
+        self.sql_retry_attempts = kwargs.get("sql_retry_attempts", 3)
+        self.sql_retry_backoff = kwargs.get("sql_retry_backoff", 0.1)
+        self.sql_retry_backoff_max = kwargs.get("sql_retry_backoff_max", 5.0)
+
+        self.sql_engine_shared = kwargs.get("sql_engine_shared", False)
+
+        # Whether lazy loads are counted (`count`), warned about (`warn`), or
+        # disallowed (`raise`), and the number of lazy loads of a relationship
+        # within a session reported as an N+1 query pattern.
+        self.lazy_load_mode = kwargs.get("lazy_load_mode", None)
+        self.lazy_load_threshold = kwargs.get("lazy_load_threshold", 2)
+
+        # The engine and session-factory are only created upon first use so
+        # that instantiating a DAL is cheap and never touches the database.
+        self._engine = None  # type: Optional[sqlalchemy.engine.Engine]
+        self._session_factory = None
+        self._lock = threading.Lock()
+
+        # Resolved eagerly so that an invalid lazy-load mode is reported upon
+        # instantiation rather than upon first use of a session.
+        self._session_kwargs = get_session_kwargs(
+            lazy_load_mode=self.lazy_load_mode,
+        )
 
-        # create DB engine.
-        self.engine = self.connect()
+    @property
+    def engine(self) -> sqlalchemy.engine.Engine:
+        """sqlalchemy.engine.Engine: The SQLAlchemy engine created upon first
+        access. When `sql_engine_shared` is set the engine is shared with all
+        other DALs using the same URL and engine arguments."""
+
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    self._engine = self._get_engine()
+
+        return self._engine
+
+    @property
+    def session_factory(self) -> sqlalchemy.orm.sessionmaker:
+        """sqlalchemy.orm.sessionmaker: The session-factory bound to the engine
+        created upon first access."""
+
+        if self._session_factory is None:
+            self._session_factory = sqlalchemy.orm.sessionmaker(
+                bind=self.engine,
+                expire_on_commit=self.expire_on_commit,
+                **self._session_kwargs
+            )
+
+        return self._session_factory
+
+    def _get_engine(self) -> sqlalchemy.engine.Engine:
+        """Creates a new engine or, when `sql_engine_shared` is set, retrieves
+        the engine shared across DALs with the same URL and engine arguments.
+
+        Returns:
+            sqlalchemy.engine.Engine: The SQLAlchemy engine.
+        """
 
-        # create new session.
-        self.session_factory = sqlalchemy.orm.sessionmaker(
-            bind=self.engine,
-            expire_on_commit=self.expire_on_commit
+        if not self.sql_engine_shared:
+            return self.connect()
+
+        url = self.create_url()
+        key = (
+            url,
+            self.sql_engine_pool_size,
+            self.sql_engine_pool_recycle,
+            self.sql_engine_echo,
         )
 
+        with _engines_shared_lock:
+            if key not in _engines_shared:
+                _engines_shared[key] = self.connect(url=url)
+
+            return _engines_shared[key]
+
     def create_url(self):
         """Renders the database URL for the given template"""
 
@@ -123,7 +413,8 @@ class DalBase(object):
         return url
 
     def connect(self, url=None):
-        """Connects to the database and returns the SQLAlchemy engine
+        """Creates and returns the SQLAlchemy engine. Connections to the
+        database are only opened by the engine's pool upon first use.
 
         Args:
             url (str): The database URL.
@@ -144,11 +435,51 @@ class DalBase(object):
             echo=self.sql_engine_echo,
         )
 
-        # Connect to the database.
-        engine.connect()
+        # Ensure pooled connections are never shared with forked processes.
+        protect_engine_from_fork(engine=engine)
 
         return engine
 
+    def dispose(self) -> None:
+        """Disposes of the engine's connection pool closing all checked-in
+        connections. This is a no-op if the engine was never created.
+
+        Note:
+            When `sql_engine_shared` is set the engine's pool is used by other
+            DALs as well so it is left intact and only this DAL's references
+            to the engine and session-factory are dropped. A shared engine is
+            recreated upon the next use of this DAL.
+        """
+
+        if self._engine is None:
+            return
+
+        if not self.sql_engine_shared:
+            self._engine.dispose()
+
+        with self._lock:
+            self._engine = None
+            self._session_factory = None
+
+    def wait_before_retry(self, attempt: int, exc: Exception) -> None:
+        """Sleeps for an exponentially growing, jittered, period before a
+        transaction that failed due to a transient error is retried.
+
+        Args:
+            attempt (int): The number of the retry about to be performed
+                starting at `1`.
+            exc (Exception): The transient error that caused the failure.
+        """
+
+        # Double the backoff on every attempt up to the maximum backoff and
+        # apply a random jitter so that conflicting transactions do not retry
+        # in lockstep.
+        backoff = min(
+            self.sql_retry_backoff * 2 ** (attempt - 1),
+            self.sql_retry_backoff_max,
+        )
+        time.sleep(backoff * random.uniform(0.5, 1.0))
+
     @contextlib.contextmanager
     def session_scope(self, expunge_objects=True, refresh_objects=False):
         """Provide a transactional scope around a series of operations
@@ -167,6 +498,11 @@ class DalBase(object):
             accessed after the session is closed. Doing so will raise a
             `DetachedInstance` exception.
 
+        Note:
+            A context-manager cannot re-run the block it wraps so transient
+            errors are retried by the `with_session_scope` decorator which
+            owns the entire call.
+
         Yields:
             sqlalchemy.orm.session.Session: A new session established through
                 `self.engine`.
@@ -195,9 +531,31 @@ class DalBase(object):
                     session.refresh(obj)
             if expunge_objects:
                 session.expunge_all()
+            if self.lazy_load_mode:
+                self.report_lazy_loads(session=session)
 
             session.close()
 
+    def report_lazy_loads(
+        self,
+        session: sqlalchemy.orm.Session,
+    ) -> Dict[str, int]:
+        """Reports the relationships lazy-loaded through a session at least
+        `lazy_load_threshold` times, i.e., the likely N+1 query patterns.
+
+        Args:
+            session (sqlalchemy.orm.Session): The session.
+
+        Returns:
+            Dict[str, int]: The number of lazy loads keyed by relationship,
+                e.g., `Study.sponsors`, in descending order.
+        """
+
+        return get_repeated_lazy_loads(
+            session=session,
+            threshold=self.lazy_load_threshold,
+        )
+
 
 class DalFightForBase(DalBase):
     def __init__(
@@ -211,10 +569,18 @@ class DalFightForBase(DalBase):
         **kwargs
     ):
 
-        self.logger = create_logger(
-            logger_name=type(self).__name__,
-            logger_level=kwargs.get("logger_level", "DEBUG")
-        )
+        # The logger is only created upon first use.
+        self.logger_level = kwargs.get("logger_level", "DEBUG")
+        self._logger = None  # type: Optional[logging.Logger]
+
+        # Maximum number of threads used to dispatch concurrent DAL calls. The
+        # thread-pool is only created upon the first dispatch.
+        self.dispatch_max_workers = kwargs.get("dispatch_max_workers", 4)
+        self._dispatch_executor = None
+
+        # Number of records inserted, updated, or left unchanged by IODU
+        # statements keyed by table name and outcome.
+        self.iodu_counts = collections.Counter()
 
         super(DalFightForBase, self).__init__(
             sql_username=sql_username,
@@ -226,11 +592,140 @@ class DalFightForBase(DalBase):
             **kwargs
         )
 
+    @property
+    def logger(self) -> logging.Logger:
+        """logging.Logger: The DAL logger created upon first access."""
+
+        if self._logger is None:
+            self._logger = create_logger(
+                logger_name=type(self).__name__,
+                logger_level=self.logger_level,
+            )
+
+        return self._logger
+
+    def wait_before_retry(self, attempt: int, exc: Exception) -> None:
+        """Logs the transient error and sleeps before the transaction is
+        retried.
+
+        Args:
+            attempt (int): The number of the retry about to be performed
+                starting at `1`.
+            exc (Exception): The transient error that caused the failure.
+        """
+
+        self.logger.warning(
+            f"Retrying transaction (attempt {attempt} of "
+            f"{self.sql_retry_attempts}) after transient error: {exc}."
+        )
+
+        super(DalFightForBase, self).wait_before_retry(attempt=attempt, exc=exc)
+
+    def report_lazy_loads(
+        self,
+        session: sqlalchemy.orm.Session,
+    ) -> Dict[str, int]:
+        """Logs and returns the relationships lazy-loaded through a session at
+        least `lazy_load_threshold` times.
+
+        Args:
+            session (sqlalchemy.orm.Session): The session.
+
+        Returns:
+            Dict[str, int]: The number of lazy loads keyed by relationship in
+                descending order.
+        """
+
+        repeated = super(DalFightForBase, self).report_lazy_loads(
+            session=session,
+        )
+
+        if repeated:
+            self.logger.warning(
+                f"Detected repeated lazy loads (possible N+1 queries): "
+                f"{repeated}."
+            )
+
+        return repeated
+
+    def dispose(self) -> None:
+        """Shuts down the dispatch thread-pool (if any) and disposes of the
+        engine's connection pool."""
+
+        if self._dispatch_executor:
+            self._dispatch_executor.shutdown(wait=True)
+            self._dispatch_executor = None
+
+        super(DalFightForBase, self).dispose()
+
+    def dispatch(
+        self,
+        calls: List[Tuple[Callable, Dict[str, Any]]],
+    ) -> List[Any]:
+        """Executes independent DAL calls concurrently through a thread-pool.
+
+        Each call creates its own session and therefore runs on its own pooled
+        connection within its own transaction, allowing the I/O latency of the
+        calls to overlap. As such, calls must not depend on each other.
+
+        Note:
+            The engine's connection pool, i.e., `sql_engine_pool_size` and its
+            overflow, should be large enough to accommodate
+            `dispatch_max_workers` concurrent connections.
+
+        Args:
+            calls (List[Tuple[Callable, Dict[str, Any]]]): The calls to be
+                executed as pairs of DAL methods and the keyword arguments
+                they'll be called with, e.g.,
+                `(dal.biodi_keywords, {"keywords": [...], "md5s": [...]})`.
+
+        Returns:
+            List[Any]: The results of the calls in the order of `calls`.
+
+        Raises:
+            InvalidArgumentsError: Raised when a session is passed to any of
+                the calls as sessions cannot be shared across threads.
+            Exception: The exception raised by the first failing call (in the
+                order of `calls`) once all calls have completed. Calls that
+                succeeded have already been committed.
+        """
+
+        for _, call_kwargs in calls:
+            if call_kwargs.get("session"):
+                msg = "Dispatched calls cannot be passed a session."
+                self.logger.error(msg)
+                raise InvalidArgumentsError(msg)
+
+        self.logger.info(f"Dispatching {len(calls)} concurrent DAL calls.")
+
+        # Create the thread-pool under the lock so that concurrent dispatches
+        # through a shared DAL don't create one each.
+        with self._lock:
+            if not self._dispatch_executor:
+                self._dispatch_executor = (
+                    concurrent.futures.ThreadPoolExecutor(
+                        max_workers=self.dispatch_max_workers,
+                        thread_name_prefix=type(self).__name__,
+                    )
+                )
+            executor = self._dispatch_executor
+
+        futures = [
+            executor.submit(call, **call_kwargs) for call, call_kwargs in calls
+        ]
+
+        # Wait for all calls to complete before propagating any errors so that
+        # no call is left running behind the caller's back.
+        concurrent.futures.wait(futures)
+
+        return [future.result() for future in futures]
+
     @with_session_scope()
     def get(
         self,
         orm_class: Type[OrmFightForBase],
         pk: int,
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> Type[OrmFightForBase]:
         """ Retrieves the record object of `orm_class` type through the value of
@@ -240,6 +735,9 @@ class DalFightForBase(DalBase):
             orm_class (Type[OrmFightForBase]): An object of a class derived off
                 `OrmFightForBase`.
             pk (int): The primary-key ID of the record to be retrieved.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the record,
+                e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the record will be retrieved. Defaults to `None`
                 in which case a new session is automatically created and
@@ -259,10 +757,173 @@ class DalFightForBase(DalBase):
             getattr(orm_class, orm_class.get_pk_name()) == pk
         )
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         obj = query.one_or_none()
 
         return obj
 
+    @with_session_scope()
+    def get_record(
+        self,
+        orm_class: Type[OrmFightForBase],
+        pk: int,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Optional[tuple]:
+        """ Retrieves the read-model record of `orm_class` type through the
+            value of its primary-key ID.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): An object of a class derived off
+                `OrmFightForBase`.
+            pk (int): The primary-key ID of the record to be retrieved.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the record will be retrieved. Defaults to `None`
+                in which case a new session is automatically created and
+                terminated upon completion.
+
+        Returns:
+            tuple: The immutable read-model record of `orm_class` type matching
+                the primary-key ID and `None` if no record exists.
+        """
+
+        records = self.get_records(
+            orm_class=orm_class,
+            clauses=[orm_class.get_pk() == pk],
+            session=session,
+        )
+
+        return records[0] if records else None
+
+    @with_session_scope()
+    def get_records(
+        self,
+        orm_class: Type[OrmFightForBase],
+        clauses: Optional[List[sqlalchemy.sql.ClauseElement]] = None,
+        order_by: Optional[List[sqlalchemy.sql.ClauseElement]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[tuple]:
+        """ Retrieves read-model records of `orm_class` type directly from the
+            rows of a Core select bypassing the creation of ORM objects.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): An object of a class derived off
+                `OrmFightForBase`.
+            clauses (List[sqlalchemy.sql.ClauseElement], optional): The clauses
+                the records will be filtered by, e.g., `[Study.nct_id ==
+                "NCT00000102"]`. Defaults to `None`.
+            order_by (List[sqlalchemy.sql.ClauseElement], optional): The
+                clauses the records will be ordered by. Defaults to `None`.
+            limit (int, optional): The maximum number of records retrieved.
+                Defaults to `None`.
+            offset (int, optional): The number of records skipped. Defaults to
+                `None`.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be retrieved. Defaults to `None`
+                in which case a new session is automatically created and
+                terminated upon completion.
+
+        Returns:
+            List[tuple]: The immutable read-model records of `orm_class` type
+                as generated by the `get_read_model` function.
+        """
+
+        self.logger.info(
+            f"Retrieving `{orm_class.__name__}` read-model records."
+        )
+
+        statement = select_read_model(orm_class=orm_class)
+        for clause in clauses or []:
+            statement = statement.where(clause)
+        if order_by:
+            statement = statement.order_by(*order_by)
+        if limit is not None:
+            statement = statement.limit(limit)
+        if offset is not None:
+            statement = statement.offset(offset)
+
+        result = session.execute(statement)
+
+        records = rows_to_records(orm_class=orm_class, rows=result)
+
+        return records
+
+    def iter_columnar(
+        self,
+        columns: List[Any],
+        clauses: Optional[List[sqlalchemy.sql.ClauseElement]] = None,
+        order_by: Optional[List[sqlalchemy.sql.ClauseElement]] = None,
+        chunk_size: int = 100000,
+        do_arrow: bool = False,
+    ) -> Iterator[Any]:
+        """ Retrieves columns of records as columnar data, i.e., NumPy arrays
+            or Arrow tables, in chunks bypassing the creation of ORM objects
+            and enumeration members.
+
+        The rows are streamed through a server-side cursor and converted into
+        columnar data one chunk at a time. Enumeration columns are converted
+        into the values of their `EnumBase` members, date columns into
+        `datetime64[D]`, and date-time columns into `datetime64[us]` arrays.
+
+        Note:
+            The `numpy` or, when `do_arrow` is `True`, the `pyarrow` package
+            needs to be installed.
+
+        Args:
+            columns (List[Any]): The ORM attributes or Core columns to be
+                retrieved, e.g., `[Study.study_id, Study.start_date,
+                Study.phase]`.
+            clauses (List[sqlalchemy.sql.ClauseElement], optional): The clauses
+                the records will be filtered by. Defaults to `None`.
+            order_by (List[sqlalchemy.sql.ClauseElement], optional): The
+                clauses the records will be ordered by. Defaults to `None`.
+            chunk_size (int, optional): The maximum number of records per
+                chunk. Defaults to `100000`.
+            do_arrow (bool, optional): Whether to yield Arrow tables instead of
+                NumPy arrays. Defaults to `False`.
+
+        Yields:
+            Union[Dict[str, numpy.ndarray], pyarrow.Table]: The NumPy arrays
+                keyed by column name or the Arrow table of each chunk.
+        """
+
+        self.logger.info(
+            f"Retrieving columns {[column.key for column in columns]} as "
+            f"columnar data."
+        )
+
+        selected, names, kinds, enum_classes = prepare_columns(columns)
+
+        statement = sqlalchemy.select(selected)
+        for clause in clauses or []:
+            statement = statement.where(clause)
+        if order_by:
+            statement = statement.order_by(*order_by)
+
+        with self.engine.connect() as connection:
+            result = connection.execution_options(
+                stream_results=True,
+            ).execute(statement)
+
+            while True:
+                rows = result.fetchmany(chunk_size)
+                if not rows:
+                    break
+
+                yield rows_to_columnar(
+                    rows=rows,
+                    names=names,
+                    kinds=kinds,
+                    enum_classes=enum_classes,
+                    do_arrow=do_arrow,
+                )
+
     @staticmethod
     def add_joinedloads(
         query: sqlalchemy.orm.Query,
@@ -316,12 +977,68 @@ class DalFightForBase(DalBase):
 
         return query
 
+    @staticmethod
+    def add_undefer_groups(
+        query: sqlalchemy.orm.Query,
+        orm_class: Type[OrmFightForBase],
+        undefer_groups: Optional[List[str]],
+    ) -> sqlalchemy.orm.Query:
+        """ Adds `undefer_group` directives to an SQLAlchemy query.
+
+        This method loads the wide columns of an ORM class which are deferred
+        under named column groups, e.g., the `descriptions` group of the
+        `Study` class, by injecting calls to the
+        `sqlalchemy.orm.undefer_group` function under the
+        `sqlalchemy.orm.Query.options` method.
+
+        Args:
+            query (sqlalchemy.orm.Query): The SQLAlchemy `Query` object to be
+                modified with `undefer_group` directives.
+            orm_class (OrmBase): The ORM class on which the query is being
+                performed and which should define the deferred column groups
+                under `undefer_groups`.
+            undefer_groups (List[str]): The names of the deferred column
+                groups to be loaded.
+
+        Returns:
+            sqlalchemy.orm.Query: The (possibly) amended query with the
+                undefer-group directives.
+
+        Raises:
+            InvalidArgumentsError: Raised if any of the group names under
+                `undefer_groups` aren't defined under the `orm_class` class.
+        """
+
+        if undefer_groups:
+
+            # Collect the deferred column groups defined under the class.
+            groups = {
+                column_attr.group
+                for column_attr in sqlalchemy.inspect(orm_class).column_attrs
+                if column_attr.group
+            }
+
+            undefers = []
+            for undefer_group in undefer_groups:
+                if undefer_group not in groups:
+                    raise InvalidArgumentsError(
+                        f"Deferred column group '{undefer_group}' not defined "
+                        f"under ORM class '{orm_class.__name__}'."
+                    )
+
+                undefers.append(sqlalchemy.orm.undefer_group(undefer_group))
+
+            query = query.options(*undefers)
+
+        return query
+
     @with_session_scope()
     def get_joined(
         self,
         orm_class: Type[OrmFightForBase],
         pk: int,
         joined_relationships: List[str],
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> Type[OrmFightForBase]:
         """ Retrieves the record object of `orm_class` type through the value of
@@ -335,6 +1052,9 @@ class DalFightForBase(DalBase):
             joined_relationships (List[str]): A list of `orm_class` type
                 relationship attributes to be join-loaded alongside with the
                 `orm_class` record object.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the record,
+                e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the record will be retrieved. Defaults to `None`
                 in which case a new session is automatically created and
@@ -361,6 +1081,12 @@ class DalFightForBase(DalBase):
             joined_relationships=joined_relationships
         )
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         obj = query.one_or_none()
 
         return obj
@@ -462,6 +1188,7 @@ class DalFightForBase(DalBase):
         orm_class: Type[OrmFightForBase],
         attr_name: str,
         attr_value: Any,
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> Type[OrmFightForBase]:
         """Retrieves the record object of `orm_class` type through the value of
@@ -479,6 +1206,9 @@ class DalFightForBase(DalBase):
                 single record.
             attr_value (Any): The attribute value to be used in filtering out a
                 single record.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the record,
+                e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the record will be retrieved. Defaults to `None`
                 in which case a new session is automatically created and
@@ -511,6 +1241,12 @@ class DalFightForBase(DalBase):
         query = session.query(orm_class)
         query = query.filter(getattr(orm_class, attr_name) == attr_value)
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         obj = query.one_or_none()
 
         return obj
@@ -522,6 +1258,7 @@ class DalFightForBase(DalBase):
         attr_name: str,
         attr_values: List[Any],
         do_sort: bool = True,
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> List[Type[OrmBase]]:
         """Retrieves a list of record objects of `orm_class` type through the
@@ -537,6 +1274,9 @@ class DalFightForBase(DalBase):
             do_sort (bool): Whether to sort the returned record objects by the
                 same order the attribute values have. Only applied when the
                 number of objects is the same as the number of attribute values.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the
+                records, e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the records will be retrieved . Defaults to `None`
                 in which case a new session is automatically created and
@@ -567,6 +1307,12 @@ class DalFightForBase(DalBase):
         query = session.query(orm_class)
         query = query.filter(getattr(orm_class, attr_name).in_(attr_values))
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         objs = query.all()
 
         # If sorting has been requested and the number of objects matches the
@@ -586,6 +1332,7 @@ class DalFightForBase(DalBase):
         self,
         orm_class: Type[OrmFightForBase],
         attrs_names_values: Dict[str, Any],
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> Type[OrmFightForBase]:
         """Retrieves the record object of `orm_class` type through attribute
@@ -602,6 +1349,9 @@ class DalFightForBase(DalBase):
                 `OrmBase` implementing the defined attributes.
             attrs_names_values (Dict[str, Any]): A dictionary of attribute
                 name:value pairs to be used in filtering out a single record.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the record,
+                e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the record will be retrieved. Defaults to `None`
                 in which case a new session is automatically created and
@@ -639,6 +1389,12 @@ class DalFightForBase(DalBase):
                 getattr(orm_class, attr_name) == attr_value
             )
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         obj = query.one_or_none()
 
         return obj
@@ -648,6 +1404,7 @@ class DalFightForBase(DalBase):
         self,
         orm_class: Type[OrmFightForBase],
         attrs_names_values: Dict[str, List[Any]],
+        undefer_groups: Optional[List[str]] = None,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> List[Type[OrmBase]]:
         """Retrieves a list of record objects of `orm_class` type through
@@ -659,6 +1416,9 @@ class DalFightForBase(DalBase):
             attrs_names_values (Dict[str, List[Any]]): A dictionary of attribute
                 name:list of values pairs to be used in filtering out the
                 records.
+            undefer_groups (List[str], optional): The names of the deferred
+                column groups of `orm_class` to be loaded alongside the
+                records, e.g., `["descriptions"]`. Defaults to `None`.
             session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
                 through which the records will be retrieved. Defaults to `None`
                 in which case a new session is automatically created and
@@ -708,6 +1468,12 @@ class DalFightForBase(DalBase):
         query = session.query(orm_class)
         query = query.filter(sqlalchemy.tuple_(*attrs).in_(zip(*attr_values)))
 
+        query = self.add_undefer_groups(
+            query=query,
+            orm_class=orm_class,
+            undefer_groups=undefer_groups,
+        )
+
         objs = query.all()
 
         return objs
@@ -766,3 +1532,84 @@ class DalFightForBase(DalBase):
                     continue
 
         return objs_ordered
+
+    def count_iodu_outcomes(
+        self,
+        table_name: str,
+        outcomes: Dict[str, int],
+    ) -> None:
+        """Logs the outcomes of an IODU call and adds them to `iodu_counts`.
+
+        Args:
+            table_name (str): The name of the table the records were IODUed
+                into.
+            outcomes (Dict[str, int]): The number of records per outcome, i.e.,
+                `inserted`, `updated`, and `unchanged`.
+        """
+
+        self.logger.info(
+            f"IODUed `{table_name}` records: " + ", ".join(
+                f"{outcomes.get(outcome, 0)} {outcome}"
+                for outcome in IODU_OUTCOMES
+            ) + "."
+        )
+
+        with self._lock:
+            for outcome, count in outcomes.items():
+                self.iodu_counts[(table_name, outcome)] += count
+
+    def execute_iodu(
+        self,
+        statement: Insert,
+        index_elements: List[str],
+        set_: Dict[str, Any],
+        session: sqlalchemy.orm.Session,
+    ) -> int:
+        """Executes a single-row `INSERT` statement in an IODU manner skipping
+        the update when none of the updated columns would change.
+
+        Skipping no-op updates avoids rewriting the record, and the WAL and
+        dead tuples that come with it, when refreshing unchanged data.
+
+        Args:
+            statement (Insert): The `INSERT` statement without an `ON CONFLICT`
+                clause.
+            index_elements (List[str]): The column keys of the unique
+                constraint the conflict is detected on.
+            set_ (Dict[str, Any]): The values the columns are updated to upon
+                conflict keyed by column key.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the statement will be executed.
+
+        Returns:
+            int: The primary key ID of the inserted, updated, or unchanged
+                record.
+        """
+
+        table = statement.table
+        pk = list(table.primary_key.columns)[0]
+
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_=set_,
+            where=get_distinct_clause(table=table, set_=set_),
+        ).returning(pk, get_is_inserted_column())
+
+        row = session.execute(statement).first()
+
+        if row is None:
+            # No row is returned when the update was skipped in which case the
+            # existing record is retrieved through the conflict columns.
+            query = sqlalchemy.select([pk]).where(sqlalchemy.and_(*[
+                table.c[key] == statement.parameters[key]
+                for key in index_elements
+            ]))
+            obj_id = session.execute(query).scalar()
+            outcome = "unchanged"
+        else:
+            obj_id, is_inserted = row
+            outcome = "inserted" if is_inserted else "updated"
+
+        self.count_iodu_outcomes(table_name=table.name, outcomes={outcome: 1})
+
+        return obj_id
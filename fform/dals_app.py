@@ -135,7 +135,10 @@ class DalApp(DalFightForBase):
                 "age_beg": age_beg,
                 "age_end": age_end,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["search_uuid"],
             set_={
                 "title": title,
@@ -144,23 +147,9 @@ class DalApp(DalFightForBase):
                 "year_end": year_end,
                 "age_beg": age_beg,
                 "age_end": age_end,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        if result.inserted_primary_key:
-            return result.inserted_primary_key
-        else:
-            # noinspection PyTypeChecker
-            obj = self.get_by_attrs(
-                orm_class=Search,
-                attrs_names_values={
-                    "search_uuid": search_uuid,
-                },
-                session=session,
-            )  # type: Search
-            return obj.search_id
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1,15 +1,21 @@
 # coding: utf-8
 
-from typing import Union, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 import datetime
 
+import sqlalchemy
 import sqlalchemy.orm
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.engine.result import ResultProxy
 
 from fform.dal_base import DalFightForBase
 from fform.dal_base import with_session_scope
+from fform.dal_base import with_batch_bisection
+from fform.dal_base import get_distinct_clause
+from fform.dal_base import get_is_inserted_column
+from fform.orm_base import OrmFightForBase
 from fform.orm_ct import Sponsor
 from fform.orm_ct import Keyword
 from fform.orm_ct import Condition
@@ -68,7 +74,14 @@ from fform.orm_ct import StudyType
 from fform.orm_ct import BiospecRetentionType
 from fform.orm_ct import MeshTermType
 from fform.orm_ct import ReferenceType
+from fform.utils import lists_equal_length
 from fform.utils import return_first_item
+from fform.utils import sort_rows_by_keys
+from fform.utils import parse_age_days
+from fform.utils import AGE_UNIT_DAYS
+from fform.utils import AGE_PATTERN
+from fform.excs import InvalidArgumentsError
+from fform.excs import MissingAttributeError
 
 
 class DalClinicalTrials(DalFightForBase):
@@ -124,6 +137,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.agency = agency
         obj.agency_class = agency_class
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         # Upsert the `Sponsor` record.
         statement = insert(
             Sponsor,
@@ -148,6 +164,51 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Sponsor
             return obj.sponsor_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["agencies", "agency_classes"])
+    @with_session_scope()
+    def biodi_sponsors(
+        self,
+        agencies: List[str],
+        agency_classes: List[AgencyClassType],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Sponsor` records in a BIODI manner.
+
+        Args:
+            agencies (list[str]): The sponsor agencies.
+            agency_classes (list[AgencyClassType]): The sponsor agency classes.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Sponsor` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Sponsor` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Sponsor,
+            rows=[
+                {
+                    "agency": agency,
+                    "agency_class": agency_class,
+                } for (
+                    agency,
+                    agency_class,
+                ) in zip(
+                    agencies,
+                    agency_classes,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_keyword(
@@ -175,6 +236,9 @@ class DalClinicalTrials(DalFightForBase):
         obj = Keyword()
         obj.keyword = keyword
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         # Upsert the `Keyword` record.
         statement = insert(
             Keyword,
@@ -198,6 +262,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Keyword
             return obj.keyword_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["keywords"])
+    @with_session_scope()
+    def biodi_keywords(
+        self,
+        keywords: List[str],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Keyword` records in a BIODI manner.
+
+        Args:
+            keywords (list[str]): The keywords.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Keyword` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Keyword` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Keyword,
+            rows=[
+                {
+                    "keyword": keyword,
+                } for keyword in keywords
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_condition(
@@ -225,6 +325,9 @@ class DalClinicalTrials(DalFightForBase):
         obj = Condition()
         obj.condition = condition
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Condition,
             values={
@@ -247,6 +350,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Condition
             return obj.condition_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["conditions"])
+    @with_session_scope()
+    def biodi_conditions(
+        self,
+        conditions: List[str],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Condition` records in a BIODI manner.
+
+        Args:
+            conditions (list[str]): The conditions.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Condition` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Condition` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Condition,
+            rows=[
+                {
+                    "condition": condition,
+                } for condition in conditions
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_facility(
@@ -286,6 +425,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.zip_code = zip_code
         obj.country = country
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Facility,
             values={
@@ -312,6 +454,68 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Facility
             return obj.facility_id
 
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["names", "cities", "states", "zip_codes", "countries"],
+    )
+    @with_session_scope()
+    def biodi_facilities(
+        self,
+        names: List[Union[str, None]],
+        cities: List[Union[str, None]],
+        states: List[Union[str, None]],
+        zip_codes: List[Union[str, None]],
+        countries: List[Union[str, None]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Facility` records in a BIODI manner.
+
+        Args:
+            names (list[str]): The facility names.
+            cities (list[str]): The facility cities.
+            states (list[str]): The facility states.
+            zip_codes (list[str]): The facility ZIP codes.
+            countries (list[str]): The facility countries.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Facility` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Facility` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Facility,
+            rows=[
+                {
+                    "name": name,
+                    "city": city,
+                    "state": state,
+                    "zip_code": zip_code,
+                    "country": country,
+                } for (
+                    name,
+                    city,
+                    state,
+                    zip_code,
+                    country,
+                ) in zip(
+                    names,
+                    cities,
+                    states,
+                    zip_codes,
+                    countries,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodu_facility_canonical(
@@ -419,13 +623,12 @@ class DalClinicalTrials(DalFightForBase):
 
         self.logger.info(f"IODUing `FacilityCanonical` record.")
 
-        # Assemble a PostGIS coordinates point if coordinates have been defined.
-        coordinates = None
-        if coordinate_latitude and coordinate_longitude:
-            coordinates = "SRID=4326;POINT({} {})".format(
-                coordinate_longitude,
-                coordinate_latitude,
-            )
+        # Assemble a PostGIS coordinates point on the server if coordinates
+        # have been defined.
+        coordinates = self._make_point(
+            longitude=coordinate_longitude,
+            latitude=coordinate_latitude,
+        )
 
         obj = FacilityCanonical()
         obj.google_place_id = google_place_id
@@ -434,8 +637,7 @@ class DalClinicalTrials(DalFightForBase):
         obj.url = url
         obj.address = address
         obj.phone_number = phone_number
-        obj.coordinates = coordinates,
-        obj.coordinate_latitude = coordinate_latitude
+        obj.coordinates = coordinates
         obj.country = country
         obj.administrative_area_level_1 = administrative_area_level_1
         obj.administrative_area_level_2 = administrative_area_level_2
@@ -504,7 +706,10 @@ class DalClinicalTrials(DalFightForBase):
                 "street_address": obj.street_address,
                 "street_number": obj.street_number,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["google_place_id"],
             set_={
                 "name": obj.name,
@@ -541,12 +746,69 @@ class DalClinicalTrials(DalFightForBase):
                 "route": obj.route,
                 "street_address": obj.street_address,
                 "street_number": obj.street_number,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["rows"])
+    @with_session_scope()
+    def biodu_facilities_canonical(
+        self,
+        rows: List[Dict[str, Any]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[str, int]:
+        """Creates new `FacilityCanonical` records in a BIODU manner through a
+        single statement keyed on the Google Place ID.
 
-        return result.inserted_primary_key
+        The coordinates are sent as raw longitudes and latitudes and the
+        points are constructed on the server.
+
+        Args:
+            rows (list[dict]): The facilities as `dict` objects keyed by the
+                arguments of the `iodu_facility_canonical` method. Arguments
+                missing from some rows are set to `None` for those rows while
+                arguments missing from all rows are neither inserted nor
+                updated, i.e., existing records keep their values.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            Dict[str, int]: The primary key IDs of the `FacilityCanonical`
+                records keyed by their Google Place ID.
+        """
+
+        self.logger.info(f"BIODUing `FacilityCanonical` records.")
+
+        # Only set the points when any row defines coordinates so that the
+        # points of existing records are otherwise kept.
+        do_points = any(
+            "coordinate_longitude" in row or "coordinate_latitude" in row
+            for row in rows
+        )
+
+        rows_points = []
+        for row in rows:
+            row = dict(row)
+            longitude = row.pop("coordinate_longitude", None)
+            latitude = row.pop("coordinate_latitude", None)
+            if do_points:
+                row["coordinates"] = self._make_point(
+                    longitude=longitude,
+                    latitude=latitude,
+                )
+            rows_points.append(row)
+
+        facility_canonical_ids = self._biodu_by_key(
+            orm_class=FacilityCanonical,
+            rows=rows_points,
+            key="google_place_id",
+            session=session,
+        )
+
+        return facility_canonical_ids
 
     @return_first_item
     @with_session_scope()
@@ -584,6 +846,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.name_last = name_last
         obj.degrees = degrees
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Person,
             values={
@@ -609,6 +874,68 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Person
             return obj.person_id
 
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=[
+            "names_first",
+            "names_middle",
+            "names_last",
+            "person_degrees",
+        ],
+    )
+    @with_session_scope()
+    def biodi_persons(
+        self,
+        names_first: List[Union[str, None]],
+        names_middle: List[Union[str, None]],
+        names_last: List[Union[str, None]],
+        person_degrees: List[Union[str, None]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Person` records in a BIODI manner.
+
+        Args:
+            names_first (list[str]): The first names of the persons.
+            names_middle (list[str]): The middle names of the persons.
+            names_last (list[str]): The last names of the persons.
+            person_degrees (list[str]): The degrees of the persons.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Person` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Person` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Person,
+            rows=[
+                {
+                    "name_first": name_first,
+                    "name_middle": name_middle,
+                    "name_last": name_last,
+                    "degrees": degrees,
+                } for (
+                    name_first,
+                    name_middle,
+                    name_last,
+                    degrees,
+                ) in zip(
+                    names_first,
+                    names_middle,
+                    names_last,
+                    person_degrees,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_contact(
@@ -645,6 +972,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.phone_ext = phone_ext
         obj.email = email
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Contact,
             values={
@@ -670,6 +1000,63 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Contact
             return obj.contact_id
 
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["person_ids", "phones", "phone_exts", "emails"],
+    )
+    @with_session_scope()
+    def biodi_contacts(
+        self,
+        person_ids: List[int],
+        phones: List[Union[str, None]],
+        phone_exts: List[Union[str, None]],
+        emails: List[Union[str, None]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Contact` records in a BIODI manner.
+
+        Args:
+            person_ids (list[int]): The linked `Person` record primary-key IDs.
+            phones (list[str]): The contact phones.
+            phone_exts (list[str]): The contact phone extensions.
+            emails (list[str]): The contact emails.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Contact` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Contact` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Contact,
+            rows=[
+                {
+                    "person_id": person_id,
+                    "phone": phone,
+                    "phone_ext": phone_ext,
+                    "email": email,
+                } for (
+                    person_id,
+                    phone,
+                    phone_ext,
+                    email,
+                ) in zip(
+                    person_ids,
+                    phones,
+                    phone_exts,
+                    emails,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_investigator(
@@ -703,6 +1090,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.role = role
         obj.affiliation = affiliation
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Investigator,
             values={
@@ -727,6 +1117,56 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Investigator
             return obj.investigator_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["person_ids", "roles", "affiliations"])
+    @with_session_scope()
+    def biodi_investigators(
+        self,
+        person_ids: List[int],
+        roles: List[Union[RoleType, None]],
+        affiliations: List[Union[str, None]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Investigator` records in a BIODI manner.
+
+        Args:
+            person_ids (list[int]): The linked `Person` record primary-key IDs.
+            roles (list[RoleType]): The investigator roles.
+            affiliations (list[str]): The investigator affiliations.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Investigator` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Investigator` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Investigator,
+            rows=[
+                {
+                    "person_id": person_id,
+                    "role": role,
+                    "affiliation": affiliation,
+                } for (
+                    person_id,
+                    role,
+                    affiliation,
+                ) in zip(
+                    person_ids,
+                    roles,
+                    affiliations,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodu_location(
@@ -761,6 +1201,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.contact_primary_id = contact_primary_id
         obj.contact_backup_id = contact_backup_id
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Location,
             values={
@@ -770,16 +1213,16 @@ class DalClinicalTrials(DalFightForBase):
                 "contact_backup_id": obj.contact_backup_id,
                 "md5": obj.md5,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["md5"],
             set_={
                 "status": obj.status,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1168,6 +1611,9 @@ class DalClinicalTrials(DalFightForBase):
         obj.name = name
         obj.description = description
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Intervention,
             values={
@@ -1192,6 +1638,58 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Intervention
             return obj.intervention_id
 
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["intervention_types", "names", "descriptions"],
+    )
+    @with_session_scope()
+    def biodi_interventions(
+        self,
+        intervention_types: List[InterventionType],
+        names: List[str],
+        descriptions: List[Union[str, None]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Intervention` records in a BIODI manner.
+
+        Args:
+            intervention_types (list[InterventionType]): The intervention types.
+            names (list[str]): The intervention names.
+            descriptions (list[str]): The intervention descriptions.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Intervention` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Intervention` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Intervention,
+            rows=[
+                {
+                    "intervention_type": intervention_type,
+                    "name": name,
+                    "description": description,
+                } for (
+                    intervention_type,
+                    name,
+                    description,
+                ) in zip(
+                    intervention_types,
+                    names,
+                    descriptions,
+                )
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_alias(
@@ -1219,6 +1717,9 @@ class DalClinicalTrials(DalFightForBase):
         obj = Alias()
         obj.alias = alias
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Alias,
             values={
@@ -1241,6 +1742,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: Alias
             return obj.alias_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["aliases"])
+    @with_session_scope()
+    def biodi_aliases(
+        self,
+        aliases: List[str],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[int]:
+        """Creates new `Alias` records in a BIODI manner.
+
+        Args:
+            aliases (list[str]): The aliases.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            List[int]: The primary key IDs of the `Alias` records in the
+                order of the arguments.
+        """
+
+        self.logger.info(f"BIODIing `Alias` records.")
+
+        obj_ids = self._biodi_by_md5(
+            orm_class=Alias,
+            rows=[
+                {
+                    "alias": alias,
+                } for alias in aliases
+            ],
+            session=session,
+        )
+
+        return obj_ids
+
     @return_first_item
     @with_session_scope()
     def iodi_intervention_alias(
@@ -1396,6 +1933,8 @@ class DalClinicalTrials(DalFightForBase):
         obj.gender_description = gender_description
         obj.minimum_age = minimum_age
         obj.maximum_age = maximum_age
+        obj.minimum_age_days = parse_age_days(minimum_age)
+        obj.maximum_age_days = parse_age_days(maximum_age)
         obj.healthy_volunteers = healthy_volunteers
 
         statement = insert(
@@ -1409,6 +1948,8 @@ class DalClinicalTrials(DalFightForBase):
                 "gender_description": obj.gender_description,
                 "minimum_age": obj.minimum_age,
                 "maximum_age": obj.maximum_age,
+                "minimum_age_days": obj.minimum_age_days,
+                "maximum_age_days": obj.maximum_age_days,
                 "healthy_volunteers": obj.healthy_volunteers,
             }
         )  # type: Insert
@@ -1451,16 +1992,16 @@ class DalClinicalTrials(DalFightForBase):
                 "citation": obj.citation,
                 "pmid": obj.pmid,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["pmid"],
             set_={
                 "citation": obj.citation,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1917,7 +2458,10 @@ class DalClinicalTrials(DalFightForBase):
                 "responsible_party_id": obj.responsible_party_id,
                 "patient_data_id": obj.patient_data_id,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["nct_id"],
             set_={
                 "org_study_id": obj.org_study_id,
@@ -1949,12 +2493,47 @@ class DalClinicalTrials(DalFightForBase):
                 "study_dates_id": obj.study_dates_id,
                 "responsible_party_id": obj.responsible_party_id,
                 "patient_data_id": obj.patient_data_id,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["rows"])
+    @with_session_scope()
+    def biodu_studies(
+        self,
+        rows: List[Dict[str, Any]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[str, int]:
+        """Creates new `Study` records in a BIODU manner through a single
+        statement keyed on the NCT ID.
 
-        return result.inserted_primary_key
+        Args:
+            rows (list[dict]): The studies as `dict` objects keyed by the
+                arguments of the `iodu_study` method. Arguments missing from
+                some rows are set to `None` for those rows while arguments
+                missing from all rows are neither inserted nor updated, i.e.,
+                existing records keep their values.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            Dict[str, int]: The primary key IDs of the `Study` records keyed by
+                their NCT ID.
+        """
+
+        self.logger.info(f"BIODUing `Study` records.")
+
+        study_ids = self._biodu_by_key(
+            orm_class=Study,
+            rows=rows,
+            key="nct_id",
+            session=session,
+        )
+
+        return study_ids
 
     @return_first_item
     @with_session_scope()
@@ -2008,6 +2587,41 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyAlias
             return obj.study_alias_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "alias_ids"])
+    @with_session_scope()
+    def biodi_study_aliases(
+        self,
+        study_ids: List[int],
+        alias_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyAlias` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            alias_ids (list[int]): The linked `Alias` record primary-key IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyAlias` records.")
+
+        self._biodi_links(
+            orm_class=StudyAlias,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "alias_id": alias_id,
+                } for study_id, alias_id in zip(study_ids, alias_ids)
+            ],
+            index_elements=["study_id", "alias_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodu_study_sponsor(
@@ -2047,16 +2661,62 @@ class DalClinicalTrials(DalFightForBase):
                 "sponsor_id": obj.sponsor_id,
                 "type": obj.sponsor_type,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["study_id", "sponsor_id"],
             set_={
                 "type": obj.sponsor_type,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["study_ids", "sponsor_ids", "sponsor_types"],
+    )
+    @with_session_scope()
+    def biodu_study_sponsors(
+        self,
+        study_ids: List[int],
+        sponsor_ids: List[int],
+        sponsor_types: List[SponsorType],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudySponsor` records in a BIODU manner through a
+        single statement.
 
-        return result.inserted_primary_key
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            sponsor_ids (list[int]): The linked `Sponsor` record primary-key
+                IDs.
+            sponsor_types (list[SponsorType]): The sponsor types.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODUing `StudySponsor` records.")
+
+        self._biodi_links(
+            orm_class=StudySponsor,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "sponsor_id": sponsor_id,
+                    "sponsor_type": sponsor_type,
+                } for study_id, sponsor_id, sponsor_type in zip(
+                    study_ids,
+                    sponsor_ids,
+                    sponsor_types,
+                )
+            ],
+            index_elements=["study_id", "sponsor_id"],
+            session=session,
+            update_keys=["type"],
+        )
 
     @return_first_item
     @with_session_scope()
@@ -2097,23 +2757,69 @@ class DalClinicalTrials(DalFightForBase):
                 "protocol_outcome_id": obj.protocol_outcome_id,
                 "type": obj.outcome_type,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["study_id", "protocol_outcome_id"],
             set_={
                 "type": obj.outcome_type,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
-    @return_first_item
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["study_ids", "protocol_outcome_ids", "outcome_types"],
+    )
     @with_session_scope()
-    def iodi_study_condition(
+    def biodu_study_outcomes(
         self,
-        study_id: int,
-        condition_id: int,
+        study_ids: List[int],
+        protocol_outcome_ids: List[int],
+        outcome_types: List[OutcomeType],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyOutcome` records in a BIODU manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            protocol_outcome_ids (list[int]): The linked `ProtocolOutcome`
+                record primary-key IDs.
+            outcome_types (list[OutcomeType]): The outcome types.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODUing `StudyOutcome` records.")
+
+        self._biodi_links(
+            orm_class=StudyOutcome,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "protocol_outcome_id": protocol_outcome_id,
+                    "outcome_type": outcome_type,
+                } for study_id, protocol_outcome_id, outcome_type in zip(
+                    study_ids,
+                    protocol_outcome_ids,
+                    outcome_types,
+                )
+            ],
+            index_elements=["study_id", "protocol_outcome_id"],
+            session=session,
+            update_keys=["type"],
+        )
+
+    @return_first_item
+    @with_session_scope()
+    def iodi_study_condition(
+        self,
+        study_id: int,
+        condition_id: int,
         session: Optional[sqlalchemy.orm.Session] = None,
     ) -> int:
         """Creates a new `StudyCondition` record in an IODI manner.
@@ -2160,6 +2866,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyCondition
             return obj.study_condition_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "condition_ids"])
+    @with_session_scope()
+    def biodi_study_conditions(
+        self,
+        study_ids: List[int],
+        condition_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyCondition` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            condition_ids (list[int]): The linked `Condition` record primary-key
+                IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyCondition` records.")
+
+        self._biodi_links(
+            orm_class=StudyCondition,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "condition_id": condition_id,
+                } for study_id, condition_id in zip(study_ids, condition_ids)
+            ],
+            index_elements=["study_id", "condition_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodi_study_arm_group(
@@ -2212,6 +2954,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyArmGroup
             return obj.study_arm_group_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "arm_group_ids"])
+    @with_session_scope()
+    def biodi_study_arm_groups(
+        self,
+        study_ids: List[int],
+        arm_group_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyArmGroup` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            arm_group_ids (list[int]): The linked `ArmGroup` record primary-key
+                IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyArmGroup` records.")
+
+        self._biodi_links(
+            orm_class=StudyArmGroup,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "arm_group_id": arm_group_id,
+                } for study_id, arm_group_id in zip(study_ids, arm_group_ids)
+            ],
+            index_elements=["study_id", "arm_group_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodi_study_intervention(
@@ -2265,6 +3043,45 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyIntervention
             return obj.study_intervention_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "intervention_ids"])
+    @with_session_scope()
+    def biodi_study_interventions(
+        self,
+        study_ids: List[int],
+        intervention_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyIntervention` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            intervention_ids (list[int]): The linked `Intervention` record
+                primary-key IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyIntervention` records.")
+
+        self._biodi_links(
+            orm_class=StudyIntervention,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "intervention_id": intervention_id,
+                } for study_id, intervention_id in zip(
+                    study_ids,
+                    intervention_ids,
+                )
+            ],
+            index_elements=["study_id", "intervention_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodi_study_investigator(
@@ -2318,6 +3135,45 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyInvestigator
             return obj.study_investigator_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "investigator_ids"])
+    @with_session_scope()
+    def biodi_study_investigators(
+        self,
+        study_ids: List[int],
+        investigator_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyInvestigator` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            investigator_ids (list[int]): The linked `Investigator` record
+                primary-key IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyInvestigator` records.")
+
+        self._biodi_links(
+            orm_class=StudyInvestigator,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "investigator_id": investigator_id,
+                } for study_id, investigator_id in zip(
+                    study_ids,
+                    investigator_ids,
+                )
+            ],
+            index_elements=["study_id", "investigator_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodi_study_location(
@@ -2370,6 +3226,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyLocation
             return obj.study_location_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "location_ids"])
+    @with_session_scope()
+    def biodi_study_locations(
+        self,
+        study_ids: List[int],
+        location_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyLocation` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            location_ids (list[int]): The linked `Location` record primary-key
+                IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyLocation` records.")
+
+        self._biodi_links(
+            orm_class=StudyLocation,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "location_id": location_id,
+                } for study_id, location_id in zip(study_ids, location_ids)
+            ],
+            index_elements=["study_id", "location_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodu_study_reference(
@@ -2408,16 +3300,62 @@ class DalClinicalTrials(DalFightForBase):
                 "reference_id": obj.reference_id,
                 "type": obj.reference_type,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["study_id", "reference_id"],
             set_={
                 "type": obj.reference_type,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["study_ids", "reference_ids", "reference_types"],
+    )
+    @with_session_scope()
+    def biodu_study_references(
+        self,
+        study_ids: List[int],
+        reference_ids: List[int],
+        reference_types: List[ReferenceType],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyReference` records in a BIODU manner through a
+        single statement.
 
-        return result.inserted_primary_key
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            reference_ids (list[int]): The linked `Reference` record primary-key
+                IDs.
+            reference_types (list[ReferenceType]): The reference types.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODUing `StudyReference` records.")
+
+        self._biodi_links(
+            orm_class=StudyReference,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "reference_id": reference_id,
+                    "reference_type": reference_type,
+                } for study_id, reference_id, reference_type in zip(
+                    study_ids,
+                    reference_ids,
+                    reference_types,
+                )
+            ],
+            index_elements=["study_id", "reference_id"],
+            session=session,
+            update_keys=["type"],
+        )
 
     @return_first_item
     @with_session_scope()
@@ -2471,6 +3409,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyKeyword
             return obj.study_keyword_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "keyword_ids"])
+    @with_session_scope()
+    def biodi_study_keywords(
+        self,
+        study_ids: List[int],
+        keyword_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyKeyword` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            keyword_ids (list[int]): The linked `Keyword` record primary-key
+                IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyKeyword` records.")
+
+        self._biodi_links(
+            orm_class=StudyKeyword,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "keyword_id": keyword_id,
+                } for study_id, keyword_id in zip(study_ids, keyword_ids)
+            ],
+            index_elements=["study_id", "keyword_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodu_study_descriptor(
@@ -2509,16 +3483,62 @@ class DalClinicalTrials(DalFightForBase):
                 "descriptor_id": obj.descriptor_id,
                 "type": obj.study_descriptor_type,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["study_id", "descriptor_id"],
             set_={
                 "type": obj.study_descriptor_type,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["study_ids", "descriptor_ids", "study_descriptor_types"],
+    )
+    @with_session_scope()
+    def biodu_study_descriptors(
+        self,
+        study_ids: List[int],
+        descriptor_ids: List[int],
+        study_descriptor_types: List[MeshTermType],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyDescriptor` records in a BIODU manner through a
+        single statement.
 
-        return result.inserted_primary_key
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            descriptor_ids (list[int]): The linked `Descriptor` record primary-
+                key IDs.
+            study_descriptor_types (list[MeshTermType]): The mesh-term types.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODUing `StudyDescriptor` records.")
+
+        self._biodi_links(
+            orm_class=StudyDescriptor,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "descriptor_id": descriptor_id,
+                    "study_descriptor_type": study_descriptor_type,
+                } for study_id, descriptor_id, study_descriptor_type in zip(
+                    study_ids,
+                    descriptor_ids,
+                    study_descriptor_types,
+                )
+            ],
+            index_elements=["study_id", "descriptor_id"],
+            session=session,
+            update_keys=["type"],
+        )
 
     @return_first_item
     @with_session_scope()
@@ -2572,6 +3592,42 @@ class DalClinicalTrials(DalFightForBase):
             )  # type: StudyStudyDoc
             return obj.study_study_doc_id
 
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "study_doc_ids"])
+    @with_session_scope()
+    def biodi_study_study_docs(
+        self,
+        study_ids: List[int],
+        study_doc_ids: List[int],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyStudyDoc` records in a BIODI manner through a
+        single statement.
+
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            study_doc_ids (list[int]): The linked `StudyDoc` record primary-key
+                IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODIing `StudyStudyDoc` records.")
+
+        self._biodi_links(
+            orm_class=StudyStudyDoc,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "study_doc_id": study_doc_id,
+                } for study_id, study_doc_id in zip(study_ids, study_doc_ids)
+            ],
+            index_elements=["study_id", "study_doc_id"],
+            session=session,
+        )
+
     @return_first_item
     @with_session_scope()
     def iodu_study_facility(
@@ -2611,16 +3667,63 @@ class DalClinicalTrials(DalFightForBase):
                 "facility_id": obj.facility_id,
                 "facility_canonical_id": obj.facility_canonical_id,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["study_id", "facility_id"],
             set_={
                 "facility_canonical_id": obj.facility_canonical_id,
-            }
-        )  # type: Insert
+            },
+            session=session,
+        )
 
-        result = session.execute(statement)  # type: ResultProxy
+    @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["study_ids", "facility_ids", "facility_canonical_ids"],
+    )
+    @with_session_scope()
+    def biodu_study_facilities(
+        self,
+        study_ids: List[int],
+        facility_ids: List[int],
+        facility_canonical_ids: List[Optional[int]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Creates new `StudyFacility` records in a BIODU manner through a
+        single statement.
 
-        return result.inserted_primary_key
+        Args:
+            study_ids (list[int]): The linked `Study` record primary-key IDs.
+            facility_ids (list[int]): The linked `Facility` record primary-key
+                IDs.
+            facility_canonical_ids (list[int]): The linked `FacilityCanonical`
+                record primary-key IDs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+        """
+
+        self.logger.info(f"BIODUing `StudyFacility` records.")
+
+        self._biodi_links(
+            orm_class=StudyFacility,
+            rows=[
+                {
+                    "study_id": study_id,
+                    "facility_id": facility_id,
+                    "facility_canonical_id": facility_canonical_id,
+                } for study_id, facility_id, facility_canonical_id in zip(
+                    study_ids,
+                    facility_ids,
+                    facility_canonical_ids,
+                )
+            ],
+            index_elements=["study_id", "facility_id"],
+            session=session,
+            update_keys=["facility_canonical_id"],
+        )
 
     @return_first_item
     @with_session_scope()
@@ -2661,3 +3764,2060 @@ class DalClinicalTrials(DalFightForBase):
         result = session.execute(statement)  # type: ResultProxy
 
         return result.inserted_primary_key
+
+    @lists_equal_length
+    @with_batch_bisection(batch_args=["study_ids", "new_ids"])
+    @with_session_scope()
+    def sync_study_links(
+        self,
+        orm_class: Type[OrmFightForBase],
+        study_ids: List[int],
+        new_ids: List[List[Any]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> None:
+        """Replaces the association records of a batch of studies with new
+        sets of linked records, e.g., the `StudyKeyword` records of re-ingested
+        studies, through one `DELETE` and one `INSERT` statement.
+
+        The set differences are computed on the server so that links which no
+        longer apply are deleted, missing links are inserted, and unchanged
+        links are left untouched. Only the association records are deleted,
+        i.e., linked records, e.g., the `ArmGroup` records of `StudyArmGroup`
+        associations, are kept even when no study references them anymore.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class, e.g.,
+                `StudyKeyword`, `StudyCondition`, `StudyLocation`, or
+                `StudySecondaryId`. The class may only define the `study_id`
+                and linked record columns besides its primary-key.
+            study_ids (list[int]): The `Study` record primary-key IDs whose
+                associations will be replaced.
+            new_ids (list[list]): The new linked record IDs of each study under
+                `study_ids`, e.g., `Keyword` record primary-key IDs. Studies
+                with an empty list are stripped of all their associations.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Raises:
+            InvalidArgumentsError: Raised when the association class defines
+                additional columns, e.g., the `type` of `StudySponsor`, which
+                cannot be populated by this method.
+        """
+
+        self.logger.info(f"Syncing `{orm_class.__name__}` records.")
+
+        link_key = self._get_study_link_key(orm_class=orm_class)
+
+        pairs = [
+            (study_id, new_id)
+            for study_id, ids in zip(study_ids, new_ids)
+            for new_id in ids
+        ]
+
+        num_deleted = self._delete_study_links_stale(
+            orm_class=orm_class,
+            link_key=link_key,
+            study_ids=study_ids,
+            pairs=pairs,
+            session=session,
+        )
+        num_inserted = self._insert_study_links_missing(
+            orm_class=orm_class,
+            link_key=link_key,
+            pairs=pairs,
+            session=session,
+        )
+
+        self.logger.info(
+            f"Synced `{orm_class.__name__}` records: {num_deleted} deleted, "
+            f"{num_inserted} inserted."
+        )
+
+    @with_session_scope()
+    def find_studies_near(
+        self,
+        longitude: float,
+        latitude: float,
+        radius_km: float,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[Tuple[int, float]]:
+        """Retrieves the studies with a canonical facility within a radius of
+        a point ordered by the distance of their nearest such facility.
+
+        Note:
+            The search is performed through the GiST index on the
+            `FacilityCanonical.coordinates` cast to `geography`.
+
+        Args:
+            longitude (float): The longitude of the point in degrees.
+            latitude (float): The latitude of the point in degrees.
+            radius_km (float): The search radius in kilometers.
+            filters (Dict[str, Any], optional): `Study` attribute name:value
+                pairs the studies must match, e.g.,
+                `{"overall_status": OverallStatusType.RECRUITING}`. List values
+                match any of their items. Defaults to `None`.
+            limit (int, optional): The maximum number of studies to be
+                returned. Defaults to `None` in which case all studies within
+                the radius are returned.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be retrieved. Defaults to `None`
+                in which case a new session is automatically created and
+                terminated upon completion.
+
+        Returns:
+            List[Tuple[int, float]]: The `Study` record primary-key IDs and
+                the distance of their nearest facility in kilometers.
+
+        Raises:
+            MissingAttributeError: Raised when the `Study` class does not
+                define any of the `filters` attributes (keys).
+        """
+
+        self.logger.info(
+            f"Retrieving `Study` records within {radius_km} km of "
+            f"({longitude}, {latitude})."
+        )
+
+        coordinates = sqlalchemy.func.geography(FacilityCanonical.coordinates)
+        point = self._make_point_geography(
+            longitude=longitude,
+            latitude=latitude,
+        )
+
+        distance = sqlalchemy.func.min(
+            sqlalchemy.func.ST_Distance(coordinates, point)
+        ).label("distance")
+
+        query = session.query(StudyFacility.study_id, distance)
+        query = query.join(
+            FacilityCanonical,
+            StudyFacility.facility_canonical_id ==
+            FacilityCanonical.facility_canonical_id,
+        )
+        query = query.filter(
+            sqlalchemy.func.ST_DWithin(coordinates, point, radius_km * 1000.0)
+        )
+
+        # Only join the `Study` records when they need to be filtered.
+        if filters:
+            query = query.join(Study, StudyFacility.study_id == Study.study_id)
+            query = query.filter(
+                *self._get_filter_clauses(orm_class=Study, filters=filters)
+            )
+
+        query = query.group_by(StudyFacility.study_id)
+        query = query.order_by(distance, StudyFacility.study_id)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [
+            (study_id, distance_m / 1000.0) for study_id, distance_m in query
+        ]
+
+    @with_session_scope()
+    def find_facilities_canonical_nearest(
+        self,
+        longitude: float,
+        latitude: float,
+        limit: int = 10,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> List[Tuple[int, float]]:
+        """Retrieves the canonical facilities nearest to a point through a
+        k-nearest-neighbour search.
+
+        Note:
+            The facilities are ordered through the `<->` distance operator
+            which is resolved through the GiST index on the
+            `FacilityCanonical.coordinates` cast to `geography` without
+            computing the distance of every facility.
+
+        Args:
+            longitude (float): The longitude of the point in degrees.
+            latitude (float): The latitude of the point in degrees.
+            limit (int, optional): The number of facilities to be returned.
+                Defaults to `10`.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be retrieved. Defaults to `None`
+                in which case a new session is automatically created and
+                terminated upon completion.
+
+        Returns:
+            List[Tuple[int, float]]: The `FacilityCanonical` record primary-key
+                IDs and their distance in kilometers ordered by distance.
+        """
+
+        self.logger.info(
+            f"Retrieving {limit} `FacilityCanonical` records nearest to "
+            f"({longitude}, {latitude})."
+        )
+
+        coordinates = sqlalchemy.func.geography(FacilityCanonical.coordinates)
+        point = self._make_point_geography(
+            longitude=longitude,
+            latitude=latitude,
+        )
+
+        distance = coordinates.op("<->")(point)
+
+        query = session.query(
+            FacilityCanonical.facility_canonical_id,
+            distance.label("distance"),
+        )
+        query = query.filter(FacilityCanonical.coordinates.isnot(None))
+        query = query.order_by(distance)
+        query = query.limit(limit)
+
+        return [
+            (facility_canonical_id, distance_m / 1000.0)
+            for facility_canonical_id, distance_m in query
+        ]
+
+    @with_session_scope()
+    def search_studies(
+        self,
+        descriptor_ids: Optional[List[int]] = None,
+        gender: Optional[GenderType] = None,
+        year_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        age_range: Optional[Tuple[Optional[int], Optional[int]]] = None,
+        overall_statuses: Optional[List[OverallStatusType]] = None,
+        phases: Optional[List[PhaseType]] = None,
+        limit: int = 100,
+        cursor: Optional[int] = None,
+        do_count: bool = True,
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Tuple[List[int], Optional[int]]:
+        """Searches for studies matching the parameters of an app `Search`
+        record paginating the results by study ID.
+
+        Args:
+            descriptor_ids (List[int], optional): The MeSH `Descriptor` record
+                primary-key IDs the studies must be tagged with any of.
+                Defaults to `None`.
+            gender (GenderType, optional): The gender of the patient. Studies
+                open to the gender or to all genders are matched. Defaults to
+                `None`.
+            year_range (Tuple[int, int], optional): The first and last year the
+                studies must have started in. Either bound may be `None`.
+                Defaults to `None`.
+            age_range (Tuple[int, int], optional): The youngest and oldest age
+                of the patient in years. Studies whose eligible ages overlap
+                the range are matched. Either bound may be `None`. Defaults to
+                `None`.
+            overall_statuses (List[OverallStatusType], optional): The overall
+                statuses the studies must be in any of. Defaults to `None`.
+            phases (List[PhaseType], optional): The phases the studies must be
+                in any of. Defaults to `None`.
+            limit (int, optional): The maximum number of study IDs returned.
+                Defaults to `100`.
+            cursor (int, optional): The last study ID of the previous page.
+                Defaults to `None` in which case the first page is returned.
+            do_count (bool, optional): Whether to count the studies matching
+                the search across all pages. Defaults to `True`.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be retrieved. Defaults to `None`
+                in which case a new session is automatically created and
+                terminated upon completion.
+
+        Returns:
+            Tuple[List[int], Optional[int]]:
+                - The matching `Study` record primary-key IDs in ascending
+                    order. The last ID is the `cursor` of the next page.
+                - The number of matching studies across all pages or `None` if
+                    `do_count` is `False`.
+        """
+
+        self.logger.info(f"Searching `Study` records.")
+
+        query = session.query(Study.study_id)
+
+        if descriptor_ids:
+            # Filter through a semi-join so that studies tagged with several of
+            # the descriptors are not duplicated.
+            query = query.filter(
+                sqlalchemy.exists().where(
+                    sqlalchemy.and_(
+                        StudyDescriptor.study_id == Study.study_id,
+                        StudyDescriptor.descriptor_id.in_(descriptor_ids),
+                    )
+                )
+            )
+
+        if (gender not in [None, GenderType.ALL]) or age_range:
+            query = query.join(
+                Eligibility,
+                Study.eligibility_id == Eligibility.eligibility_id,
+            )
+
+        if gender not in [None, GenderType.ALL]:
+            query = query.filter(
+                Eligibility.gender.in_([gender, GenderType.ALL])
+            )
+
+        if age_range:
+            age_beg, age_end = age_range
+            query = query.filter(
+                *self.get_eligibility_age_clauses(
+                    age_beg_days=(
+                        None if age_beg is None
+                        else int(age_beg * AGE_UNIT_DAYS["year"])
+                    ),
+                    age_end_days=(
+                        None if age_end is None
+                        else int(age_end * AGE_UNIT_DAYS["year"])
+                    ),
+                )
+            )
+
+        if year_range:
+            year_beg, year_end = year_range
+            if year_beg is not None:
+                query = query.filter(
+                    Study.start_date >= datetime.date(year_beg, 1, 1)
+                )
+            if year_end is not None:
+                query = query.filter(
+                    Study.start_date < datetime.date(year_end + 1, 1, 1)
+                )
+
+        if overall_statuses:
+            query = query.filter(Study.overall_status.in_(overall_statuses))
+
+        if phases:
+            query = query.filter(Study.phase.in_(phases))
+
+        count = query.count() if do_count else None
+
+        # Paginate through the study ID which, unlike an offset, retrieves
+        # each page through the index in constant time.
+        if cursor is not None:
+            query = query.filter(Study.study_id > cursor)
+        query = query.order_by(Study.study_id).limit(limit)
+
+        study_ids = [study_id for study_id, in query]
+
+        return study_ids, count
+
+    @staticmethod
+    def _get_age_days_expression(
+        column: sqlalchemy.Column,
+    ) -> sqlalchemy.sql.ColumnElement:
+        """Returns an expression converting a free-text eligibility age, e.g.,
+        `18 Years` or `6 Months`, into days on the server in the same manner
+        as the `parse_age_days` function.
+
+        Args:
+            column (sqlalchemy.Column): The `Eligibility.minimum_age` or
+                `Eligibility.maximum_age` column.
+
+        Returns:
+            sqlalchemy.sql.ColumnElement: The age in days or `NULL` for ages
+                that define no limit, e.g., `N/A`, or cannot be parsed.
+        """
+
+        match = sqlalchemy.func.regexp_match(
+            column,
+            AGE_PATTERN,
+            type_=ARRAY(sqlalchemy.types.Unicode()),
+        )
+        number = sqlalchemy.cast(match[1], sqlalchemy.types.Float())
+        unit = sqlalchemy.func.rtrim(sqlalchemy.func.lower(match[2]), "s")
+
+        return sqlalchemy.cast(
+            sqlalchemy.func.floor(
+                number * sqlalchemy.case(value=unit, whens=AGE_UNIT_DAYS)
+            ),
+            sqlalchemy.types.Integer(),
+        )
+
+    @staticmethod
+    def get_eligibility_age_clauses(
+        age_beg_days: Optional[int],
+        age_end_days: Optional[int],
+    ) -> List[sqlalchemy.sql.ClauseElement]:
+        """Returns the clauses matching the `Eligibility` records whose age
+        range overlaps an age range in days. Undefined minimum and maximum
+        ages are treated as unbounded.
+
+        Args:
+            age_beg_days (int): The youngest age in days or `None`.
+            age_end_days (int): The oldest age in days or `None`.
+
+        Returns:
+            List[sqlalchemy.sql.ClauseElement]: The filter clauses.
+        """
+
+        clauses = []
+        if age_end_days is not None:
+            clauses.append(
+                sqlalchemy.or_(
+                    Eligibility.minimum_age_days.is_(None),
+                    Eligibility.minimum_age_days <= age_end_days,
+                )
+            )
+        if age_beg_days is not None:
+            clauses.append(
+                sqlalchemy.or_(
+                    Eligibility.maximum_age_days.is_(None),
+                    Eligibility.maximum_age_days >= age_beg_days,
+                )
+            )
+
+        return clauses
+
+    def backfill_eligibility_ages(self, batch_size: int = 10000) -> int:
+        """Populates the `minimum_age_days` and `maximum_age_days` columns of
+        the existing `Eligibility` records from their free-text ages. Each
+        batch of primary-key IDs is updated in its own transaction so that
+        the backfill can run against a live database.
+
+        Args:
+            batch_size (int, optional): The number of primary-key IDs updated
+                per transaction. Defaults to `10000`.
+
+        Returns:
+            int: The number of updated `Eligibility` records.
+        """
+
+        self.logger.info(f"Backfilling `Eligibility` record ages in days.")
+
+        with self.session_scope() as session:
+            eligibility_id_max = session.query(
+                sqlalchemy.func.max(Eligibility.eligibility_id)
+            ).scalar()
+
+        if eligibility_id_max is None:
+            return 0
+
+        count = 0
+        for eligibility_id_beg in range(1, eligibility_id_max + 1, batch_size):
+            statement = sqlalchemy.update(Eligibility).where(
+                Eligibility.eligibility_id.between(
+                    eligibility_id_beg,
+                    eligibility_id_beg + batch_size - 1,
+                )
+            ).values(
+                minimum_age_days=self._get_age_days_expression(
+                    Eligibility.minimum_age
+                ),
+                maximum_age_days=self._get_age_days_expression(
+                    Eligibility.maximum_age
+                ),
+            )
+            with self.session_scope() as session:
+                result = session.execute(statement)  # type: ResultProxy
+                count += result.rowcount
+
+        return count
+
+    @staticmethod
+    def _make_point(
+        longitude: Optional[float],
+        latitude: Optional[float],
+    ) -> Optional[sqlalchemy.sql.ColumnElement]:
+        """Returns an expression constructing a `geometry` point with an SRID
+        of 4326 on the server.
+
+        Args:
+            longitude (float): The longitude of the point in degrees.
+            latitude (float): The latitude of the point in degrees.
+
+        Returns:
+            sqlalchemy.sql.ColumnElement: The point expression or `None` if
+                either coordinate is undefined.
+        """
+
+        if longitude is None or latitude is None:
+            return None
+
+        return sqlalchemy.func.ST_SetSRID(
+            sqlalchemy.func.ST_MakePoint(longitude, latitude),
+            4326,
+        )
+
+    def _make_point_geography(
+        self,
+        longitude: float,
+        latitude: float,
+    ) -> sqlalchemy.sql.ColumnElement:
+        """Returns an expression constructing a `geography` point on the
+        server.
+
+        Args:
+            longitude (float): The longitude of the point in degrees.
+            latitude (float): The latitude of the point in degrees.
+
+        Returns:
+            sqlalchemy.sql.ColumnElement: The point expression.
+        """
+
+        return sqlalchemy.func.geography(
+            self._make_point(longitude=longitude, latitude=latitude)
+        )
+
+    def _get_filter_clauses(
+        self,
+        orm_class: Type[OrmFightForBase],
+        filters: Dict[str, Any],
+    ) -> List[sqlalchemy.sql.ClauseElement]:
+        """Returns the clauses filtering the records of `orm_class` type by
+        attribute name:value pairs where list values match any of their items.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            filters (Dict[str, Any]): The attribute name:value pairs.
+
+        Returns:
+            List[sqlalchemy.sql.ClauseElement]: The filter clauses.
+
+        Raises:
+            MissingAttributeError: Raised when the `orm_class` does not define
+                any of the `filters` attributes (keys).
+        """
+
+        clauses = []
+        for attr_name, attr_value in filters.items():
+            # Log an error and raise an exception if the `orm_class` does not
+            # define the attribute.
+            if not hasattr(orm_class, attr_name):
+                msg = (f"Class `{orm_class.__name__}` does not define "
+                       f"attribute `{attr_name}`.")
+                self.logger.error(msg)
+                raise MissingAttributeError(msg)
+
+            attr = getattr(orm_class, attr_name)
+            if isinstance(attr_value, (list, tuple, set)):
+                clauses.append(attr.in_(list(attr_value)))
+            else:
+                clauses.append(attr == attr_value)
+
+        return clauses
+
+    @staticmethod
+    def _get_study_link_key(orm_class: Type[OrmFightForBase]) -> str:
+        """Returns the column key of the linked record of an association class
+        which may only define the `study_id` and linked record columns besides
+        its primary-key.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+
+        Returns:
+            str: The column key of the linked record, e.g., `keyword_id`.
+
+        Raises:
+            InvalidArgumentsError: Raised when the association class does not
+                define a single column besides the `study_id` and primary-key
+                columns.
+        """
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+
+        keys = [
+            column.key for column in table.columns
+            if not column.primary_key and column.key != "study_id"
+        ]
+
+        if "study_id" not in table.c or len(keys) != 1:
+            msg = (f"The associations of class `{orm_class.__name__}` cannot "
+                   f"be synced as it does not link studies to a single record.")
+            raise InvalidArgumentsError(msg)
+
+        return keys[0]
+
+    @staticmethod
+    def _select_study_links_new(
+        orm_class: Type[OrmFightForBase],
+        link_key: str,
+        pairs: List[Tuple[int, Any]],
+    ) -> sqlalchemy.sql.Alias:
+        """Returns a subquery unnesting the `(study_id, link_key)` pairs sent
+        as two array parameters.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+            link_key (str): The column key of the linked record.
+            pairs (List[Tuple[int, Any]]): The new `(study_id, link_key)`
+                pairs.
+
+        Returns:
+            sqlalchemy.sql.Alias: The `links_new` subquery with `study_id` and
+                `link_key` columns.
+        """
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+
+        # Deduplicate and sort the pairs.
+        pairs = sorted(set(pairs))
+
+        columns = []
+        values_by_key = list(zip(*pairs)) or [(), ()]
+        for key, values in zip(["study_id", link_key], values_by_key):
+            array = sqlalchemy.literal(
+                list(values),
+                type_=ARRAY(table.c[key].type),
+            )
+            columns.append(sqlalchemy.func.unnest(array).label(key))
+
+        return sqlalchemy.select(columns).alias("links_new")
+
+    def _delete_study_links_stale(
+        self,
+        orm_class: Type[OrmFightForBase],
+        link_key: str,
+        study_ids: List[int],
+        pairs: List[Tuple[int, Any]],
+        session: sqlalchemy.orm.Session,
+    ) -> int:
+        """Deletes the association records of the given studies which are not
+        among the new `(study_id, link_key)` pairs through a single statement.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+            link_key (str): The column key of the linked record.
+            study_ids (List[int]): The `Study` record primary-key IDs whose
+                stale associations will be deleted.
+            pairs (List[Tuple[int, Any]]): The new `(study_id, link_key)`
+                pairs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be deleted.
+
+        Returns:
+            int: The number of deleted records.
+        """
+
+        if not study_ids:
+            return 0
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+        links_new = self._select_study_links_new(
+            orm_class=orm_class,
+            link_key=link_key,
+            pairs=pairs,
+        )
+
+        statement = table.delete().where(
+            sqlalchemy.and_(
+                table.c.study_id.in_(sorted(set(study_ids))),
+                ~sqlalchemy.exists().where(
+                    sqlalchemy.and_(
+                        links_new.c.study_id == table.c.study_id,
+                        links_new.c[link_key] == table.c[link_key],
+                    )
+                ),
+            )
+        )
+
+        result = session.execute(statement)  # type: ResultProxy
+
+        return result.rowcount
+
+    def _insert_study_links_missing(
+        self,
+        orm_class: Type[OrmFightForBase],
+        link_key: str,
+        pairs: List[Tuple[int, Any]],
+        session: sqlalchemy.orm.Session,
+    ) -> int:
+        """Inserts the `(study_id, link_key)` pairs which have no association
+        record yet through a single statement.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+            link_key (str): The column key of the linked record.
+            pairs (List[Tuple[int, Any]]): The new `(study_id, link_key)`
+                pairs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+
+        Returns:
+            int: The number of inserted records.
+        """
+
+        if not pairs:
+            return 0
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+        links_new = self._select_study_links_new(
+            orm_class=orm_class,
+            link_key=link_key,
+            pairs=pairs,
+        )
+
+        query = sqlalchemy.select(
+            [links_new.c.study_id, links_new.c[link_key]]
+        ).where(
+            ~sqlalchemy.exists().where(
+                sqlalchemy.and_(
+                    table.c.study_id == links_new.c.study_id,
+                    table.c[link_key] == links_new.c[link_key],
+                )
+            )
+        )
+
+        statement = insert(table).from_select(
+            ["study_id", link_key],
+            query,
+        ).on_conflict_do_nothing()  # type: Insert
+
+        result = session.execute(statement)  # type: ResultProxy
+
+        return result.rowcount
+
+    @staticmethod
+    def _on_conflict_do_update(
+        statement: Insert,
+        index_elements: List[str],
+        update_keys: List[str],
+    ) -> Insert:
+        """Adds an `ON CONFLICT DO UPDATE` clause to a multi-row `INSERT`
+        statement which updates the given columns to their excluded values
+        while skipping rows none of whose columns would change.
+
+        Args:
+            statement (Insert): The `INSERT` statement.
+            index_elements (List[str]): The column keys of the unique
+                constraint the conflict is detected on.
+            update_keys (List[str]): The column keys updated upon conflict.
+
+        Returns:
+            Insert: The `INSERT` statement which should return the column of
+                `get_is_inserted_column` for its outcomes to be counted.
+        """
+
+        set_ = {key: statement.excluded[key] for key in update_keys}
+
+        statement = statement.on_conflict_do_update(
+            index_elements=index_elements,
+            set_=set_,
+            where=get_distinct_clause(table=statement.table, set_=set_),
+        )
+
+        return statement
+
+    def _count_biodu_outcomes(
+        self,
+        table_name: str,
+        rows_returned: List[sqlalchemy.engine.RowProxy],
+        num_rows: int,
+    ) -> None:
+        """Counts the outcomes of a multi-row IODU statement built through
+        `_on_conflict_do_update` out of the rows it returned.
+
+        Args:
+            table_name (str): The name of the table.
+            rows_returned (List[sqlalchemy.engine.RowProxy]): The returned rows.
+            num_rows (int): The number of rows the statement inserted.
+        """
+
+        num_inserted = sum(1 for row in rows_returned if row.is_inserted)
+
+        self.count_iodu_outcomes(
+            table_name=table_name,
+            outcomes={
+                "inserted": num_inserted,
+                "updated": len(rows_returned) - num_inserted,
+                # Rows whose update was skipped are not returned.
+                "unchanged": num_rows - len(rows_returned),
+            },
+        )
+
+    @staticmethod
+    def _prepare_rows(
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Converts rows of attribute-name:value pairs into rows of
+        column-key:value pairs ready to be used in Core statements.
+
+        The values are passed through the attribute validators of the class,
+        e.g., the lowercasing of keywords, and the `md5` hash of the rows is
+        calculated for classes defining `_md5_attrs` so that the rows match
+        the records created through the ORM.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class the rows belong to.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+
+        Returns:
+            List[Dict[str, Any]]: The rows of column-key:value pairs.
+        """
+
+        mapper = sqlalchemy.inspect(orm_class)
+
+        # Pass the values through the attribute validators which do not depend
+        # on the record they're validated for.
+        rows_validated = []
+        for row in rows:
+            row_validated = dict(row)
+            for attr_name, (validator, _) in mapper.validators.items():
+                if attr_name in row_validated:
+                    row_validated[attr_name] = validator(
+                        None,
+                        attr_name,
+                        row_validated[attr_name],
+                    )
+            rows_validated.append(row_validated)
+
+        # Calculate the `md5` hashes of the rows (if required).
+        md5s = None
+        if orm_class._md5_attrs:
+            md5s = orm_class.calculate_md5_batch(
+                rows=rows_validated,
+                do_lowercase=True,
+            )
+
+        # Map the attribute names to the column keys, e.g., `agency_class` to
+        # `class`.
+        column_keys = {
+            attr.key: attr.columns[0].key for attr in mapper.column_attrs
+        }
+
+        # Collect the attributes of all rows as multi-row statements require
+        # the same columns in every row.
+        attr_names = []
+        for row in rows_validated:
+            attr_names.extend(
+                attr_name for attr_name in row if attr_name not in attr_names
+            )
+
+        values = []
+        for idx, row in enumerate(rows_validated):
+            value = {
+                column_keys[attr_name]: row.get(attr_name)
+                for attr_name in attr_names
+            }
+            if md5s is not None:
+                value["md5"] = md5s[idx]
+            values.append(value)
+
+        return values
+
+    def _biodi_by_md5(
+        self,
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+        session: sqlalchemy.orm.Session,
+        update_keys: Optional[List[str]] = None,
+    ) -> List[int]:
+        """Inserts rows of a class defining `_md5_attrs` in an IODI manner, or
+        an IODU manner when `update_keys` are defined, through a single
+        statement and retrieves the primary-key IDs of their records through
+        another.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class defining
+                `_md5_attrs`.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+            update_keys (List[str], optional): The column keys updated upon
+                conflict. Defaults to `None` in which case conflicting rows are
+                skipped.
+
+        Returns:
+            List[int]: The primary-key IDs of the records in the order of
+                `rows`.
+        """
+
+        if not rows:
+            return []
+
+        values = self._prepare_rows(orm_class=orm_class, rows=rows)
+        md5s = [value["md5"] for value in values]
+
+        # Deduplicate the rows by their hash as a row cannot be updated twice
+        # by the same statement.
+        values_unique = list({value["md5"]: value for value in values}.values())
+
+        statement = insert(
+            orm_class,
+            values=sort_rows_by_keys(rows=values_unique, keys=["md5"]),
+        )  # type: Insert
+        if update_keys:
+            statement = self._on_conflict_do_update(
+                statement=statement,
+                index_elements=["md5"],
+                update_keys=update_keys,
+            ).returning(get_is_inserted_column())
+        else:
+            statement = statement.on_conflict_do_nothing()
+
+        result = session.execute(statement)  # type: ResultProxy
+
+        if update_keys:
+            self._count_biodu_outcomes(
+                table_name=orm_class.__tablename__,
+                rows_returned=result.fetchall(),
+                num_rows=len(values_unique),
+            )
+
+        # Retrieve the primary-key IDs of all records, new or existing, by
+        # their hash.
+        table = orm_class.__table__
+        pk = orm_class.get_pk()
+        query = sqlalchemy.select([table.c.md5, pk]).where(
+            table.c.md5.in_(list(set(md5s)))
+        )
+        obj_ids = dict(session.execute(query).fetchall())
+
+        return [obj_ids[md5] for md5 in md5s]
+
+    def _binsert(
+        self,
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+        session: sqlalchemy.orm.Session,
+    ) -> List[int]:
+        """Inserts rows of a class without a natural key through a single
+        statement.
+
+        The primary-key IDs are reserved from the sequence of the primary-key
+        column before the insertion, through another single statement, so
+        that they're aligned to the rows without relying on the order of the
+        `RETURNING` clause.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+
+        Returns:
+            List[int]: The primary-key IDs of the records in the order of
+                `rows`.
+        """
+
+        if not rows:
+            return []
+
+        values = self._prepare_rows(orm_class=orm_class, rows=rows)
+
+        # Reserve a primary-key ID per row.
+        table = orm_class.__table__
+        pk = orm_class.get_pk()
+        sequence_name = sqlalchemy.func.pg_get_serial_sequence(
+            table.fullname,
+            pk.name,
+        )
+        query = sqlalchemy.select(
+            [sqlalchemy.func.nextval(sequence_name)]
+        ).select_from(sqlalchemy.func.generate_series(1, len(values)))
+        obj_ids = [row[0] for row in session.execute(query).fetchall()]
+
+        for value, obj_id in zip(values, obj_ids):
+            value[pk.key] = obj_id
+
+        statement = insert(orm_class, values=values)  # type: Insert
+        session.execute(statement)
+
+        return obj_ids
+
+    def _binsert_reusing(
+        self,
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+        candidate_ids: List[List[int]],
+        session: sqlalchemy.orm.Session,
+    ) -> Tuple[List[int], List[int]]:
+        """Inserts rows of a class without a natural key, e.g., the records
+        linked to a single study, reusing for each row an existing record among
+        its candidates whose columns already hold the row's values. Each
+        candidate is reused at most once.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+            candidate_ids (List[List[int]]): The primary-key IDs of the existing
+                records each row may reuse, e.g., the records the study of the
+                row was linked to before its re-ingestion.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+
+        Returns:
+            Tuple[List[int], List[int]]:
+                - The primary-key IDs of the records in the order of `rows`.
+                - The candidate primary-key IDs which were not reused.
+        """
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+        pk = orm_class.get_pk()
+        columns = [column for column in table.columns if not column.primary_key]
+
+        ids_candidate = sorted({
+            obj_id for obj_ids in candidate_ids for obj_id in obj_ids
+        })
+
+        # Retrieve the column values of the candidate records.
+        records = {}
+        if ids_candidate:
+            query = sqlalchemy.select([pk] + columns).where(
+                pk.in_(ids_candidate)
+            )
+            for record in session.execute(query).fetchall():
+                records[record[0]] = tuple(record[1:])
+
+        values = self._prepare_rows(orm_class=orm_class, rows=rows)
+
+        obj_ids = [None] * len(rows)  # type: List[Optional[int]]
+        ids_reused = set()
+        for idx, (value, obj_ids_candidate) in enumerate(
+            zip(values, candidate_ids)
+        ):
+            record = tuple(value.get(column.key) for column in columns)
+            for obj_id in obj_ids_candidate:
+                if obj_id not in ids_reused and records.get(obj_id) == record:
+                    obj_ids[idx] = obj_id
+                    ids_reused.add(obj_id)
+                    break
+
+        # Insert the rows which reuse no record.
+        idxs_new = [idx for idx, obj_id in enumerate(obj_ids) if obj_id is None]
+        obj_ids_new = self._binsert(
+            orm_class=orm_class,
+            rows=[rows[idx] for idx in idxs_new],
+            session=session,
+        )
+        for idx, obj_id in zip(idxs_new, obj_ids_new):
+            obj_ids[idx] = obj_id
+
+        ids_replaced = [
+            obj_id for obj_id in ids_candidate if obj_id not in ids_reused
+        ]
+
+        return obj_ids, ids_replaced
+
+    @staticmethod
+    def _delete_records_stale(
+        orm_class: Type[OrmFightForBase],
+        parent_key: str,
+        other_key: str,
+        parent_ids: List[int],
+        pairs: List[Tuple[int, Any]],
+        session: sqlalchemy.orm.Session,
+    ) -> Set[Tuple[int, Any]]:
+        """Deletes the records of a class referencing the given parent records
+        whose `(parent_key, other_key)` pair is not among the new pairs, e.g.,
+        the `InterventionArmGroup` records of reused `ArmGroup` records.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            parent_key (str): The column key referencing the parent record,
+                e.g., `arm_group_id`.
+            other_key (str): The column key of the other value of the pairs,
+                e.g., `intervention_id`.
+            parent_ids (List[int]): The primary-key IDs of the parent records.
+            pairs (List[Tuple[int, Any]]): The new `(parent_key, other_key)`
+                pairs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be deleted.
+
+        Returns:
+            Set[Tuple[int, Any]]: The pairs of the records which were kept.
+        """
+
+        if not parent_ids:
+            return set()
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+        pk = orm_class.get_pk()
+
+        query = sqlalchemy.select(
+            [pk, table.c[parent_key], table.c[other_key]]
+        ).where(table.c[parent_key].in_(sorted(set(parent_ids))))
+
+        pairs_new = set(pairs)
+        pairs_kept = set()
+        obj_ids_stale = []
+        for obj_id, parent_id, other in session.execute(query).fetchall():
+            if (parent_id, other) in pairs_new:
+                pairs_kept.add((parent_id, other))
+            else:
+                obj_ids_stale.append(obj_id)
+
+        if obj_ids_stale:
+            session.execute(table.delete().where(pk.in_(obj_ids_stale)))
+
+        return pairs_kept
+
+    @staticmethod
+    def _delete_records_unlinked(
+        orm_class: Type[OrmFightForBase],
+        obj_ids: List[int],
+        link_columns: List[sqlalchemy.Column],
+        session: sqlalchemy.orm.Session,
+        dependent_columns: Optional[List[sqlalchemy.Column]] = None,
+    ) -> int:
+        """Deletes the records among `obj_ids` which are no longer referenced
+        through any of the `link_columns`, e.g., the `ArmGroup` records a
+        re-ingested study was unlinked from, along with the records referencing
+        them through the `dependent_columns`.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            obj_ids (List[int]): The primary-key IDs of the records.
+            link_columns (List[sqlalchemy.Column]): The foreign-key columns
+                linking other records to the records, e.g.,
+                `StudyArmGroup.arm_group_id`.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be deleted.
+            dependent_columns (List[sqlalchemy.Column], optional): The
+                foreign-key columns of records deleted along with the records,
+                e.g., `InterventionArmGroup.arm_group_id`. Defaults to `None`.
+
+        Returns:
+            int: The number of deleted records.
+        """
+
+        if not obj_ids:
+            return 0
+
+        pk = orm_class.get_pk()
+
+        query = sqlalchemy.select([pk]).where(
+            sqlalchemy.and_(
+                pk.in_(sorted(set(obj_ids))),
+                *[
+                    ~sqlalchemy.exists().where(column == pk)
+                    for column in link_columns
+                ]
+            )
+        )
+        ids_unlinked = [row[0] for row in session.execute(query).fetchall()]
+
+        if not ids_unlinked:
+            return 0
+
+        for column in dependent_columns or []:
+            session.execute(
+                column.table.delete().where(column.in_(ids_unlinked))
+            )
+
+        result = session.execute(
+            orm_class.__table__.delete().where(pk.in_(ids_unlinked))
+        )  # type: ResultProxy
+
+        return result.rowcount
+
+    @staticmethod
+    def _select_study_linked_ids(
+        orm_class: Type[OrmFightForBase],
+        link_key: str,
+        study_ids: List[int],
+        session: sqlalchemy.orm.Session,
+        clauses: Optional[List[sqlalchemy.sql.ClauseElement]] = None,
+    ) -> Dict[int, List[int]]:
+        """Retrieves the primary-key IDs of the records linked to studies
+        through an association class.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+            link_key (str): The column key of the linked record.
+            study_ids (List[int]): The `Study` record primary-key IDs.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be retrieved.
+            clauses (List[sqlalchemy.sql.ClauseElement], optional): Additional
+                clauses the associations must match. Defaults to `None`.
+
+        Returns:
+            Dict[int, List[int]]: The primary-key IDs of the linked records in
+                ascending order keyed by study ID.
+        """
+
+        if not study_ids:
+            return {}
+
+        table = orm_class.__table__  # type: sqlalchemy.Table
+
+        query = sqlalchemy.select(
+            [table.c.study_id, table.c[link_key]]
+        ).where(
+            sqlalchemy.and_(
+                table.c.study_id.in_(sorted(set(study_ids))),
+                *(clauses or [])
+            )
+        ).order_by(table.c.study_id, table.c[link_key])
+
+        linked_ids = {}  # type: Dict[int, List[int]]
+        for study_id, linked_id in session.execute(query).fetchall():
+            linked_ids.setdefault(study_id, []).append(linked_id)
+
+        return linked_ids
+
+    def _biodi_links(
+        self,
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+        index_elements: List[str],
+        session: sqlalchemy.orm.Session,
+        update_keys: Optional[List[str]] = None,
+    ) -> None:
+        """Inserts rows of an association class in an IODI manner, or an IODU
+        manner when `update_keys` are defined, through a single statement.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The association ORM class.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+            index_elements (List[str]): The column keys of the unique
+                constraint of the association, e.g.,
+                `["study_id", "keyword_id"]`.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+            update_keys (List[str], optional): The column keys updated upon
+                conflict. Defaults to `None` in which case conflicting rows are
+                skipped.
+        """
+
+        if not rows:
+            return None
+
+        values = self._prepare_rows(orm_class=orm_class, rows=rows)
+
+        # Deduplicate the rows by their unique constraint as a row cannot be
+        # updated twice by the same statement.
+        values_unique = list({
+            tuple(value[key] for key in index_elements): value
+            for value in values
+        }.values())
+
+        statement = insert(
+            orm_class,
+            values=sort_rows_by_keys(rows=values_unique, keys=index_elements),
+        )  # type: Insert
+        if update_keys:
+            statement = self._on_conflict_do_update(
+                statement=statement,
+                index_elements=index_elements,
+                update_keys=update_keys,
+            ).returning(get_is_inserted_column())
+        else:
+            statement = statement.on_conflict_do_nothing()
+
+        result = session.execute(statement)  # type: ResultProxy
+
+        if update_keys:
+            self._count_biodu_outcomes(
+                table_name=orm_class.__tablename__,
+                rows_returned=result.fetchall(),
+                num_rows=len(values_unique),
+            )
+
+    def _biodu_by_key(
+        self,
+        orm_class: Type[OrmFightForBase],
+        rows: List[Dict[str, Any]],
+        key: str,
+        session: sqlalchemy.orm.Session,
+    ) -> Dict[Any, int]:
+        """Upserts rows of a class with a unique natural key through a single
+        statement updating all other columns upon conflict.
+
+        Args:
+            orm_class (Type[OrmFightForBase]): The ORM class.
+            rows (List[Dict[str, Any]]): The rows of attribute-name:value pairs.
+            key (str): The column key of the natural key, e.g., `nct_id`.
+            session (sqlalchemy.orm.Session): The SQLAlchemy session through
+                which the records will be added.
+
+        Returns:
+            Dict[Any, int]: The primary-key IDs of the records keyed by their
+                natural key.
+        """
+
+        if not rows:
+            return {}
+
+        values = self._prepare_rows(orm_class=orm_class, rows=rows)
+
+        # Deduplicate the rows by their natural key as a row cannot be updated
+        # twice by the same statement.
+        values_unique = list({value[key]: value for value in values}.values())
+
+        table = orm_class.__table__
+        pk = orm_class.get_pk()
+
+        statement = insert(
+            orm_class,
+            values=sort_rows_by_keys(rows=values_unique, keys=[key]),
+        )  # type: Insert
+        statement = self._on_conflict_do_update(
+            statement=statement,
+            index_elements=[key],
+            update_keys=[
+                column_key for column_key in values_unique[0].keys()
+                if column_key not in [key, pk.key]
+            ],
+        ).returning(table.c[key], pk, get_is_inserted_column())
+
+        result = session.execute(statement)  # type: ResultProxy
+        rows_returned = result.fetchall()
+
+        self._count_biodu_outcomes(
+            table_name=table.name,
+            rows_returned=rows_returned,
+            num_rows=len(values_unique),
+        )
+
+        obj_ids = {row[0]: row[1] for row in rows_returned}
+
+        # Retrieve the IDs of the unchanged records which are not returned.
+        keys_unchanged = [
+            value[key] for value in values_unique if value[key] not in obj_ids
+        ]
+        if keys_unchanged:
+            query = sqlalchemy.select([table.c[key], pk]).where(
+                table.c[key].in_(keys_unchanged)
+            )
+            obj_ids.update(dict(session.execute(query).fetchall()))
+
+        return obj_ids
+
+    @with_session_scope()
+    def ingest_studies(
+        self,
+        study_graphs: List[Dict[str, Any]],
+        session: Optional[sqlalchemy.orm.Session] = None,
+    ) -> Dict[str, int]:
+        """Ingests the entire graphs of a batch of studies, i.e., the `Study`
+        records and all their linked records, through a fixed number of
+        set-based statements per table executed in dependency order.
+
+        Each study graph is a `dict` whose values mirror the arguments of the
+        per-record methods of this class. Only the `study` and `study_dates`
+        keys are required:
+            - `study`: The arguments of `iodu_study` without the linked
+                primary-key IDs.
+            - `oversight_info`, `expanded_access_info`, `study_design_info`,
+                `enrollment`, `eligibility`, `study_dates`, `responsible_party`:
+                The arguments of the respective `insert_*` methods.
+            - `patient_data`: The arguments of `insert_patient_data` and an
+                `ipd_info_types` list of IPD info types.
+            - `contact_primary`, `contact_backup`: The arguments of
+                `iodi_contact` with a `person` `dict` of `iodi_person`
+                arguments instead of `person_id`.
+            - `sponsors`: The arguments of `iodi_sponsor` and a
+                `sponsor_type`.
+            - `protocol_outcomes`: The arguments of `insert_protocol_outcome`
+                and an `outcome_type`.
+            - `arm_groups`: The arguments of `insert_arm_group`.
+            - `interventions`: The arguments of `iodi_intervention`, an
+                `aliases` list, and an `arm_group_labels` list of the labels of
+                the study's arm groups the intervention belongs to.
+            - `investigators`: The arguments of `iodi_investigator` with a
+                `person` `dict` instead of `person_id`.
+            - `locations`: The `status` of the location, a `facility` `dict`
+                of `iodi_facility` arguments, `contact_primary` and
+                `contact_backup` contact `dict` objects, and an
+                `investigators` list of investigator `dict` objects.
+            - `references`: The arguments of `iodu_reference` and a
+                `reference_type`.
+            - `descriptors`: The `descriptor_id` and `study_descriptor_type` of
+                the linked MeSH descriptors.
+            - `study_docs`: The arguments of `insert_study_doc`.
+            - `aliases`, `conditions`, `keywords`, `secondary_ids`: Lists of
+                values.
+
+        Args:
+            study_graphs (List[Dict[str, Any]]): The study graphs.
+            session (sqlalchemy.orm.Session, optional): An SQLAlchemy session
+                through which the records will be added. Defaults to `None` in
+                which case a new session is automatically created and terminated
+                upon completion.
+
+        Returns:
+            Dict[str, int]: The primary-key IDs of the `Study` records keyed by
+                their NCT ID.
+        """
+
+        self.logger.info(f"Ingesting {len(study_graphs)} `Study` graphs.")
+
+        # Collect the contacts and investigators of the studies and their
+        # locations which are linked to persons.
+        contacts = []
+        investigators = []
+        for graph in study_graphs:
+            for key in ["contact_primary", "contact_backup"]:
+                if graph.get(key):
+                    contacts.append(graph[key])
+            investigators.extend(graph.get("investigators", []))
+            for location in graph.get("locations", []):
+                for key in ["contact_primary", "contact_backup"]:
+                    if location.get(key):
+                        contacts.append(location[key])
+                investigators.extend(location.get("investigators", []))
+
+        # IODI the `Person` records.
+        person_ids = self._biodi_by_md5(
+            orm_class=Person,
+            rows=[item["person"] for item in contacts + investigators],
+            session=session,
+        )
+
+        # IODI the `Contact` and `Investigator` records keyed by the identity
+        # of their `dict` in the graphs.
+        contact_ids = dict(zip(
+            map(id, contacts),
+            self._biodi_by_md5(
+                orm_class=Contact,
+                rows=[
+                    {
+                        "person_id": person_id,
+                        "phone": contact.get("phone"),
+                        "phone_ext": contact.get("phone_ext"),
+                        "email": contact.get("email"),
+                    } for contact, person_id in zip(contacts, person_ids)
+                ],
+                session=session,
+            ),
+        ))
+        investigator_ids = dict(zip(
+            map(id, investigators),
+            self._biodi_by_md5(
+                orm_class=Investigator,
+                rows=[
+                    {
+                        "person_id": person_id,
+                        "role": investigator.get("role"),
+                        "affiliation": investigator.get("affiliation"),
+                    } for investigator, person_id in zip(
+                        investigators,
+                        person_ids[len(contacts):],
+                    )
+                ],
+                session=session,
+            ),
+        ))
+
+        # IODI the `Facility` records and IODU the `Location` records.
+        locations = [
+            location
+            for graph in study_graphs
+            for location in graph.get("locations", [])
+        ]
+        facility_ids = self._biodi_by_md5(
+            orm_class=Facility,
+            rows=[location["facility"] for location in locations],
+            session=session,
+        )
+        location_ids = self._biodi_by_md5(
+            orm_class=Location,
+            rows=[
+                {
+                    "facility_id": facility_id,
+                    "status": location.get("status"),
+                    "contact_primary_id": contact_ids.get(
+                        id(location.get("contact_primary"))
+                    ),
+                    "contact_backup_id": contact_ids.get(
+                        id(location.get("contact_backup"))
+                    ),
+                } for location, facility_id in zip(locations, facility_ids)
+            ],
+            session=session,
+            update_keys=["status"],
+        )
+        self._biodi_links(
+            orm_class=LocationInvestigator,
+            rows=[
+                {
+                    "location_id": location_id,
+                    "investigator_id": investigator_ids[id(investigator)],
+                }
+                for location, location_id in zip(locations, location_ids)
+                for investigator in location.get("investigators", [])
+            ],
+            index_elements=["location_id", "investigator_id"],
+            session=session,
+        )
+
+        # IODI the `Sponsor`, `Condition`, `Keyword`, `Intervention`, and
+        # `Alias` records.
+        sponsor_ids = self._biodi_by_md5(
+            orm_class=Sponsor,
+            rows=[
+                {
+                    "agency": sponsor["agency"],
+                    "agency_class": sponsor.get("agency_class"),
+                }
+                for graph in study_graphs
+                for sponsor in graph.get("sponsors", [])
+            ],
+            session=session,
+        )
+        condition_ids = self._biodi_by_md5(
+            orm_class=Condition,
+            rows=[
+                {"condition": condition}
+                for graph in study_graphs
+                for condition in graph.get("conditions", [])
+            ],
+            session=session,
+        )
+        keyword_ids = self._biodi_by_md5(
+            orm_class=Keyword,
+            rows=[
+                {"keyword": keyword}
+                for graph in study_graphs
+                for keyword in graph.get("keywords", [])
+            ],
+            session=session,
+        )
+        interventions = [
+            intervention
+            for graph in study_graphs
+            for intervention in graph.get("interventions", [])
+        ]
+        intervention_ids = self._biodi_by_md5(
+            orm_class=Intervention,
+            rows=[
+                {
+                    "intervention_type": intervention["intervention_type"],
+                    "name": intervention["name"],
+                    "description": intervention.get("description"),
+                } for intervention in interventions
+            ],
+            session=session,
+        )
+        aliases = [
+            alias
+            for graph in study_graphs
+            for alias in graph.get("aliases", [])
+        ] + [
+            alias
+            for intervention in interventions
+            for alias in intervention.get("aliases", [])
+        ]
+        alias_ids = dict(zip(
+            aliases,
+            self._biodi_by_md5(
+                orm_class=Alias,
+                rows=[{"alias": alias} for alias in aliases],
+                session=session,
+            ),
+        ))
+        self._biodi_links(
+            orm_class=InterventionAlias,
+            rows=[
+                {
+                    "intervention_id": intervention_id,
+                    "alias_id": alias_ids[alias],
+                }
+                for intervention, intervention_id in zip(
+                    interventions,
+                    intervention_ids,
+                )
+                for alias in intervention.get("aliases", [])
+            ],
+            index_elements=["intervention_id", "alias_id"],
+            session=session,
+        )
+
+        # Retrieve the records linked to a single study that the studies being
+        # re-ingested already reference so that records whose values are
+        # unchanged are reused and the replaced ones are deleted.
+        classes_single = [
+            ("oversight_info", OversightInfo),
+            ("expanded_access_info", ExpandedAccessInfo),
+            ("study_design_info", StudyDesignInfo),
+            ("enrollment", Enrollment),
+            ("eligibility", Eligibility),
+            ("study_dates", StudyDates),
+            ("responsible_party", ResponsibleParty),
+            ("patient_data", PatientData),
+        ]
+        table = Study.__table__  # type: sqlalchemy.Table
+        nct_ids = sorted({graph["study"]["nct_id"] for graph in study_graphs})
+        studies_existing = {}  # type: Dict[str, Dict[str, Any]]
+        if nct_ids:
+            query = sqlalchemy.select(
+                [table.c.nct_id, table.c.study_id] + [
+                    table.c["{}_id".format(key)] for key, _ in classes_single
+                ]
+            ).where(table.c.nct_id.in_(nct_ids))
+            studies_existing = {
+                row["nct_id"]: dict(row)
+                for row in session.execute(query).fetchall()
+            }
+        # The existing study ID of each graph or `None` for new studies.
+        study_ids_existing = [
+            studies_existing.get(graph["study"]["nct_id"], {}).get("study_id")
+            for graph in study_graphs
+        ]
+        linked_ids = {
+            orm_class: self._select_study_linked_ids(
+                orm_class=orm_class,
+                link_key=link_key,
+                study_ids=[
+                    row["study_id"] for row in studies_existing.values()
+                ],
+                session=session,
+                clauses=clauses,
+            ) for orm_class, link_key, clauses in [
+                (StudyOutcome, "protocol_outcome_id", None),
+                (StudyArmGroup, "arm_group_id", None),
+                (StudyStudyDoc, "study_doc_id", None),
+                # References with a PubMed ID are shared across studies.
+                (
+                    StudyReference,
+                    "reference_id",
+                    [
+                        sqlalchemy.exists().where(
+                            sqlalchemy.and_(
+                                Reference.reference_id ==
+                                StudyReference.reference_id,
+                                Reference.pmid.is_(None),
+                            )
+                        )
+                    ],
+                ),
+            ]
+        }
+        # The primary-key IDs of the replaced records keyed by class.
+        ids_replaced = {}  # type: Dict[Type[OrmFightForBase], List[int]]
+
+        # IODU the `Reference` records with a PubMed ID and insert the rest.
+        references = [
+            reference
+            for graph in study_graphs
+            for reference in graph.get("references", [])
+        ]
+        reference_ids_pmid = self._biodu_by_key(
+            orm_class=Reference,
+            rows=[
+                {
+                    "citation": reference.get("citation"),
+                    "pmid": reference["pmid"],
+                }
+                for reference in references if reference.get("pmid")
+            ],
+            key="pmid",
+            session=session,
+        )
+        references_no_pmid = [
+            reference for reference in references if not reference.get("pmid")
+        ]
+        reference_ids_no_pmid, ids_replaced[Reference] = self._binsert_reusing(
+            orm_class=Reference,
+            rows=[
+                {
+                    "citation": reference.get("citation"),
+                    "pmid": None,
+                } for reference in references_no_pmid
+            ],
+            candidate_ids=[
+                linked_ids[StudyReference].get(study_id_existing, [])
+                for graph, study_id_existing in zip(
+                    study_graphs,
+                    study_ids_existing,
+                )
+                for reference in graph.get("references", [])
+                if not reference.get("pmid")
+            ],
+            session=session,
+        )
+        reference_ids = dict(zip(
+            map(id, references_no_pmid),
+            reference_ids_no_pmid,
+        ))
+        for reference in references:
+            if reference.get("pmid"):
+                reference_ids[id(reference)] = reference_ids_pmid[
+                    reference["pmid"]
+                ]
+
+        # Insert the records linked to a single study, in bulk per table,
+        # reusing the unchanged records of re-ingested studies, and keep their
+        # IDs under the respective key of the study rows.
+        studies = [dict(graph["study"]) for graph in study_graphs]
+        for key, orm_class in classes_single:
+            key_id = "{}_id".format(key)
+            idxs = [
+                idx for idx, graph in enumerate(study_graphs) if graph.get(key)
+            ]
+            rows = [
+                {
+                    name: value
+                    for name, value in study_graphs[idx][key].items()
+                    if name != "ipd_info_types"
+                } for idx in idxs
+            ]
+            if orm_class is Eligibility:
+                for row in rows:
+                    row["minimum_age_days"] = parse_age_days(
+                        row.get("minimum_age")
+                    )
+                    row["maximum_age_days"] = parse_age_days(
+                        row.get("maximum_age")
+                    )
+            ids_existing = [
+                studies_existing.get(
+                    study_graphs[idx]["study"]["nct_id"], {}
+                ).get(key_id)
+                for idx in idxs
+            ]
+            obj_ids, _ = self._binsert_reusing(
+                orm_class=orm_class,
+                rows=rows,
+                candidate_ids=[
+                    [obj_id] if obj_id is not None else []
+                    for obj_id in ids_existing
+                ],
+                session=session,
+            )
+            for study in studies:
+                study[key_id] = None
+            for idx, obj_id in zip(idxs, obj_ids):
+                studies[idx][key_id] = obj_id
+
+            # The records of re-ingested studies which were not reused,
+            # including those of studies which no longer define the key, are
+            # replaced.
+            ids_replaced[orm_class] = sorted({
+                row[key_id] for row in studies_existing.values()
+                if row[key_id] is not None
+            } - set(obj_ids))
+
+        for graph, study in zip(study_graphs, studies):
+            for key in ["contact_primary", "contact_backup"]:
+                study["{}_id".format(key)] = contact_ids.get(
+                    id(graph.get(key))
+                )
+
+        # Insert the IPD info types of the patient data, deleting those the
+        # reused `PatientData` records no longer define.
+        ipd_info_types = [
+            (study["patient_data_id"], ipd_info_type)
+            for graph, study in zip(study_graphs, studies)
+            if graph.get("patient_data")
+            for ipd_info_type in graph["patient_data"].get(
+                "ipd_info_types", []
+            )
+        ]
+        ipd_info_types_existing = self._delete_records_stale(
+            orm_class=PatientDataIpdInfoType,
+            parent_key="patient_data_id",
+            other_key="ipd_info_type",
+            parent_ids=[
+                study["patient_data_id"] for study in studies
+                if study["patient_data_id"] is not None
+            ],
+            pairs=ipd_info_types,
+            session=session,
+        )
+        self._binsert(
+            orm_class=PatientDataIpdInfoType,
+            rows=[
+                {
+                    "patient_data_id": patient_data_id,
+                    "ipd_info_type": ipd_info_type,
+                }
+                for patient_data_id, ipd_info_type in ipd_info_types
+                if (patient_data_id, ipd_info_type)
+                not in ipd_info_types_existing
+            ],
+            session=session,
+        )
+
+        # Insert the records linked to a single study through an association.
+        protocol_outcomes = [
+            protocol_outcome
+            for graph in study_graphs
+            for protocol_outcome in graph.get("protocol_outcomes", [])
+        ]
+        protocol_outcome_ids, ids_replaced[ProtocolOutcome] = (
+            self._binsert_reusing(
+                orm_class=ProtocolOutcome,
+                rows=[
+                    {
+                        name: value
+                        for name, value in protocol_outcome.items()
+                        if name != "outcome_type"
+                    } for protocol_outcome in protocol_outcomes
+                ],
+                candidate_ids=[
+                    linked_ids[StudyOutcome].get(study_id_existing, [])
+                    for graph, study_id_existing in zip(
+                        study_graphs,
+                        study_ids_existing,
+                    )
+                    for _ in graph.get("protocol_outcomes", [])
+                ],
+                session=session,
+            )
+        )
+        arm_groups = [
+            arm_group
+            for graph in study_graphs
+            for arm_group in graph.get("arm_groups", [])
+        ]
+        arm_group_ids_list, ids_replaced[ArmGroup] = self._binsert_reusing(
+            orm_class=ArmGroup,
+            rows=arm_groups,
+            candidate_ids=[
+                linked_ids[StudyArmGroup].get(study_id_existing, [])
+                for graph, study_id_existing in zip(
+                    study_graphs,
+                    study_ids_existing,
+                )
+                for _ in graph.get("arm_groups", [])
+            ],
+            session=session,
+        )
+        arm_group_ids = dict(zip(map(id, arm_groups), arm_group_ids_list))
+        study_docs = [
+            study_doc
+            for graph in study_graphs
+            for study_doc in graph.get("study_docs", [])
+        ]
+        study_doc_ids, ids_replaced[StudyDoc] = self._binsert_reusing(
+            orm_class=StudyDoc,
+            rows=study_docs,
+            candidate_ids=[
+                linked_ids[StudyStudyDoc].get(study_id_existing, [])
+                for graph, study_id_existing in zip(
+                    study_graphs,
+                    study_ids_existing,
+                )
+                for _ in graph.get("study_docs", [])
+            ],
+            session=session,
+        )
+
+        # Link the interventions to the arm groups of their study by label.
+        intervention_arm_groups = []
+        intervention_ids_iter = iter(intervention_ids)
+        for graph in study_graphs:
+            arm_group_ids_by_label = {
+                arm_group["label"]: arm_group_ids[id(arm_group)]
+                for arm_group in graph.get("arm_groups", [])
+            }
+            for intervention in graph.get("interventions", []):
+                intervention_id = next(intervention_ids_iter)
+                for label in intervention.get("arm_group_labels", []):
+                    if label in arm_group_ids_by_label:
+                        intervention_arm_groups.append({
+                            "intervention_id": intervention_id,
+                            "arm_group_id": arm_group_ids_by_label[label],
+                        })
+        # Delete the interventions the reused arm groups no longer include.
+        self._delete_records_stale(
+            orm_class=InterventionArmGroup,
+            parent_key="arm_group_id",
+            other_key="intervention_id",
+            parent_ids=arm_group_ids_list,
+            pairs=[
+                (row["arm_group_id"], row["intervention_id"])
+                for row in intervention_arm_groups
+            ],
+            session=session,
+        )
+        self._biodi_links(
+            orm_class=InterventionArmGroup,
+            rows=intervention_arm_groups,
+            index_elements=["intervention_id", "arm_group_id"],
+            session=session,
+        )
+
+        # IODU the `Study` records.
+        study_ids = self.biodu_studies(rows=studies, session=session)
+
+        # Collect the association rows of each table across all studies.
+        links = {
+            StudyAlias: [],
+            StudySponsor: [],
+            StudyOutcome: [],
+            StudyCondition: [],
+            StudyArmGroup: [],
+            StudyIntervention: [],
+            StudyInvestigator: [],
+            StudyLocation: [],
+            StudyReference: [],
+            StudyKeyword: [],
+            StudyDescriptor: [],
+            StudyStudyDoc: [],
+            StudyFacility: [],
+            StudySecondaryId: [],
+        }
+        sponsor_ids_iter = iter(sponsor_ids)
+        condition_ids_iter = iter(condition_ids)
+        keyword_ids_iter = iter(keyword_ids)
+        intervention_ids_iter = iter(intervention_ids)
+        protocol_outcome_ids_iter = iter(protocol_outcome_ids)
+        study_doc_ids_iter = iter(study_doc_ids)
+        location_ids_iter = iter(location_ids)
+        facility_ids_iter = iter(facility_ids)
+        for graph in study_graphs:
+            study_id = study_ids[graph["study"]["nct_id"]]
+            for alias in graph.get("aliases", []):
+                links[StudyAlias].append({
+                    "study_id": study_id,
+                    "alias_id": alias_ids[alias],
+                })
+            for sponsor in graph.get("sponsors", []):
+                links[StudySponsor].append({
+                    "study_id": study_id,
+                    "sponsor_id": next(sponsor_ids_iter),
+                    "sponsor_type": sponsor.get("sponsor_type"),
+                })
+            for protocol_outcome in graph.get("protocol_outcomes", []):
+                links[StudyOutcome].append({
+                    "study_id": study_id,
+                    "protocol_outcome_id": next(protocol_outcome_ids_iter),
+                    "outcome_type": protocol_outcome.get("outcome_type"),
+                })
+            for _ in graph.get("conditions", []):
+                links[StudyCondition].append({
+                    "study_id": study_id,
+                    "condition_id": next(condition_ids_iter),
+                })
+            for arm_group in graph.get("arm_groups", []):
+                links[StudyArmGroup].append({
+                    "study_id": study_id,
+                    "arm_group_id": arm_group_ids[id(arm_group)],
+                })
+            for _ in graph.get("interventions", []):
+                links[StudyIntervention].append({
+                    "study_id": study_id,
+                    "intervention_id": next(intervention_ids_iter),
+                })
+            for investigator in graph.get("investigators", []):
+                links[StudyInvestigator].append({
+                    "study_id": study_id,
+                    "investigator_id": investigator_ids[id(investigator)],
+                })
+            for _ in graph.get("locations", []):
+                links[StudyLocation].append({
+                    "study_id": study_id,
+                    "location_id": next(location_ids_iter),
+                })
+                links[StudyFacility].append({
+                    "study_id": study_id,
+                    "facility_id": next(facility_ids_iter),
+                })
+            for reference in graph.get("references", []):
+                links[StudyReference].append({
+                    "study_id": study_id,
+                    "reference_id": reference_ids[id(reference)],
+                    "reference_type": reference.get("reference_type"),
+                })
+            for _ in graph.get("keywords", []):
+                links[StudyKeyword].append({
+                    "study_id": study_id,
+                    "keyword_id": next(keyword_ids_iter),
+                })
+            for descriptor in graph.get("descriptors", []):
+                links[StudyDescriptor].append({
+                    "study_id": study_id,
+                    "descriptor_id": descriptor["descriptor_id"],
+                    "study_descriptor_type": descriptor.get(
+                        "study_descriptor_type"
+                    ),
+                })
+            for _ in graph.get("study_docs", []):
+                links[StudyStudyDoc].append({
+                    "study_id": study_id,
+                    "study_doc_id": next(study_doc_ids_iter),
+                })
+            for secondary_id in graph.get("secondary_ids", []):
+                links[StudySecondaryId].append({
+                    "study_id": study_id,
+                    "secondary_id": secondary_id,
+                })
+
+        # Delete the associations the studies no longer define, then IODI or
+        # IODU the association records as per the respective per-record
+        # methods. The facility links are IODIed so that their canonical
+        # facilities are preserved.
+        for orm_class, other_key, update_keys in [
+            (StudyAlias, "alias_id", None),
+            (StudySponsor, "sponsor_id", ["type"]),
+            (StudyOutcome, "protocol_outcome_id", ["type"]),
+            (StudyCondition, "condition_id", None),
+            (StudyArmGroup, "arm_group_id", None),
+            (StudyIntervention, "intervention_id", None),
+            (StudyInvestigator, "investigator_id", None),
+            (StudyLocation, "location_id", None),
+            (StudyReference, "reference_id", ["type"]),
+            (StudyKeyword, "keyword_id", None),
+            (StudyDescriptor, "descriptor_id", ["type"]),
+            (StudyStudyDoc, "study_doc_id", None),
+            (StudyFacility, "facility_id", None),
+        ]:
+            self._delete_study_links_stale(
+                orm_class=orm_class,
+                link_key=other_key,
+                study_ids=list(study_ids.values()),
+                pairs=[
+                    (row["study_id"], row[other_key])
+                    for row in links[orm_class]
+                ],
+                session=session,
+            )
+            self._biodi_links(
+                orm_class=orm_class,
+                rows=links[orm_class],
+                index_elements=["study_id", other_key],
+                session=session,
+                update_keys=update_keys,
+            )
+
+        # The secondary IDs define no unique constraint and are synced so that
+        # they are not duplicated.
+        pairs = [
+            (row["study_id"], row["secondary_id"])
+            for row in links[StudySecondaryId]
+        ]
+        self._delete_study_links_stale(
+            orm_class=StudySecondaryId,
+            link_key="secondary_id",
+            study_ids=list(study_ids.values()),
+            pairs=pairs,
+            session=session,
+        )
+        self._insert_study_links_missing(
+            orm_class=StudySecondaryId,
+            link_key="secondary_id",
+            pairs=pairs,
+            session=session,
+        )
+
+        # Delete the records the re-ingested studies were linked to but which
+        # have been replaced.
+        for key, orm_class in classes_single:
+            self._delete_records_unlinked(
+                orm_class=orm_class,
+                obj_ids=ids_replaced[orm_class],
+                link_columns=[table.c["{}_id".format(key)]],
+                session=session,
+                dependent_columns=(
+                    [PatientDataIpdInfoType.__table__.c.patient_data_id]
+                    if orm_class is PatientData else None
+                ),
+            )
+        for orm_class, link_column, dependent_columns in [
+            (Reference, StudyReference.__table__.c.reference_id, None),
+            (
+                ProtocolOutcome,
+                StudyOutcome.__table__.c.protocol_outcome_id,
+                None,
+            ),
+            (
+                ArmGroup,
+                StudyArmGroup.__table__.c.arm_group_id,
+                [InterventionArmGroup.__table__.c.arm_group_id],
+            ),
+            (StudyDoc, StudyStudyDoc.__table__.c.study_doc_id, None),
+        ]:
+            self._delete_records_unlinked(
+                orm_class=orm_class,
+                obj_ids=ids_replaced[orm_class],
+                link_columns=[link_column],
+                session=session,
+                dependent_columns=dependent_columns,
+            )
+
+        return study_ids
@@ -125,18 +125,18 @@ class DalMedline(DalFightForBase):
                 "url": url,
                 "health_topic_group_class_id": health_topic_group_class_id,
             },
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui"],
             set_={
                 "url": url,
                 "name": name,
                 "health_topic_group_class_id": health_topic_group_class_id,
             },
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -249,13 +249,14 @@ class DalMedline(DalFightForBase):
         # Upsert the `PrimaryInstitute` record.
         statement = insert(
             PrimaryInstitute, values={"name": name, "url": url}
-        ).on_conflict_do_update(
-            index_elements=["name"], set_={"url": url}
         )  # type: Insert
 
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+        return self.execute_iodu(
+            statement=statement,
+            index_elements=["name"],
+            set_={"url": url},
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -653,7 +654,10 @@ class DalMedline(DalFightForBase):
                 "date_created": date_created,
                 "primary_institute_id": primary_institute_id,
             },
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui"],
             set_={
                 "title": title,
@@ -663,8 +667,5 @@ class DalMedline(DalFightForBase):
                 "date_created": date_created,
                 "primary_institute_id": primary_institute_id,
             },
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            session=session,
+        )
@@ -10,6 +10,7 @@ from sqlalchemy.engine.result import ResultProxy
 
 from fform.dal_base import DalFightForBase
 from fform.dal_base import with_session_scope
+from fform.dal_base import with_batch_bisection
 from fform.orm_mt import TreeNumber
 from fform.orm_mt import ThesaurusId
 from fform.orm_mt import Term
@@ -48,6 +49,7 @@ from fform.orm_mt import DescriptorDefinition
 from fform.orm_mt import DescriptorDefinitionSourceType
 from fform.utils import return_first_item
 from fform.utils import lists_equal_length
+from fform.utils import sort_rows_by_keys
 
 
 class DalMesh(DalFightForBase):
@@ -99,6 +101,9 @@ class DalMesh(DalFightForBase):
         obj = TreeNumber()
         obj.tree_number = tree_number
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             TreeNumber,
             values={
@@ -148,6 +153,9 @@ class DalMesh(DalFightForBase):
         obj = ThesaurusId()
         obj.thesaurus_id = thesaurus_id
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             ThesaurusId,
             values={
@@ -216,7 +224,10 @@ class DalMesh(DalFightForBase):
                 "entry_version": entry_version,
                 "note": note,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui"],
             set_={
                 "name": name,
@@ -225,12 +236,9 @@ class DalMesh(DalFightForBase):
                 "sort_version": sort_version,
                 "entry_version": entry_version,
                 "note": note,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -330,7 +338,10 @@ class DalMesh(DalFightForBase):
                 ),
                 "translators_scope_note": translators_scope_note,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui", "name"],
             set_={
                 "casn1_name": casn1_name,
@@ -340,12 +351,9 @@ class DalMesh(DalFightForBase):
                     translators_english_scope_note
                 ),
                 "translators_scope_note": translators_scope_note,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -381,16 +389,16 @@ class DalMesh(DalFightForBase):
                 "related_concept_id": related_concept_id,
                 "relation_name": relation_name,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["concept_id", "related_concept_id"],
             set_={
                 "relation_name": relation_name,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -436,19 +444,19 @@ class DalMesh(DalFightForBase):
                 "lexical_tag": lexical_tag,
                 "is_record_preferred_term": is_record_preferred_term,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["concept_id", "term_id"],
             set_={
                 "is_concept_preferred_term": is_concept_preferred_term,
                 "is_permuted_term": is_permuted_term,
                 "lexical_tag": lexical_tag,
                 "is_record_preferred_term": is_record_preferred_term,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -499,7 +507,10 @@ class DalMesh(DalFightForBase):
                 "history_note": history_note,
                 "online_note": online_note,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui", "name"],
             set_={
                 "created": created,
@@ -508,12 +519,9 @@ class DalMesh(DalFightForBase):
                 "annotation": annotation,
                 "history_note": history_note,
                 "online_note": online_note,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -549,16 +557,16 @@ class DalMesh(DalFightForBase):
                 "concept_id": concept_id,
                 "is_preferred": is_preferred,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["qualifier_id", "concept_id"],
             set_={
                 "is_preferred": is_preferred,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -635,6 +643,9 @@ class DalMesh(DalFightForBase):
         obj = PreviousIndexing()
         obj.previous_indexing = previous_indexing
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         # Upsert the `PreviousIndexing` record.
         statement = insert(
             PreviousIndexing,
@@ -693,16 +704,16 @@ class DalMesh(DalFightForBase):
                 "qualifier_id": qualifier_id,
                 "type": combination_type,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["descriptor_id", "qualifier_id"],
             set_={
                 "type": combination_type,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -767,7 +778,10 @@ class DalMesh(DalFightForBase):
                 "public_mesh_note": public_mesh_note,
                 "consider_also": consider_also,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui", "name"],
             set_={
                 "class": descriptor_class,
@@ -780,12 +794,9 @@ class DalMesh(DalFightForBase):
                 "online_note": online_note,
                 "public_mesh_note": public_mesh_note,
                 "consider_also": consider_also
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -870,16 +881,16 @@ class DalMesh(DalFightForBase):
                 "concept_id": concept_id,
                 "is_preferred": is_preferred,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["descriptor_id", "concept_id"],
             set_={
                 "is_preferred": is_preferred,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -965,16 +976,16 @@ class DalMesh(DalFightForBase):
                 "qualifier_id": qualifier_id,
                 "abbreviation": abbreviation,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["descriptor_id", "qualifier_id"],
             set_={
                 "abbreviation": abbreviation,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1157,6 +1168,9 @@ class DalMesh(DalFightForBase):
         obj = Source()
         obj.source = source
 
+        # Calculate the MD5 hash of the record.
+        obj.update_md5()
+
         statement = insert(
             Source,
             values={
@@ -1226,7 +1240,10 @@ class DalMesh(DalFightForBase):
                 "note": note,
                 "frequency": frequency,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["ui", "name"],
             set_={
                 "class": supplemental_class,
@@ -1234,12 +1251,9 @@ class DalMesh(DalFightForBase):
                 "revised": revised,
                 "note": note,
                 "frequency": frequency,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1378,16 +1392,16 @@ class DalMesh(DalFightForBase):
                 "concept_id": concept_id,
                 "is_preferred": is_preferred,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["supplemental_id", "concept_id"],
             set_={
                 "is_preferred": is_preferred,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        return result.inserted_primary_key
+            },
+            session=session,
+        )
 
     @return_first_item
     @with_session_scope()
@@ -1549,6 +1563,7 @@ class DalMesh(DalFightForBase):
             return obj.supplemental_source_id
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["synonyms", "md5s"])
     @with_session_scope()
     def biodi_descriptor_synonyms(
         self,
@@ -1572,16 +1587,19 @@ class DalMesh(DalFightForBase):
 
         statement = insert(
             DescriptorSynonym,
-            values=list(
-                {
-                    "descriptor_id": descriptor_id,
-                    "synonym": synonym,
-                    "md5": md5,
-                } for synonym, md5 in zip(
-                    synonyms,
-                    md5s
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "descriptor_id": descriptor_id,
+                        "synonym": synonym,
+                        "md5": md5,
+                    } for synonym, md5 in zip(
+                        synonyms,
+                        md5s
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -10,6 +10,7 @@ from sqlalchemy.engine.result import ResultProxy
 
 from fform.dal_base import DalFightForBase
 from fform.dal_base import with_session_scope
+from fform.dal_base import with_batch_bisection
 from fform.orm_pubmed import Author
 from fform.orm_pubmed import Affiliation
 from fform.orm_pubmed import PmKeyword
@@ -37,6 +38,7 @@ from fform.orm_pubmed import Article
 from fform.orm_pubmed import Citation
 from fform.orm_pubmed import AffiliationCanonical
 from fform.utils import lists_equal_length
+from fform.utils import sort_rows_by_keys
 from fform.utils import return_first_item
 
 
@@ -63,6 +65,7 @@ class DalPubmed(DalFightForBase):
         )
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["keywords", "md5s"])
     @with_session_scope()
     def biodi_keywords(
         self,
@@ -73,15 +76,18 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             PmKeyword,
-            values=list(
-                {
-                    "keyword": keyword,
-                    "md5": md5,
-                } for keyword, md5 in zip(
-                    keywords,
-                    md5s
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "keyword": keyword,
+                        "md5": md5,
+                    } for keyword, md5 in zip(
+                        keywords,
+                        md5s
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -100,6 +106,7 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["uids", "publication_types"])
     @with_session_scope()
     def biodi_publication_types(
         self,
@@ -110,15 +117,18 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             PublicationType,
-            values=list(
-                {
-                    "uid": uid,
-                    "publication_type": publication_type,
-                } for uid, publication_type in zip(
-                    uids,
-                    publication_types
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "uid": uid,
+                        "publication_type": publication_type,
+                    } for uid, publication_type in zip(
+                        uids,
+                        publication_types
+                    )
+                ),
+                keys=["uid"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -137,6 +147,18 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(
+        batch_args=[
+            "author_identifiers",
+            "author_identifier_sources",
+            "names_first",
+            "names_last",
+            "names_initials",
+            "names_suffix",
+            "emails",
+            "md5s",
+        ],
+    )
     @with_session_scope()
     def biodi_authors(
         self,
@@ -153,36 +175,39 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             Author,
-            values=list(
-                {
-                    "author_identifier": author_identifier,
-                    "author_identifier_source": author_identifier_source,
-                    "name_first": name_first,
-                    "name_last": name_last,
-                    "name_initials": name_initials,
-                    "name_suffix": name_suffix,
-                    "email": email,
-                    "md5": md5,
-                } for (
-                    author_identifier,
-                    author_identifier_source,
-                    name_first,
-                    name_last,
-                    name_initials,
-                    name_suffix,
-                    email,
-                    md5,
-                ) in zip(
-                    author_identifiers,
-                    author_identifier_sources,
-                    names_first,
-                    names_last,
-                    names_initials,
-                    names_suffix,
-                    emails,
-                    md5s,
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "author_identifier": author_identifier,
+                        "author_identifier_source": author_identifier_source,
+                        "name_first": name_first,
+                        "name_last": name_last,
+                        "name_initials": name_initials,
+                        "name_suffix": name_suffix,
+                        "email": email,
+                        "md5": md5,
+                    } for (
+                        author_identifier,
+                        author_identifier_source,
+                        name_first,
+                        name_last,
+                        name_initials,
+                        name_suffix,
+                        email,
+                        md5,
+                    ) in zip(
+                        author_identifiers,
+                        author_identifier_sources,
+                        names_first,
+                        names_last,
+                        names_initials,
+                        names_suffix,
+                        emails,
+                        md5s,
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -201,6 +226,15 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(
+        batch_args=[
+            "affiliation_identifiers",
+            "affiliation_identifier_sources",
+            "affiliations",
+            "affiliation_canonical_ids",
+            "md5s",
+        ],
+    )
     @with_session_scope()
     def biodi_affiliations(
         self,
@@ -214,28 +248,31 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             Affiliation,
-            values=list(
-                {
-                    "affiliation_identifier": affiliation_identifier,
-                    "affiliation_identifier_source":
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "affiliation_identifier": affiliation_identifier,
+                        "affiliation_identifier_source":
+                            affiliation_identifier_source,
+                        "affiliation": affiliation,
+                        "affiliation_canonical_id": affiliation_canonical_id,
+                        "md5": md5,
+                    } for (
+                        affiliation_identifier,
                         affiliation_identifier_source,
-                    "affiliation": affiliation,
-                    "affiliation_canonical_id": affiliation_canonical_id,
-                    "md5": md5,
-                } for (
-                    affiliation_identifier,
-                    affiliation_identifier_source,
-                    affiliation,
-                    affiliation_canonical_id,
-                    md5,
-                ) in zip(
-                    affiliation_identifiers,
-                    affiliation_identifier_sources,
-                    affiliations,
-                    affiliation_canonical_ids,
-                    md5s,
-                )
-            )
+                        affiliation,
+                        affiliation_canonical_id,
+                        md5,
+                    ) in zip(
+                        affiliation_identifiers,
+                        affiliation_identifier_sources,
+                        affiliations,
+                        affiliation_canonical_ids,
+                        md5s,
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -254,6 +291,9 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(
+        batch_args=["uids", "acronyms", "agencies", "countries", "md5s"],
+    )
     @with_session_scope()
     def biodi_grants(
         self,
@@ -267,27 +307,30 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             Grant,
-            values=list(
-                {
-                    "uid": uid,
-                    "acronym": acronym,
-                    "agency": agency,
-                    "country": country,
-                    "md5": md5,
-                } for (
-                    uid,
-                    acronym,
-                    agency,
-                    country,
-                    md5,
-                ) in zip(
-                    uids,
-                    acronyms,
-                    agencies,
-                    countries,
-                    md5s,
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "uid": uid,
+                        "acronym": acronym,
+                        "agency": agency,
+                        "country": country,
+                        "md5": md5,
+                    } for (
+                        uid,
+                        acronym,
+                        agency,
+                        country,
+                        md5,
+                    ) in zip(
+                        uids,
+                        acronyms,
+                        agencies,
+                        countries,
+                        md5s,
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -306,6 +349,7 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["databanks", "md5s"])
     @with_session_scope()
     def biodi_databanks(
         self,
@@ -316,15 +360,18 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             Databank,
-            values=list(
-                {
-                    "databank": databank,
-                    "md5": md5,
-                } for databank, md5 in zip(
-                    databanks,
-                    md5s
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "databank": databank,
+                        "md5": md5,
+                    } for databank, md5 in zip(
+                        databanks,
+                        md5s
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -343,6 +390,7 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["accession_numbers", "md5s"])
     @with_session_scope()
     def biodi_accession_numbers(
         self,
@@ -353,15 +401,18 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             AccessionNumber,
-            values=list(
-                {
-                    "accession_number": accession_number,
-                    "md5": md5,
-                } for accession_number, md5 in zip(
-                    accession_numbers,
-                    md5s
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "accession_number": accession_number,
+                        "md5": md5,
+                    } for accession_number, md5 in zip(
+                        accession_numbers,
+                        md5s
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -380,6 +431,7 @@ class DalPubmed(DalFightForBase):
         return obj_ids
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["abstract_text_ids", "ordinances"])
     @with_session_scope()
     def biodi_article_abstract_texts(
         self,
@@ -406,6 +458,14 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(
+        batch_args=[
+            "author_ids",
+            "affiliation_ids",
+            "affiliation_canonical_ids",
+            "ordinances",
+        ],
+    )
     @with_session_scope()
     def biodi_article_author_affiliations(
         self,
@@ -443,6 +503,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["accession_number_ids"])
     @with_session_scope()
     def biodi_article_databank_accession_numbers(
         self,
@@ -468,6 +529,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["grant_ids"])
     @with_session_scope()
     def biodi_article_grants(
         self,
@@ -491,6 +553,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["chemical_ids"])
     @with_session_scope()
     def biodi_citation_chemicals(
         self,
@@ -514,6 +577,14 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(
+        batch_args=[
+            "descriptor_ids",
+            "are_descriptors_major",
+            "qualifier_ids",
+            "are_qualifiers_major",
+        ],
+    )
     @with_session_scope()
     def biodi_citation_descriptors_qualifiers(
         self,
@@ -551,6 +622,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["identifier_types", "identifiers"])
     @with_session_scope()
     def biodi_citation_identifiers(
         self,
@@ -580,6 +652,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["keyword_ids"])
     @with_session_scope()
     def biodi_citation_keywords(
         self,
@@ -603,6 +676,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["publication_type_ids"])
     @with_session_scope()
     def biodi_article_publication_types(
         self,
@@ -626,6 +700,7 @@ class DalPubmed(DalFightForBase):
         session.execute(statement)
 
     @lists_equal_length
+    @with_batch_bisection(batch_args=["categories", "texts", "md5s"])
     @with_session_scope()
     def biodi_abstract_texts(
         self,
@@ -638,19 +713,22 @@ class DalPubmed(DalFightForBase):
 
         statement = insert(
             AbstractText,
-            values=list(
-                {
-                    "label": label,
-                    "category": category,
-                    "text": text,
-                    "md5": md5,
-                } for label, category, text, md5 in zip(
-                    labels,
-                    categories,
-                    texts,
-                    md5s,
-                )
-            )
+            values=sort_rows_by_keys(
+                rows=list(
+                    {
+                        "label": label,
+                        "category": category,
+                        "text": text,
+                        "md5": md5,
+                    } for label, category, text, md5 in zip(
+                        labels,
+                        categories,
+                        texts,
+                        md5s,
+                    )
+                ),
+                keys=["md5"],
+            ),
         ).on_conflict_do_nothing()
 
         session.execute(statement)
@@ -1020,7 +1098,10 @@ class DalPubmed(DalFightForBase):
                 "street_address": obj.street_address,
                 "street_number": obj.street_number,
             }
-        ).on_conflict_do_update(
+        )  # type: Insert
+
+        return self.execute_iodu(
+            statement=statement,
             index_elements=["google_place_id"],
             set_={
                 "name": obj.name,
@@ -1057,19 +1138,6 @@ class DalPubmed(DalFightForBase):
                 "route": obj.route,
                 "street_address": obj.street_address,
                 "street_number": obj.street_number,
-            }
-        )  # type: Insert
-
-        result = session.execute(statement)  # type: ResultProxy
-
-        if result.inserted_primary_key:
-            return result.inserted_primary_key
-        else:
-            # noinspection PyTypeChecker
-            obj = self.get_by_attr(
-                orm_class=AffiliationCanonical,
-                attr_name="google_place_id",
-                attr_value=obj.google_place_id,
-                session=session,
-            )  # type: AffiliationCanonical
-            return obj.affiliation_canonical_id
+            },
+            session=session,
+        )
@@ -0,0 +1,172 @@
+# coding: utf-8
+
+""" JSON streaming module.
+
+This module contains functions encoding ORM objects and Core rows directly into
+JSON or NDJSON bytes, one record at a time, and writing them incrementally to a
+file-like object so that large result-sets are never held in memory at once.
+Values are converted into serialisable types as per the `_sqla_types_convert`
+and `_python_instance_convert` rules of the `OrmBase` class.
+
+The `orjson` package is used for encoding when available with the `json`
+module of the standard library serving as a fallback.
+"""
+
+import enum
+import json
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, Optional
+
+from fform.orm_base import OrmBase
+from fform.orm_base import SerializationSpec
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Converts values the encoder cannot serialise natively, i.e., binary
+    values such as MD5 hashes, enumeration members, and geometries."""
+
+    if isinstance(value, bytes):
+        return OrmBase._sqla_types_convert[bytes](None, value).decode("ascii")
+    if isinstance(value, enum.Enum):
+        return value.value
+
+    return str(value)
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Encodes an object into compact JSON bytes through the standard
+    library."""
+
+    return json.dumps(
+        obj,
+        default=_default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def _encode_orjson(obj: Any) -> bytes:
+    """Encodes an object into compact JSON bytes through `orjson`."""
+
+    return orjson.dumps(obj, default=_default)
+
+
+def get_encoder() -> Callable[[Any], bytes]:
+    """Returns the fastest available function encoding objects into JSON
+    bytes."""
+
+    return _encode_orjson if orjson is not None else _encode_json
+
+
+def _convert_scalar(value: Any) -> Any:
+    """Converts a Core row value as per the `_python_instance_convert` rules of
+    the `OrmBase` class."""
+
+    converter = OrmBase._get_instance_converter(type(value))
+    if converter is None:
+        return value
+
+    return converter(value)
+
+
+def record_to_serialisable(
+    record: Any,
+    spec: Optional[SerializationSpec] = None,
+) -> Dict[str, Any]:
+    """Converts an ORM object or a Core row into a `dict` of serialisable
+    values.
+
+    Args:
+        record (Any): An object of a class derived off `OrmBase`, a read-model
+            record, or a Core row, e.g., a `RowProxy` or any other mapping.
+        spec (SerializationSpec, optional): Specification of the attributes
+            and relationships to be serialized for ORM objects. Defaults to
+            `None` in which case all loaded columns are serialized.
+
+    Returns:
+        Dict[str, Any]: The serialisable record.
+    """
+
+    if isinstance(record, OrmBase):
+        return record.to_dict(serialisable=True, spec=spec)
+
+    # Read-model records are named tuples.
+    if hasattr(record, "_asdict"):
+        record = record._asdict()
+
+    return {key: _convert_scalar(value) for key, value in record.items()}
+
+
+def iter_json(
+    records: Iterable[Any],
+    spec: Optional[SerializationSpec] = None,
+    do_ndjson: bool = False,
+) -> Iterator[bytes]:
+    """Encodes records into JSON or NDJSON bytes one record at a time.
+
+    Args:
+        records (Iterable[Any]): The ORM objects or Core rows to be encoded,
+            e.g., a `Query` using `yield_per` or a `ResultProxy`.
+        spec (SerializationSpec, optional): Specification of the attributes
+            and relationships to be serialized for ORM objects. Defaults to
+            `None`.
+        do_ndjson (bool, optional): Whether to encode records as
+            newline-delimited JSON instead of a JSON array. Defaults to
+            `False`.
+
+    Yields:
+        bytes: The encoded chunks.
+    """
+
+    encode = get_encoder()
+
+    if not do_ndjson:
+        yield b"["
+
+    separator = b""
+    for record in records:
+        chunk = encode(record_to_serialisable(record=record, spec=spec))
+        if do_ndjson:
+            yield chunk + b"\n"
+        else:
+            yield separator + chunk
+            separator = b","
+
+    if not do_ndjson:
+        yield b"]"
+
+
+def dump_json(
+    records: Iterable[Any],
+    fout: BinaryIO,
+    spec: Optional[SerializationSpec] = None,
+    do_ndjson: bool = False,
+) -> int:
+    """Encodes records into JSON or NDJSON and writes them incrementally to a
+    binary file-like object.
+
+    Args:
+        records (Iterable[Any]): The ORM objects or Core rows to be encoded.
+        fout (BinaryIO): The binary file-like object the encoded records will
+            be written to.
+        spec (SerializationSpec, optional): Specification of the attributes
+            and relationships to be serialized for ORM objects. Defaults to
+            `None`.
+        do_ndjson (bool, optional): Whether to encode records as
+            newline-delimited JSON instead of a JSON array. Defaults to
+            `False`.
+
+    Returns:
+        int: The number of bytes written.
+    """
+
+    num_bytes = 0
+    for chunk in iter_json(records=records, spec=spec, do_ndjson=do_ndjson):
+        fout.write(chunk)
+        num_bytes += len(chunk)
+
+    return num_bytes
@@ -31,3 +31,15 @@ class RelationshipDoesNotExist(Exception):
     """Exception raised when the requested relationship does not exist."""
     def __init__(self, message, *args):
         super(RelationshipDoesNotExist, self).__init__(message, *args)
+
+
+class LazyLoadError(Exception):
+    """Exception raised when a relationship is lazy-loaded while lazy-loads are
+    disallowed."""
+    def __init__(self, message, *args):
+        super(LazyLoadError, self).__init__(message, *args)
+
+
+class LazyLoadWarning(UserWarning):
+    """Warning issued when a relationship is lazy-loaded while lazy-loads are
+    discouraged."""
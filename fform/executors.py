@@ -0,0 +1,234 @@
+# coding: utf-8
+
+""" Multi-process ingestion module.
+
+This module contains the `IngestionExecutor` class which distributes ingestion
+work-items across a pool of worker processes. Each worker process creates its
+own DAL, and therefore its own SQLAlchemy engine and connection pool, which is
+disposed of when the worker exits so that no connections are ever shared
+between processes.
+"""
+
+import os
+import time
+import zlib
+import multiprocessing.util
+import concurrent.futures
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+from fform.dal_base import DalBase
+from fform.loggers import create_logger
+
+
+# The DAL owned by the current worker process.
+_worker_dal = None  # type: Optional[DalBase]
+
+
+def _initialize_worker(
+    dal_class: Type[DalBase],
+    dal_kwargs: Dict[str, Any],
+) -> None:
+    """Creates the DAL of a worker process and schedules the disposal of its
+    engine upon the worker's exit.
+
+    Args:
+        dal_class (Type[DalBase]): The class of the DAL to be created.
+        dal_kwargs (Dict[str, Any]): The keyword arguments the DAL will be
+            instantiated with.
+    """
+
+    global _worker_dal
+
+    _worker_dal = dal_class(**dal_kwargs)
+
+    # Worker processes exit without running `atexit` handlers so the engine is
+    # disposed through a `multiprocessing` finalizer instead.
+    multiprocessing.util.Finalize(None, _worker_dal.dispose, exitpriority=10)
+
+
+def _run_shard(
+    func: Callable[[DalBase, Any], Any],
+    shard: List[Tuple[int, Any]],
+) -> Tuple[List[Tuple[int, Any]], Dict[str, Any]]:
+    """Processes a shard of work-items through the worker's DAL.
+
+    Args:
+        func (Callable[[DalBase, Any], Any]): The function processing a single
+            work-item through the worker's DAL.
+        shard (List[Tuple[int, Any]]): The work-items of the shard alongside
+            their index in the original list of work-items.
+
+    Returns:
+        Tuple[List[Tuple[int, Any]], Dict[str, Any]]:
+            - The results of `func` alongside the work-item index.
+            - The metrics of the shard.
+    """
+
+    time_beg = time.time()
+
+    results = [(idx, func(_worker_dal, item)) for idx, item in shard]
+
+    metrics = {
+        "pid": os.getpid(),
+        "items": len(shard),
+        "duration": time.time() - time_beg,
+    }
+
+    return results, metrics
+
+
+def shard_items(
+    items: List[Any],
+    key: Callable[[Any], Hashable],
+    num_shards: int,
+) -> List[List[Tuple[int, Any]]]:
+    """Splits work-items into shards by the stable hash of a key so that all
+    work-items sharing a key end up in the same shard.
+
+    Args:
+        items (List[Any]): The work-items to be sharded.
+        key (Callable[[Any], Hashable]): Function returning the sharding key of
+            a work-item, e.g., the NCT ID of a study or the PubMed file a
+            citation was read from.
+        num_shards (int): The number of shards.
+
+    Returns:
+        List[List[Tuple[int, Any]]]: The shards each containing work-items
+            alongside their index in `items`.
+    """
+
+    shards = [[] for _ in range(num_shards)]
+    for idx, item in enumerate(items):
+        # The builtin `hash` is salted per process so CRC32 is used instead to
+        # keep the sharding stable across runs.
+        key_hash = zlib.crc32(str(key(item)).encode("utf-8"))
+        shards[key_hash % num_shards].append((idx, item))
+
+    return shards
+
+
+class IngestionExecutor(object):
+    """Executes ingestion work-items across a pool of worker processes each
+    owning a separate DAL.
+
+    Attributes:
+        dal_class (Type[DalBase]): The class of the DAL created in each worker.
+        dal_kwargs (Dict[str, Any]): The keyword arguments the DAL of each
+            worker will be instantiated with.
+        num_workers (int): The number of worker processes.
+        mp_context (multiprocessing.context.BaseContext): The `multiprocessing`
+            context used to start the worker processes.
+    """
+
+    def __init__(
+        self,
+        dal_class: Type[DalBase],
+        dal_kwargs: Dict[str, Any],
+        num_workers: Optional[int] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+        logger_level: str = "DEBUG",
+    ):
+        """Initializes the executor.
+
+        Args:
+            dal_class (Type[DalBase]): The class of the DAL created in each
+                worker.
+            dal_kwargs (Dict[str, Any]): The keyword arguments the DAL of each
+                worker will be instantiated with.
+            num_workers (int, optional): The number of worker processes.
+                Defaults to `None` in which case the number of CPUs is used.
+            mp_context (multiprocessing.context.BaseContext, optional): The
+                `multiprocessing` context used to start the worker processes.
+                Defaults to `None` in which case the platform default is used.
+            logger_level (str, optional): Logging level as defined in the
+                `logging` package. Defaults to `DEBUG`.
+        """
+
+        self.logger = create_logger(
+            logger_name=type(self).__name__,
+            logger_level=logger_level,
+        )
+
+        self.dal_class = dal_class
+        self.dal_kwargs = dal_kwargs
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.mp_context = mp_context
+
+    def run(
+        self,
+        func: Callable[[DalBase, Any], Any],
+        items: List[Any],
+        key: Callable[[Any], Hashable],
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Processes work-items across the worker processes.
+
+        Note:
+            Both `func` and the work-items must be picklable, i.e., `func` must
+            be a module-level function.
+
+        Args:
+            func (Callable[[DalBase, Any], Any]): The function processing a
+                single work-item through the worker's DAL, e.g., ingesting a
+                study and returning its primary-key ID.
+            items (List[Any]): The work-items to be processed.
+            key (Callable[[Any], Hashable]): Function returning the sharding key
+                of a work-item.
+
+        Returns:
+            Tuple[List[Any], Dict[str, Any]]:
+                - The results of `func` in the order of `items`.
+                - The merged metrics of the run holding the total number of
+                  `items`, the wall-clock `duration`, and the metrics of each
+                  worker keyed by PID under `workers`.
+
+        Raises:
+            Exception: Any exception raised by `func` in a worker process.
+        """
+
+        self.logger.info(
+            f"Processing {len(items)} work-items across {self.num_workers} "
+            f"worker processes."
+        )
+
+        time_beg = time.time()
+
+        shards = shard_items(items=items, key=key, num_shards=self.num_workers)
+
+        results = [None] * len(items)
+        metrics = {"items": 0, "duration": None, "workers": {}}
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=self.mp_context,
+            initializer=_initialize_worker,
+            initargs=(self.dal_class, self.dal_kwargs),
+        ) as executor:
+            futures = [
+                executor.submit(_run_shard, func, shard)
+                for shard in shards if shard
+            ]
+
+            for future in concurrent.futures.as_completed(futures):
+                shard_results, shard_metrics = future.result()
+
+                # Place the results of the shard back in the order of `items`.
+                for idx, result in shard_results:
+                    results[idx] = result
+
+                # Merge the metrics of the shard into those of the worker.
+                worker_metrics = metrics["workers"].setdefault(
+                    shard_metrics["pid"],
+                    {"items": 0, "duration": 0.0},
+                )
+                worker_metrics["items"] += shard_metrics["items"]
+                worker_metrics["duration"] += shard_metrics["duration"]
+                metrics["items"] += shard_metrics["items"]
+
+        metrics["duration"] = time.time() - time_beg
+
+        self.logger.info(
+            f"Processed {metrics['items']} work-items in "
+            f"{metrics['duration']:.2f} seconds."
+        )
+
+        return results, metrics
@@ -0,0 +1,178 @@
+# coding: utf-8
+
+""" Lazy-load guard module.
+
+This module contains the `LazyLoadGuardQuery` class which sessions use in place
+of the default `Query` class to detect relationships being lazy-loaded, i.e.,
+relationships that were not eager-loaded by the query their parent object was
+retrieved through. Depending on the mode set under the session's `info`, lazy
+loads are counted, warned about with a sample of the calling stack, or raise a
+`LazyLoadError`. Lazy loads are counted per session and relationship so that
+N+1 query patterns can be reported.
+"""
+
+import warnings
+import traceback
+import collections
+from typing import Dict, Optional
+
+import sqlalchemy
+import sqlalchemy.orm
+
+from fform.excs import InvalidArgumentsError
+from fform.excs import LazyLoadError
+from fform.excs import LazyLoadWarning
+
+
+# The supported lazy-load modes.
+LAZY_LOAD_MODES = ("count", "warn", "raise")
+
+# The key of the session `info` entries holding the lazy-load mode and counter.
+_INFO_MODE = "lazy_load_mode"
+_INFO_COUNTER = "lazy_load_counter"
+
+# The number of frames sampled from the stack calling a lazy load.
+_STACK_SAMPLE_SIZE = 5
+
+
+def get_session_kwargs(lazy_load_mode: Optional[str]) -> Dict:
+    """Returns the `sessionmaker` keyword arguments enabling the guarding of
+    lazy loads in a given mode.
+
+    Args:
+        lazy_load_mode (str, optional): One of `count`, `warn`, or `raise`.
+            Defaults to `None` in which case lazy loads aren't guarded.
+
+    Returns:
+        Dict: The `sessionmaker` keyword arguments.
+
+    Raises:
+        InvalidArgumentsError: Raised if the mode is not supported.
+    """
+
+    if not lazy_load_mode:
+        return {}
+
+    if lazy_load_mode not in LAZY_LOAD_MODES:
+        raise InvalidArgumentsError(
+            f"Lazy-load mode '{lazy_load_mode}' not one of {LAZY_LOAD_MODES}."
+        )
+
+    return {
+        "query_cls": LazyLoadGuardQuery,
+        # Baked lazy loads bypass `Query.__iter__`.
+        "enable_baked_queries": False,
+        "info": {_INFO_MODE: lazy_load_mode},
+    }
+
+
+def get_lazy_load_counter(
+    session: sqlalchemy.orm.Session,
+) -> collections.Counter:
+    """Returns the number of lazy loads performed through a session keyed by
+    relationship, e.g., `Study.sponsors`.
+
+    Args:
+        session (sqlalchemy.orm.Session): The session.
+
+    Returns:
+        collections.Counter: The number of lazy loads per relationship.
+    """
+
+    return session.info.setdefault(_INFO_COUNTER, collections.Counter())
+
+
+def get_repeated_lazy_loads(
+    session: sqlalchemy.orm.Session,
+    threshold: int = 2,
+) -> Dict[str, int]:
+    """Returns the relationships lazy-loaded through a session at least a
+    given number of times, i.e., the likely N+1 query patterns.
+
+    Args:
+        session (sqlalchemy.orm.Session): The session.
+        threshold (int, optional): The minimum number of lazy loads of a
+            relationship. Defaults to `2`.
+
+    Returns:
+        Dict[str, int]: The number of lazy loads keyed by relationship in
+            descending order.
+    """
+
+    return {
+        key: count
+        for key, count in get_lazy_load_counter(session).most_common()
+        if count >= threshold
+    }
+
+
+def _get_relationship_key(query: sqlalchemy.orm.Query) -> str:
+    """Returns the `<class>.<relationship>` key of the relationship a query
+    lazy-loads."""
+
+    state = query.lazy_loaded_from
+    entity = query.column_descriptions[0]["entity"]
+    target_mapper = sqlalchemy.inspect(entity)
+
+    # The relationship being loaded targets the queried mapper and has no value
+    # under the parent object yet.
+    keys = [
+        relationship.key
+        for relationship in state.mapper.relationships
+        if target_mapper.isa(relationship.mapper)
+        and relationship.key not in state.dict
+    ]
+
+    return "{0}.{1}".format(
+        state.class_.__name__,
+        "|".join(keys) if keys else target_mapper.class_.__name__,
+    )
+
+
+def _sample_stack() -> str:
+    """Returns the innermost calling frames outside of SQLAlchemy and this
+    module."""
+
+    frames = [
+        frame for frame in traceback.extract_stack()
+        if "sqlalchemy" not in frame.filename
+        and frame.filename not in (__file__, "<string>")
+    ]
+
+    return "".join(traceback.format_list(frames[-_STACK_SAMPLE_SIZE:]))
+
+
+class LazyLoadGuardQuery(sqlalchemy.orm.Query):
+    """Query class counting, warning about, or disallowing lazy loads as per
+    the `lazy_load_mode` under the session's `info`."""
+
+    def __iter__(self):
+        if self.lazy_loaded_from is not None and self.session is not None:
+            self._guard_lazy_load()
+
+        return super(LazyLoadGuardQuery, self).__iter__()
+
+    def _guard_lazy_load(self) -> None:
+        """Counts the lazy load and warns or raises as per the session's
+        lazy-load mode."""
+
+        mode = self.session.info.get(_INFO_MODE)
+        if not mode:
+            return
+
+        key = _get_relationship_key(query=self)
+        counter = get_lazy_load_counter(session=self.session)
+        counter[key] += 1
+
+        if mode == "raise":
+            raise LazyLoadError(
+                f"Relationship '{key}' was lazy-loaded. Eager-load it through "
+                f"the query instead."
+            )
+        elif mode == "warn":
+            warnings.warn(
+                f"Relationship '{key}' was lazy-loaded (#{counter[key]} in "
+                f"this session) from:\n{_sample_stack()}",
+                LazyLoadWarning,
+                stacklevel=2,
+            )
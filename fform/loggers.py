@@ -12,8 +12,6 @@ import sys
 import logging
 import logging.handlers
 
-import colorlog
-
 
 def create_logger(
         logger_name,
@@ -74,25 +72,30 @@ def create_logger(
                 "%(levelname)-8s %(name)-10s %(funcName)s %(message)s")
     fmt = fmt_tmpl.format(project_name)
 
-    # Create a colourful formatter (should one be needed).
-    formatter_w_color = colorlog.ColoredFormatter(
-        fmt="%(log_color)s" + fmt,
-        datefmt="%Y-%m-%dT%H:%M:%SZ",
-        reset=True,
-        log_colors={
-            'DEBUG': 'blue',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        },
-        secondary_log_colors={},
-        style='%'
-    )
-
     # Create a formatter without colours.
     formatter_wo_color = logging.Formatter(fmt=fmt)
 
+    # Create a colourful formatter (should one be needed). The `colorlog`
+    # package is only imported when coloured logs are enabled.
+    formatter_w_color = None
+    if do_log_stdout and do_color_logs:
+        import colorlog
+
+        formatter_w_color = colorlog.ColoredFormatter(
+            fmt="%(log_color)s" + fmt,
+            datefmt="%Y-%m-%dT%H:%M:%SZ",
+            reset=True,
+            log_colors={
+                'DEBUG': 'blue',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            },
+            secondary_log_colors={},
+            style='%'
+        )
+
     # Create an 'stdout' logging handler, set its output format, and add to the
     # logger (if enabled).
     if do_log_stdout:
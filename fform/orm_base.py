@@ -4,11 +4,16 @@ from __future__ import unicode_literals
 
 import inspect
 import datetime
+import importlib
 import binascii
 import hashlib
-from typing import Dict, Any
+from typing import (
+    Dict, Any, Callable, NamedTuple, Optional, Type, Iterable, Set, Tuple, List
+)
 
 import sqlalchemy
+import sqlalchemy.event
+import sqlalchemy.orm
 import sqlalchemy.sql.sqltypes
 import sqlalchemy.types
 from sqlalchemy.sql.schema import Column
@@ -34,6 +39,175 @@ metadata = sqlalchemy.MetaData(
 # create declarative base
 Base = declarative_base(metadata=metadata)
 
+# Modules defining the ORM classes of the different schemata. The classes of
+# these schemata reference one another by name, e.g., `Study.descriptors` and
+# `Descriptor.studies`, so all modules need to be loaded before the mappers can
+# be configured.
+ORM_MODULES = [
+    "fform.orm_ct",
+    "fform.orm_mt",
+    "fform.orm_pubmed",
+    "fform.orm_app",
+    "fform.orm_mp",
+]
+
+
+def load_orm_modules() -> None:
+    """Imports all ORM modules registering their classes and tables under
+    `Base` and `metadata`.
+
+    Note:
+        ORM modules are otherwise only imported on demand so this function
+        should be called prior to operations requiring the complete `metadata`,
+        e.g., `metadata.create_all`.
+    """
+
+    for module_name in ORM_MODULES:
+        importlib.import_module(module_name)
+
+
+@sqlalchemy.event.listens_for(sqlalchemy.orm.mapper, "before_configured")
+def _load_orm_modules_before_configured():
+    """Loads all ORM modules before the mappers are first configured so that
+    relationships to classes defined in modules not yet imported resolve."""
+
+    load_orm_modules()
+
+
+class _Field(NamedTuple):
+    """Precompiled serialization details of a mapped attribute.
+
+    Attributes:
+        inspection (sqlalchemy.orm.interfaces.MapperProperty): The column or
+            relationship the attribute maps to.
+        convert (Callable[[Any], Any]): Function converting a scalar value of
+            the attribute into a serialisable one.
+        is_relationship (bool): Whether the attribute is a relationship.
+    """
+
+    inspection: Any
+    convert: Callable[[Any], Any]
+    is_relationship: bool
+
+
+# Precompiled `_Field` objects of each mapped class keyed by attribute name.
+_fields_cache = {}  # type: Dict[Type, Dict[str, _Field]]
+
+# Converters of `OrmBase._python_instance_convert` matching each Python type
+# or `None` when no conversion applies.
+_instance_converters_cache = {}  # type: Dict[Type, Optional[Callable]]
+
+
+class SerializationSpec(object):
+    """Specification of the attributes serialized by `OrmBase.to_dict`.
+
+    Attributes and relationships are referred to by dotted paths relative to
+    the serialized object, e.g., `nct_id` or `keywords.keyword` for a `Study`.
+    Only attributes already loaded are ever serialized, i.e., serialization
+    never triggers lazy loads, and objects are never serialized within
+    themselves so bidirectional relationships don't recurse indefinitely.
+
+    Examples:
+        Serializing a `Study` with the keywords of its keywords and the
+        facilities of its locations:
+
+        >>> study.to_dict(spec=SerializationSpec(
+        ...     include=["nct_id", "brief_title", "keywords.keyword"],
+        ...     relationships=["keywords", "locations.facility"],
+        ... ))
+    """
+
+    def __init__(
+        self,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        relationships: Optional[Iterable[str]] = None,
+        max_depth: Optional[int] = None,
+    ):
+        """Initializes the specification.
+
+        Args:
+            include (Iterable[str], optional): Paths of the attributes to be
+                serialized. Objects without any included attributes under
+                their path serialize all their columns. Defaults to `None` in
+                which case all attributes are serialized.
+            exclude (Iterable[str], optional): Paths of the attributes not to be
+                serialized. Defaults to `None`.
+            relationships (Iterable[str], optional): Paths of the relationships
+                to be followed regardless of `include`. Defaults to `None` in
+                which case all loaded relationships are followed.
+            max_depth (int, optional): The maximum number of relationships
+                followed from the serialized object. Defaults to `None` in
+                which case the depth is unbounded.
+        """
+
+        self.include = self._group_paths(include, True) if include else None
+        self.exclude = self._group_paths(exclude or [], False)
+        self.relationships = (
+            self._group_paths(relationships, True)
+            if relationships is not None else None
+        )
+        self.max_depth = max_depth
+
+    @staticmethod
+    def _group_paths(
+        paths: Iterable[str],
+        do_include_parents: bool,
+    ) -> Dict[Tuple[str, ...], Set[str]]:
+        """Groups dotted paths into the attribute names they refer to keyed by
+        the path of relationships leading to them.
+
+        Args:
+            paths (Iterable[str]): The dotted paths.
+            do_include_parents (bool): Whether the relationships leading to
+                each attribute are grouped as well.
+
+        Returns:
+            Dict[Tuple[str, ...], Set[str]]: The attribute names keyed by the
+                relationship path leading to them.
+        """
+
+        groups = {}
+        for path in paths:
+            names = path.split(".")
+            idx_beg = 0 if do_include_parents else len(names) - 1
+            for idx in range(idx_beg, len(names)):
+                groups.setdefault(tuple(names[:idx]), set()).add(names[idx])
+
+        return groups
+
+    def is_included(
+        self,
+        path: Tuple[str, ...],
+        name: str,
+        is_relationship: bool,
+    ) -> bool:
+        """Checks whether an attribute is to be serialized.
+
+        Args:
+            path (Tuple[str, ...]): The relationship path leading to the object
+                the attribute belongs to.
+            name (str): The name of the attribute.
+            is_relationship (bool): Whether the attribute is a relationship.
+
+        Returns:
+            bool: Whether the attribute is to be serialized.
+        """
+
+        if name in self.exclude.get(path, ()):
+            return False
+
+        if is_relationship:
+            if self.max_depth is not None and len(path) >= self.max_depth:
+                return False
+            if self.relationships is not None:
+                return name in self.relationships.get(path, ())
+
+        if self.include is None or path not in self.include:
+            return not is_relationship or self.include is None
+
+        return name in self.include[path]
+
 
 class OrmBase(object):
     # take sqla type and value, produce converted value
@@ -80,19 +254,106 @@ class OrmBase(object):
 
         return val
 
+    @staticmethod
+    def _get_instance_converter(value_type: Type) -> Optional[Callable]:
+        """Returns the `_python_instance_convert` converter applying to values
+        of a given type, caching it per type."""
+
+        try:
+            return _instance_converters_cache[value_type]
+        except KeyError:
+            pass
+
+        converter = None
+        for instance, instance_converter in (
+            OrmBase._python_instance_convert.items()
+        ):
+            if issubclass(value_type, instance):
+                converter = instance_converter
+                break
+
+        _instance_converters_cache[value_type] = converter
+
+        return converter
+
+    @staticmethod
+    def _compile_scalar_converter(
+        inspection: Any,
+    ) -> Callable[[Any], Any]:
+        """Compiles a function converting the scalar values of a column or
+        relationship into serialisable ones the same way `_dictify_scalar`
+        does."""
+
+        col_type = getattr(inspection, "type", None)
+        col_type_convert = None
+        if col_type is not None:
+            col_type_convert = OrmBase._sqla_types_convert.get(type(col_type))
+
+        get_instance_converter = OrmBase._get_instance_converter
+
+        def convert(scalar):
+            if scalar is None and col_type_convert is None:
+                return None
+
+            val = scalar
+            if col_type_convert is not None:
+                val = col_type_convert(col_type, scalar)
+
+            instance_converter = get_instance_converter(type(scalar))
+            if instance_converter is not None:
+                val = instance_converter(scalar)
+
+            return val
+
+        return convert
+
+    @classmethod
+    def _get_fields(cls) -> Dict[str, _Field]:
+        """Returns the precompiled `_Field` objects of the class' columns and
+        relationships keyed by attribute name.
+
+        The fields are compiled upon the first call for each class so that
+        serialization doesn't need to inspect the class on every call.
+        """
+
+        try:
+            return _fields_cache[cls]
+        except KeyError:
+            pass
+
+        mapper = sqlalchemy.inspect(cls)
+
+        fields = {}
+        for inspections, is_relationship in [
+            (mapper.c, False),
+            (mapper.relationships, True),
+        ]:
+            for name in inspections.keys():
+                # Skip private attributes and those already defined as columns.
+                if name.startswith("_") or name in fields:
+                    continue
+                inspection = inspections[name]
+                fields[name] = _Field(
+                    inspection=inspection,
+                    convert=cls._compile_scalar_converter(inspection),
+                    is_relationship=is_relationship,
+                )
+
+        _fields_cache[cls] = fields
+
+        return fields
+
     def _collect_attributes(self):
         """Return {column: (type,value)}. Handles removal of any
         meta/internal data that is not from our underlying table."""
 
         attributes = {}
 
-        obj_type = type(self)
-        column_inspection = sqlalchemy.inspect(obj_type).c
-        relationship_inspection = sqlalchemy.inspect(obj_type).relationships
+        fields = self._get_fields()
 
         for member_name, member_value in self.__dict__.items():
-            # drop magic sqla keys.
-            if member_name.startswith("_"):
+            field = fields.get(member_name)
+            if field is None:
                 continue
 
             if (
@@ -101,67 +362,137 @@ class OrmBase(object):
             ):
                 continue
 
-            if member_name in column_inspection:
-                member_inspection = column_inspection[member_name]
-            elif member_name in relationship_inspection:
-                member_inspection = relationship_inspection[member_name]
-            else:
-                continue
-
-            attributes[member_name] = (member_inspection, member_value)
+            attributes[member_name] = (field.inspection, member_value)
 
         return attributes
 
-    def to_dict(self, deep=False, serialisable=False):
+    def to_dict(
+        self,
+        deep: bool = False,
+        serialisable: bool = False,
+        spec: Optional[SerializationSpec] = None,
+    ) -> Dict[str, Any]:
+        """Converts the object into a `dict` of its loaded attributes.
 
-        results = {}
+        Args:
+            deep (bool, optional): Whether to serialize loaded relationships.
+                Defaults to `False`.
+            serialisable (bool, optional): Whether to convert values into
+                serialisable types. Defaults to `False`.
+            spec (SerializationSpec, optional): Specification of the attributes
+                and relationships to be serialized. Defaults to `None` in which
+                case all loaded attributes are serialized.
 
-        # walk top level
-        attributes = self._collect_attributes()
-        for attr_name, (attr_column, attr_value) in attributes.items():
+        Returns:
+            Dict[str, Any]: The serialized object.
+        """
 
-            # if value is compound type and deep=True
-            # recursively collect contents.
-            if isinstance(attr_value, OrmBase):
-                if not deep:
-                    continue
-                val = attr_value.to_dict(
-                    deep=deep,
-                    serialisable=serialisable
-                )
+        if deep or spec is not None:
+            return self._to_dict_spec(
+                spec=spec or SerializationSpec(),
+                serialisable=serialisable,
+                path=(),
+                visited=set(),
+            )
 
-            elif isinstance(attr_value, list):
-                if not deep:
-                    continue
+        results = {}
 
-                val = []
-                for sub_attr_value in attr_value:
-                    val.append(sub_attr_value.to_dict(
-                        deep=deep,
-                        serialisable=serialisable
-                    ))
+        fields = self._get_fields()
 
-            elif isinstance(attr_value, dict):
-                if not deep:
-                    continue
+        # walk top level
+        for attr_name, attr_value in self.__dict__.items():
+            field = fields.get(attr_name)
+            if field is None:
+                continue
 
-                val = {}
-                for sub_attr_name, sub_attr_value in attr_value.items():
-                    val[sub_attr_name] = sub_attr_value.to_dict(
-                        deep=deep,
-                        serialisable=serialisable
-                    )
+            # skip compound types which are only collected when deep=True.
+            if isinstance(attr_value, (OrmBase, list, dict)):
+                continue
 
             # value if scalar, perform any final conversions
+            if serialisable:
+                val = field.convert(attr_value)
             else:
-                val = self._dictify_scalar(
-                    scalar=attr_value,
-                    column=attr_column,
-                    serialisable=serialisable
+                val = attr_value
+
+            results[attr_name] = val
+
+        return results
+
+    def _to_dict_spec(
+        self,
+        spec: SerializationSpec,
+        serialisable: bool,
+        path: Tuple[str, ...],
+        visited: Set[int],
+    ) -> Dict[str, Any]:
+        """Converts the object into a `dict` as per a `SerializationSpec`.
+
+        Args:
+            spec (SerializationSpec): Specification of the attributes and
+                relationships to be serialized.
+            serialisable (bool): Whether to convert values into serialisable
+                types.
+            path (Tuple[str, ...]): The relationship path leading to the object.
+            visited (Set[int]): The identities of the objects being serialized
+                along the path which are skipped when encountered again.
+
+        Returns:
+            Dict[str, Any]: The serialized object.
+        """
+
+        results = {}
+
+        fields = self._get_fields()
+
+        visited.add(id(self))
+
+        # Only the loaded attributes under `__dict__` are accessed so that no
+        # lazy loads are triggered.
+        for attr_name, attr_value in self.__dict__.items():
+            field = fields.get(attr_name)
+            if field is None:
+                continue
+
+            if not spec.is_included(path, attr_name, field.is_relationship):
+                continue
+
+            if not field.is_relationship:
+                if serialisable:
+                    results[attr_name] = field.convert(attr_value)
+                else:
+                    results[attr_name] = attr_value
+                continue
+
+            attr_path = path + (attr_name,)
+
+            if attr_value is None:
+                val = None
+            elif isinstance(attr_value, OrmBase):
+                if id(attr_value) in visited:
+                    continue
+                val = attr_value._to_dict_spec(
+                    spec, serialisable, attr_path, visited,
                 )
+            elif isinstance(attr_value, dict):
+                val = {
+                    key: value._to_dict_spec(
+                        spec, serialisable, attr_path, visited,
+                    )
+                    for key, value in attr_value.items()
+                    if id(value) not in visited
+                }
+            else:
+                val = [
+                    value._to_dict_spec(spec, serialisable, attr_path, visited)
+                    for value in attr_value
+                    if id(value) not in visited
+                ]
 
             results[attr_name] = val
 
+        visited.discard(id(self))
+
         return results
 
     def to_string(self, deep=False):
@@ -202,6 +533,10 @@ class OrmBase(object):
 
 class OrmFightForBase(OrmBase):
 
+    # Names of the attributes the `md5` hash of the records is calculated over
+    # for classes defining an `md5` column.
+    _md5_attrs = []  # type: List[str]
+
     @classmethod
     def get_pk(cls) -> Column:
         """Returns the class' primary-key attribute.
@@ -282,9 +617,106 @@ class OrmFightForBase(OrmBase):
             values_concatenated = values_concatenated.lower()
 
         # Encode the concatenated values to UTF8.
-        values_encoded = values_concatenated.lower().encode("utf-8")
+        values_encoded = values_concatenated.encode("utf-8")
 
         # Calculate the MD5 hash and retrieve the binary digest.
         md5 = hashlib.md5(values_encoded).digest()
 
         return md5
+
+    @classmethod
+    def calculate_md5_batch(
+        cls,
+        rows: List[Dict[str, Any]],
+        keys: Optional[List[str]] = None,
+        do_lowercase: bool = True,
+    ) -> List[bytes]:
+        """Calculates the MD5 hashes of a batch of rows as per the
+        `calculate_md5` method.
+
+        The keys are sorted once for the entire batch so that bulk loaders can
+        hash their rows without creating ORM objects.
+
+        Args:
+            rows (List[Dict[str, Any]]): The rows of name:value pairs over which
+                the hashes will be calculated.
+            keys (List[str], optional): The names of the values over which the
+                hashes will be calculated. Defaults to `None` in which case the
+                attributes the `md5` hash of the class' records is calculated
+                over are used.
+            do_lowercase (bool, optional): Whether to calculate the hashes on
+                the lowercased version of the concatenated values. Defaults to
+                `True` as is the case for the `md5` hash of records.
+
+        Returns:
+            List[bytes]: The binary digests of the calculated MD5 hashes in the
+                order of `rows`.
+        """
+
+        # Sort the attribute names once for the entire batch.
+        keys_sorted = sorted(keys if keys is not None else cls._md5_attrs)
+
+        md5 = hashlib.md5
+
+        md5s = []
+        for row in rows:
+            values_concatenated = " ".join(
+                [str(row[key]) for key in keys_sorted]
+            )
+            if do_lowercase:
+                values_concatenated = values_concatenated.lower()
+            md5s.append(md5(values_concatenated.encode("utf-8")).digest())
+
+        return md5s
+
+    def update_md5(self) -> Optional[bytes]:
+        """Calculates the MD5 hash of the record over its `_md5_attrs`
+        attributes and updates its `md5` attribute.
+
+        The hash is calculated automatically before the record is inserted or
+        updated through the ORM but needs to be calculated through this method
+        when the record's attributes are used to build Core statements.
+
+        Returns:
+            bytes: The binary digest of the calculated MD5 hash or `None` if
+                the class defines no `_md5_attrs`.
+        """
+
+        if not self._md5_attrs:
+            return None
+
+        # Assemble the class attributes into a `dict`.
+        attrs = {name: getattr(self, name) for name in self._md5_attrs}
+
+        # Calculate and update the `md5` attribute.
+        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
+
+        return self.md5
+
+
+@sqlalchemy.event.listens_for(OrmFightForBase, "before_insert", propagate=True)
+def _update_md5_before_insert(mapper, connection, target):
+    """Calculates the MD5 hash of records once prior to them being inserted."""
+
+    target.update_md5()
+
+
+@sqlalchemy.event.listens_for(OrmFightForBase, "before_update", propagate=True)
+def _update_md5_before_update(mapper, connection, target):
+    """Recalculates the MD5 hash of records prior to them being updated should
+    any of their `_md5_attrs` attributes have changed.
+
+    Records whose hashed attributes are unchanged are skipped so that deferred
+    columns, e.g., `DescriptorDefinition.definition`, aren't loaded during the
+    flush.
+    """
+
+    if not target._md5_attrs:
+        return
+
+    state = sqlalchemy.inspect(target)
+    if any(
+        state.attrs[name].history.has_changes()
+        for name in target._md5_attrs
+    ):
+        target.update_md5()
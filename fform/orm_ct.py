@@ -331,23 +331,11 @@ class Sponsor(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "agency",
         "agency_class",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "agency": self.agency,
-            "agency_class": self.agency_class,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Keyword(Base, OrmFightForBase):
@@ -402,22 +390,18 @@ class Keyword(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "keyword",
+    ]
+
     @sqlalchemy.orm.validates("keyword")
-    def update_md5(self, key, value):
+    def lowercase_value(self, key, value):
 
         # Enforce lowercasing of the value in order to avoid needless
         # duplication when the keyword is provided with different casing.
         value = value.lower() if value else None
 
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "keyword": self.keyword,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
         return value
 
 
@@ -473,22 +457,18 @@ class Condition(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "condition",
+    ]
+
     @sqlalchemy.orm.validates("condition")
-    def update_md5(self, key, value):
+    def lowercase_value(self, key, value):
 
         # Enforce lowercasing of the value in order to avoid needless
         # duplication when the keyword is provided with different casing.
         value = value.lower() if value else None
 
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "condition": self.condition,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
         return value
 
 
@@ -601,28 +581,14 @@ class Facility(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "name",
         "city",
         "state",
         "zip_code",
         "country",
-    )
-    def update_md5(self, key, value):
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "name": self.name,
-            "city": self.city,
-            "state": self.state,
-            "zip_code": self.zip_code,
-            "country": self.country,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Person(Base, OrmFightForBase):
@@ -698,26 +664,13 @@ class Person(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "name_first",
         "name_middle",
         "name_last",
         "degrees",
-    )
-    def update_md5(self, key, value):
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "name_first": self.name_first,
-            "name_middle": self.name_middle,
-            "name_last": self.name_last,
-            "degrees": self.degrees,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Contact(Base, OrmFightForBase):
@@ -784,29 +737,20 @@ class Contact(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "person_id",
         "phone",
         "phone_ext",
         "email",
-    )
-    def update_md5(self, key, value):
+    ]
+
+    @sqlalchemy.orm.validates("email")
+    def lowercase_value(self, key, value):
 
         # Enforce lowercasing of the email value in order to avoid needless
         # duplication when the keyword is provided with different casing.
-        if key == "email":
-            value = value.lower() if value else None
-
-        attrs = {
-            "person_id": self.person_id,
-            "phone": self.phone,
-            "phone_ext": self.phone_ext,
-            "email": self.email,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
+        value = value.lower() if value else None
 
         return value
 
@@ -891,24 +835,12 @@ class Investigator(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "person_id",
         "role",
         "affiliation",
-    )
-    def update_md5(self, key, value):
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "person_id": self.person_id,
-            "role": self.role,
-            "affiliation": self.affiliation,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Location(Base, OrmFightForBase):
@@ -1014,24 +946,12 @@ class Location(Base, OrmFightForBase):
         {"schema": "clinicaltrials"},
     )
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "facility_id",
         "contact_primary_id",
         "contact_backup_id",
-    )
-    def update_md5(self, key, value):
-
-        attrs = {
-            "facility_id": self.facility_id,
-            "contact_primary_id": self.contact_primary_id,
-            "contact_backup_id": self.contact_backup_id,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class LocationInvestigator(Base, OrmFightForBase):
@@ -1518,23 +1438,12 @@ class Intervention(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "intervention_type",
         "name",
         "description",
-    )
-    def update_md5(self, key, value):
-        attrs = {
-            "intervention_type": self.intervention_type,
-            "name": self.name,
-            "description": self.description,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Alias(Base, OrmFightForBase):
@@ -1596,22 +1505,18 @@ class Alias(Base, OrmFightForBase):
         "schema": "clinicaltrials",
     }
 
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "alias",
+    ]
+
     @sqlalchemy.orm.validates("alias")
-    def update_md5(self, key, value):
+    def lowercase_value(self, key, value):
 
         # Enforce lowercasing of the value in order to avoid needless
         # duplication when the keyword is provided with different casing.
         value = value.lower() if value else None
 
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "alias": self.alias,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
         return value
 
 
@@ -1717,11 +1622,15 @@ class Eligibility(Base, OrmFightForBase):
         nullable=True,
     )
 
-    # Referring to the value of the `<criteria>` element.
-    criteria = sqlalchemy.Column(
-        name="criteria",
-        type_=sqlalchemy.types.UnicodeText(),
-        nullable=True,
+    # Referring to the value of the `<criteria>` element (deferred under the
+    # `criteria` group).
+    criteria = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="criteria",
+            type_=sqlalchemy.types.UnicodeText(),
+            nullable=True,
+        ),
+        group="criteria",
     )
 
     # Referring to the value of the `<gender>` attribute.
@@ -1762,6 +1671,24 @@ class Eligibility(Base, OrmFightForBase):
         index=True,
     )
 
+    # The minimum age in days parsed from `minimum_age`, `NULL` when no
+    # minimum age applies.
+    minimum_age_days = sqlalchemy.Column(
+        name="minimum_age_days",
+        type_=sqlalchemy.types.Integer(),
+        nullable=True,
+        index=True,
+    )
+
+    # The maximum age in days parsed from `maximum_age`, `NULL` when no
+    # maximum age applies.
+    maximum_age_days = sqlalchemy.Column(
+        name="maximum_age_days",
+        type_=sqlalchemy.types.Integer(),
+        nullable=True,
+        index=True,
+    )
+
     # Referring to the value of the `<healthy_volunteers>` element.
     healthy_volunteers = sqlalchemy.Column(
         name="healthy_volunteers",
@@ -2304,18 +2231,26 @@ class Study(Base, OrmFightForBase):
         uselist=False,
     )
 
-    # Referring to the value of the `<brief_summary>` element.
-    brief_summary = sqlalchemy.Column(
-        name="brief_summary",
-        type_=sqlalchemy.types.UnicodeText(),
-        nullable=True,
+    # Referring to the value of the `<brief_summary>` element (deferred under
+    # the `descriptions` group).
+    brief_summary = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="brief_summary",
+            type_=sqlalchemy.types.UnicodeText(),
+            nullable=True,
+        ),
+        group="descriptions",
     )
 
-    # Referring to the value of the `<detailed_description>` element.
-    detailed_description = sqlalchemy.Column(
-        name="detailed_description",
-        type_=sqlalchemy.types.UnicodeText(),
-        nullable=True,
+    # Referring to the value of the `<detailed_description>` element (deferred
+    # under the `descriptions` group).
+    detailed_description = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="detailed_description",
+            type_=sqlalchemy.types.UnicodeText(),
+            nullable=True,
+        ),
+        group="descriptions",
     )
 
     # Referring to the value of the `<overall_status>` element.
@@ -2519,6 +2454,7 @@ class Study(Base, OrmFightForBase):
         sqlalchemy.ForeignKey("clinicaltrials.eligibilities.eligibility_id"),
         name="eligibility_id",
         nullable=True,
+        index=True,
     )
 
     # Relationship to an `Elligibility` record.
@@ -2717,10 +2653,26 @@ class Study(Base, OrmFightForBase):
     # TODO: clinical_results
 
     # Set table arguments.
-    __table_args__ = {
+    __table_args__ = (
+        # Add a composite index on the status and phase filters of study
+        # searches ending in the study ID they are paginated by.
+        sqlalchemy.Index(
+            "ix_clinicaltrials_studies_overall_status_phase_study_id",
+            "overall_status",
+            "phase",
+            "study_id",
+        ),
+        # Add a partial index on the start date of recruiting studies which
+        # most searches are limited to.
+        sqlalchemy.Index(
+            "ix_clinicaltrials_studies_start_date_recruiting",
+            "start_date",
+            "study_id",
+            postgresql_where=overall_status == OverallStatusType.RECRUITING,
+        ),
         # Set table schema.
-        "schema": "clinicaltrials",
-    }
+        {"schema": "clinicaltrials"}
+    )
 
 
 class StudySecondaryId(Base, OrmFightForBase):
@@ -3368,6 +3320,13 @@ class StudyDescriptor(Base, OrmFightForBase):
     __table_args__ = (
         # Set unique constraint.
         sqlalchemy.UniqueConstraint('study_id', 'descriptor_id'),
+        # Add an index on the descriptor ID and study ID so that the studies
+        # of a set of descriptors are retrieved through an index-only scan.
+        sqlalchemy.Index(
+            "ix_clinicaltrials_study_descriptors_descriptor_id_study_id",
+            "descriptor_id",
+            "study_id",
+        ),
         # Set table schema.
         {"schema": "clinicaltrials"},
     )
@@ -3716,10 +3675,17 @@ class FacilityCanonical(Base, OrmFightForBase):
     )
 
     # Set table arguments.
-    __table_args__ = {
+    __table_args__ = (
+        # Add a GiST index on the coordinates cast to `geography` used by
+        # radius and nearest-neighbour searches in meters.
+        sqlalchemy.Index(
+            "ix_clinicaltrials_facilities_canonical_coordinates_geography",
+            sqlalchemy.func.geography(coordinates),
+            postgresql_using="gist",
+        ),
         # Set table schema.
-        "schema": "clinicaltrials",
-    }
+        {"schema": "clinicaltrials"}
+    )
 
 
 class StudyFacility(Base, OrmFightForBase):
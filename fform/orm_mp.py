@@ -674,9 +674,13 @@ class HealthTopic(Base, OrmFightForBase):
         name="description", type_=sqlalchemy.types.UnicodeText(), nullable=False
     )
 
-    # Referring to the `<full-summary>` element.
-    summary = sqlalchemy.Column(
-        name="summary", type_=sqlalchemy.types.UnicodeText(), nullable=True
+    # Referring to the `<full-summary>` element (deferred under the `summary`
+    # group).
+    summary = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="summary", type_=sqlalchemy.types.UnicodeText(), nullable=True
+        ),
+        group="summary",
     )
 
     date_created = sqlalchemy.Column(
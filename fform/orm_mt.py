@@ -188,19 +188,10 @@ class TreeNumber(Base, OrmFightForBase):
         "schema": "mesh"
     }
 
-    @sqlalchemy.orm.validates("tree_number")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "tree_number": self.tree_number,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "tree_number",
+    ]
 
 
 class ThesaurusId(Base, OrmFightForBase):
@@ -254,19 +245,10 @@ class ThesaurusId(Base, OrmFightForBase):
         "schema": "mesh"
     }
 
-    @sqlalchemy.orm.validates("thesaurus_id")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "thesaurus_id": self.thesaurus_id,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "thesaurus_id",
+    ]
 
 
 class Term(Base, OrmFightForBase):
@@ -475,19 +457,10 @@ class RelatedRegistryNumber(Base, OrmFightForBase):
         "schema": "mesh"
     }
 
-    @sqlalchemy.orm.validates("related_registry_number")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "related_registry_number": self.related_registry_number,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "related_registry_number",
+    ]
 
 
 class Concept(Base, OrmFightForBase):
@@ -1135,19 +1108,10 @@ class PreviousIndexing(Base, OrmFightForBase):
         "schema": "mesh"
     }
 
-    @sqlalchemy.orm.validates("previous_indexing")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "previous_indexing": self.previous_indexing,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "previous_indexing",
+    ]
 
 
 class EntryCombination(Base, OrmFightForBase):
@@ -1863,19 +1827,10 @@ class Source(Base, OrmFightForBase):
         "schema": "mesh"
     }
 
-    @sqlalchemy.orm.validates("source")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "source": self.source,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "source",
+    ]
 
 
 class Supplemental(Base, OrmFightForBase):
@@ -2344,19 +2299,10 @@ class DescriptorSynonym(Base, OrmFightForBase):
         {"schema": "mesh"}
     )
 
-    @sqlalchemy.orm.validates("synonym")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "synonym": self.synonym,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "synonym",
+    ]
 
 
 class DescriptorDefinition(Base, OrmFightForBase):
@@ -2388,11 +2334,14 @@ class DescriptorDefinition(Base, OrmFightForBase):
         index=True,
     )
 
-    # The descriptor synonym.
-    definition = sqlalchemy.Column(
-        name="definition",
-        type_=sqlalchemy.types.UnicodeText(),
-        nullable=False,
+    # The descriptor definition (deferred under the `definition` group).
+    definition = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="definition",
+            type_=sqlalchemy.types.UnicodeText(),
+            nullable=False,
+        ),
+        group="definition",
     )
 
     # MD5 hash of the description.
@@ -2422,16 +2371,7 @@ class DescriptorDefinition(Base, OrmFightForBase):
         {"schema": "mesh"}
     )
 
-    @sqlalchemy.orm.validates("definition")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "definition": self.definition,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "definition",
+    ]
@@ -88,11 +88,15 @@ class AbstractText(Base, OrmFightForBase):
         index=True,
     )
 
-    # Abstract text (value of the `<AbstractText>` element).
-    text = sqlalchemy.Column(
-        name="text",
-        type_=sqlalchemy.types.Unicode(),
-        nullable=True,
+    # Abstract text (value of the `<AbstractText>` element) deferred under the
+    # `text` group.
+    text = sqlalchemy.orm.deferred(
+        sqlalchemy.Column(
+            name="text",
+            type_=sqlalchemy.types.Unicode(),
+            nullable=True,
+        ),
+        group="text",
     )
 
     # MD5 hash of the abstract text.
@@ -117,25 +121,12 @@ class AbstractText(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "label",
         "category",
         "text",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "label": self.label,
-            "category": self.category,
-            "text": self.text,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class AccessionNumber(Base, OrmFightForBase):
@@ -176,19 +167,10 @@ class AccessionNumber(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates("accession_number")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "accession_number": self.accession_number,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "accession_number",
+    ]
 
 
 class Affiliation(Base, OrmFightForBase):
@@ -269,25 +251,12 @@ class Affiliation(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "affiliation",
         "affiliation_identifier",
         "affiliation_identifier_source",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "affiliation": self.affiliation,
-            "affiliation_identifier": self.affiliation_identifier,
-            "affiliation_identifier_source": self.affiliation_identifier_source,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Article(Base, OrmFightForBase):
@@ -460,7 +429,8 @@ class Article(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "publication_year",
         "publication_month",
         "publication_day",
@@ -473,30 +443,7 @@ class Article(Base, OrmFightForBase):
         "pagination",
         "language",
         "title_vernacular",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "publication_year": self.publication_year,
-            "publication_month": self.publication_month,
-            "publication_day": self.publication_day,
-            "date_published": self.date_published,
-            "publication_model": self.publication_model,
-            "journal_id": self.journal_id,
-            "journal_volume": self.journal_volume,
-            "journal_issue": self.journal_issue,
-            "title": self.title,
-            "pagination": self.pagination,
-            "language": self.language,
-            "title_vernacular": self.title_vernacular,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class ArticleAbstractText(Base, OrmFightForBase):
@@ -1022,31 +969,15 @@ class Author(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "author_identifier",
         "name_first",
         "name_initials",
         "name_last",
         "name_suffix",
         "email",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "author_identifier": self.author_identifier,
-            "name_first": self.name_first,
-            "name_initials": self.name_initials,
-            "name_last": self.name_last,
-            "name_suffix": self.name_suffix,
-            "email": self.email,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Citation(Base, OrmFightForBase):
@@ -1205,19 +1136,10 @@ class Databank(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates("databank")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "databank": self.databank,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "databank",
+    ]
 
 
 class Grant(Base, OrmFightForBase):
@@ -1285,27 +1207,13 @@ class Grant(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "uid",
         "acronym",
         "agency",
         "country",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "uid": self.uid,
-            "acronym": self.acronym,
-            "agency": self.agency,
-            "country": self.country,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class Journal(Base, OrmFightForBase):
@@ -1374,27 +1282,13 @@ class Journal(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates(
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
         "issn_type",
         "issn",
         "title",
         "abbreviation",
-    )
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "issn_type": self.issn_type,
-            "issn": self.issn,
-            "title": self.title,
-            "abbreviation": self.abbreviation,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    ]
 
 
 class JournalInfo(Base, OrmFightForBase):
@@ -1493,19 +1387,10 @@ class PmKeyword(Base, OrmFightForBase):
         "schema": "pubmed"
     }
 
-    @sqlalchemy.orm.validates("keyword")
-    def update_md5(self, key, value):
-
-        # Assemble the class attributes into a `dict`.
-        attrs = {
-            "keyword": self.keyword,
-        }
-        attrs[key] = value
-
-        # Calculate and update the `md5` attribute.
-        self.md5 = self.calculate_md5(attrs=attrs, do_lowercase=True)
-
-        return value
+    # Names of the attributes the `md5` hash is calculated over.
+    _md5_attrs = [
+        "keyword",
+    ]
 
 
 class PublicationType(Base, OrmFightForBase):
@@ -0,0 +1,94 @@
+# coding: utf-8
+
+""" Read-model module.
+
+This module contains functions generating lightweight read-model classes from
+the tables of ORM classes. Read-model classes are named tuples holding only the
+column values of a record, i.e., they carry none of the instrumentation,
+identity-map, and state of ORM objects, which makes them cheap to create and
+hold in memory when serving read-only listings. Records are created directly
+from the rows of a Core select.
+"""
+
+import collections
+from typing import Iterable, List, Type
+
+import sqlalchemy
+from sqlalchemy.sql import Select
+
+from fform.orm_base import OrmBase
+
+
+# Read-model classes generated for each ORM class.
+_read_models = {}
+
+
+def get_read_model(orm_class: Type[OrmBase]) -> Type[tuple]:
+    """Returns the read-model class of an ORM class generating it upon the
+    first call.
+
+    The read-model class is a named tuple, named after the ORM class with a
+    `Record` suffix, e.g., `StudyRecord`, whose fields are the column
+    attributes of the ORM class in mapper order.
+
+    Args:
+        orm_class (Type[OrmBase]): The ORM class.
+
+    Returns:
+        Type[tuple]: The read-model class.
+    """
+
+    try:
+        return _read_models[orm_class]
+    except KeyError:
+        pass
+
+    mapper = sqlalchemy.inspect(orm_class)
+
+    read_model = collections.namedtuple(
+        "{0}Record".format(orm_class.__name__),
+        mapper.c.keys(),
+    )
+    read_model.__doc__ = "Read-model record of the `{0}` class.".format(
+        orm_class.__name__,
+    )
+    # Keep the columns the fields are selected from.
+    read_model._columns = list(mapper.c.values())
+    read_model._orm_class = orm_class
+
+    _read_models[orm_class] = read_model
+
+    return read_model
+
+
+def select_read_model(orm_class: Type[OrmBase]) -> Select:
+    """Returns a Core select of the columns of an ORM class' read-model in
+    field order.
+
+    Args:
+        orm_class (Type[OrmBase]): The ORM class.
+
+    Returns:
+        Select: The select statement whose rows can be converted into records
+            through the `rows_to_records` function.
+    """
+
+    return sqlalchemy.select(get_read_model(orm_class)._columns)
+
+
+def rows_to_records(
+    orm_class: Type[OrmBase],
+    rows: Iterable[Iterable],
+) -> List[tuple]:
+    """Converts the rows of a `select_read_model` select into read-model
+    records.
+
+    Args:
+        orm_class (Type[OrmBase]): The ORM class.
+        rows (Iterable[Iterable]): The rows, e.g., a `ResultProxy`.
+
+    Returns:
+        List[tuple]: The read-model records.
+    """
+
+    return list(map(get_read_model(orm_class)._make, rows))
@@ -0,0 +1,257 @@
+# coding: utf-8
+
+""" Server-side MD5 hashing module.
+
+This module contains functions setting up a schema mode where the `md5`
+columns of the classes defining `_md5_attrs` are calculated by PostgreSQL
+through `BEFORE INSERT OR UPDATE` row triggers. The triggers calculate the same
+hash as the `OrmFightForBase.calculate_md5` method so that loaders can insert
+raw values, without hashing them first, and rely on the existing unique
+constraints of the `md5` columns to deduplicate them on the server.
+
+Note:
+    Triggers are used instead of generated columns or expression indexes as
+    the casting of enumerations and dates to text is not immutable in
+    PostgreSQL, and as the existing `md5` columns, their constraints, and
+    `ON CONFLICT` clauses are left unchanged.
+"""
+
+from typing import List, Optional, Type, Union
+
+import sqlalchemy
+import sqlalchemy.types
+from sqlalchemy.dialects import postgresql
+
+from fform.orm_base import OrmFightForBase
+from fform.orm_base import load_orm_modules
+
+
+# The identifier preparer used to quote the table and column names.
+_preparer = postgresql.dialect().identifier_preparer
+
+
+def get_md5_classes() -> List[Type[OrmFightForBase]]:
+    """Returns all ORM classes whose `md5` hash is calculated over a set of
+    attributes.
+
+    Returns:
+        List[Type[OrmFightForBase]]: The ORM classes defining `_md5_attrs`.
+    """
+
+    load_orm_modules()
+
+    orm_classes = []
+    subclasses = list(OrmFightForBase.__subclasses__())
+    while subclasses:
+        subclass = subclasses.pop(0)
+        if subclass._md5_attrs and hasattr(subclass, "__table__"):
+            orm_classes.append(subclass)
+        subclasses.extend(subclass.__subclasses__())
+
+    return orm_classes
+
+
+def _value_expression(column: sqlalchemy.Column, row_alias: str) -> str:
+    """Returns the SQL expression converting a column value into the same text
+    as `str` in Python.
+
+    Args:
+        column (sqlalchemy.Column): The column.
+        row_alias (str): The alias of the row the column belongs to.
+
+    Returns:
+        str: The SQL expression.
+
+    Raises:
+        ValueError: If the column type has no equivalent conversion.
+    """
+
+    value = "{0}.{1}".format(row_alias, _preparer.quote(column.name))
+    column_type = column.type
+
+    if isinstance(column_type, sqlalchemy.types.Enum):
+        # Enumeration members are stored by name while `str` prefixes the
+        # member name with the enumeration name.
+        expression = "'{0}.' || CAST({1} AS TEXT)".format(
+            column_type.enum_class.__name__,
+            value,
+        )
+    elif isinstance(column_type, sqlalchemy.types.DateTime):
+        raise ValueError(
+            "Column `{0}` of type `{1}` cannot be hashed on the server.".format(
+                column.name,
+                type(column_type).__name__,
+            )
+        )
+    elif isinstance(column_type, sqlalchemy.types.Date):
+        expression = "TO_CHAR({0}, 'YYYY-MM-DD')".format(value)
+    elif isinstance(
+        column_type,
+        (sqlalchemy.types.String, sqlalchemy.types.Integer),
+    ):
+        expression = "CAST({0} AS TEXT)".format(value)
+    else:
+        raise ValueError(
+            "Column `{0}` of type `{1}` cannot be hashed on the server.".format(
+                column.name,
+                type(column_type).__name__,
+            )
+        )
+
+    # `str(None)` is `'None'` in Python.
+    return "COALESCE({0}, 'None')".format(expression)
+
+
+def md5_expression(
+    orm_class: Type[OrmFightForBase],
+    row_alias: str = "NEW",
+) -> str:
+    """Returns the SQL expression calculating the `md5` hash of a record the
+    same way as the `OrmFightForBase.calculate_md5` method.
+
+    Args:
+        orm_class (Type[OrmFightForBase]): The ORM class defining `_md5_attrs`.
+        row_alias (str, optional): The alias of the row the hashed columns
+            belong to. Defaults to `NEW` as used in triggers.
+
+    Returns:
+        str: The SQL expression evaluating to the binary MD5 digest.
+    """
+
+    mapper = sqlalchemy.inspect(orm_class)
+
+    # Concatenate the column values in order of the sorted attribute names.
+    values = [
+        _value_expression(column=mapper.c[name], row_alias=row_alias)
+        for name in sorted(orm_class._md5_attrs)
+    ]
+    values_concatenated = " || ' ' || ".join(values)
+
+    return "DECODE(MD5(LOWER({0})), 'hex')".format(values_concatenated)
+
+
+def _get_names(orm_class: Type[OrmFightForBase]) -> dict:
+    """Returns the quoted names of the table, trigger function, and trigger of
+    an ORM class."""
+
+    table = orm_class.__table__
+    schema = _preparer.quote_schema(table.schema) if table.schema else None
+    function_name = _preparer.quote("{0}_md5".format(table.name))
+    trigger_name = _preparer.quote("tr_{0}_md5".format(table.name))
+
+    return {
+        "table": _preparer.format_table(table),
+        "function": (
+            "{0}.{1}".format(schema, function_name)
+            if schema else function_name
+        ),
+        "trigger": trigger_name,
+    }
+
+
+def md5_trigger_statements(orm_class: Type[OrmFightForBase]) -> List[str]:
+    """Returns the DDL statements creating the trigger that calculates the
+    `md5` hash of the records of an ORM class.
+
+    Args:
+        orm_class (Type[OrmFightForBase]): The ORM class defining `_md5_attrs`.
+
+    Returns:
+        List[str]: The DDL statements.
+    """
+
+    names = _get_names(orm_class=orm_class)
+
+    return [
+        (
+            "CREATE OR REPLACE FUNCTION {function}() RETURNS TRIGGER AS $$ "
+            "BEGIN NEW.md5 := {expression}; RETURN NEW; END; "
+            "$$ LANGUAGE plpgsql"
+        ).format(
+            function=names["function"],
+            expression=md5_expression(orm_class=orm_class),
+        ),
+        "DROP TRIGGER IF EXISTS {trigger} ON {table}".format(**names),
+        (
+            "CREATE TRIGGER {trigger} BEFORE INSERT OR UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE PROCEDURE {function}()"
+        ).format(**names),
+    ]
+
+
+def create_md5_triggers(
+    connectable: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
+    orm_classes: Optional[List[Type[OrmFightForBase]]] = None,
+) -> None:
+    """Creates the triggers calculating the `md5` hashes of records on the
+    server.
+
+    Args:
+        connectable (Union[sqlalchemy.engine.Engine,
+            sqlalchemy.engine.Connection]): The engine or connection through
+            which the triggers will be created.
+        orm_classes (List[Type[OrmFightForBase]], optional): The ORM classes
+            whose tables the triggers will be created on. Defaults to `None`
+            in which case all classes defining `_md5_attrs` are used.
+    """
+
+    if orm_classes is None:
+        orm_classes = get_md5_classes()
+
+    for orm_class in orm_classes:
+        for statement in md5_trigger_statements(orm_class=orm_class):
+            connectable.execute(sqlalchemy.DDL(statement))
+
+
+def drop_md5_triggers(
+    connectable: Union[sqlalchemy.engine.Engine, sqlalchemy.engine.Connection],
+    orm_classes: Optional[List[Type[OrmFightForBase]]] = None,
+) -> None:
+    """Drops the triggers calculating the `md5` hashes of records on the
+    server.
+
+    Args:
+        connectable (Union[sqlalchemy.engine.Engine,
+            sqlalchemy.engine.Connection]): The engine or connection through
+            which the triggers will be dropped.
+        orm_classes (List[Type[OrmFightForBase]], optional): The ORM classes
+            whose tables the triggers will be dropped from. Defaults to `None`
+            in which case all classes defining `_md5_attrs` are used.
+    """
+
+    if orm_classes is None:
+        orm_classes = get_md5_classes()
+
+    for orm_class in orm_classes:
+        names = _get_names(orm_class=orm_class)
+        connectable.execute(sqlalchemy.DDL(
+            "DROP TRIGGER IF EXISTS {trigger} ON {table}".format(**names)
+        ))
+        connectable.execute(sqlalchemy.DDL(
+            "DROP FUNCTION IF EXISTS {function}()".format(**names)
+        ))
+
+
+def attach_md5_triggers(
+    orm_classes: Optional[List[Type[OrmFightForBase]]] = None,
+) -> None:
+    """Attaches the creation of the triggers calculating the `md5` hashes of
+    records to the creation of their tables, e.g., through
+    `metadata.create_all`.
+
+    Args:
+        orm_classes (List[Type[OrmFightForBase]], optional): The ORM classes
+            whose tables the triggers will be created on. Defaults to `None`
+            in which case all classes defining `_md5_attrs` are used.
+    """
+
+    if orm_classes is None:
+        orm_classes = get_md5_classes()
+
+    for orm_class in orm_classes:
+        for statement in md5_trigger_statements(orm_class=orm_class):
+            sqlalchemy.event.listen(
+                orm_class.__table__,
+                "after_create",
+                sqlalchemy.DDL(statement).execute_if(dialect="postgresql"),
+            )
@@ -1,13 +1,60 @@
 # -*- coding: utf-8 -*-
 
+import re
 import enum
+import math
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 
 from fform.excs import InvalidArgumentsError
 
 
+# The number of days per unit of the free-text eligibility ages, e.g.,
+# `18 Years` or `6 Months`.
+AGE_UNIT_DAYS = {
+    "year": 365.25,
+    "month": 30.4375,
+    "week": 7.0,
+    "day": 1.0,
+    "hour": 1.0 / 24.0,
+    "minute": 1.0 / 1440.0,
+}
+
+# Regular expression matching free-text eligibility ages capturing their
+# number and unit. The expression is valid in both Python and PostgreSQL.
+AGE_PATTERN = r"^\s*([0-9]+(?:\.[0-9]+)?)\s+([a-zA-Z]+)\s*$"
+_age_regex = re.compile(AGE_PATTERN)
+
+
+# Value-to-member indices built for each enumeration class.
+_member_indices = {}  # type: Dict[type, Dict[Any, enum.Enum]]
+
+
 class EnumBase(enum.Enum):
     """Enumeration base-class."""
 
+    @classmethod
+    def get_member_index(cls) -> Dict[Any, "EnumBase"]:
+        """Returns the index of the enumeration members keyed by their value
+        building it upon the first call.
+
+        Returns:
+            Dict[Any, EnumBase]: The members keyed by value. Should multiple
+                members share a value the first one defined is kept.
+        """
+
+        try:
+            return _member_indices[cls]
+        except KeyError:
+            pass
+
+        index = {}
+        for member in cls.__members__.values():
+            index.setdefault(member.value, member)
+
+        _member_indices[cls] = index
+
+        return index
+
     @classmethod
     def get_member(
         cls,
@@ -26,15 +73,39 @@ class EnumBase(enum.Enum):
         if not value:
             return None
 
-        members = [
-            (member, member.value)
-            for member in cls.__members__.values()
-        ]
-        for member, member_value in members:
-            if member_value == value:
-                return member
+        return cls.get_member_index().get(value)
 
-        return None
+    @classmethod
+    def get_members(
+        cls,
+        values: Iterable[Optional[str]],
+    ) -> Tuple[List[Optional["EnumBase"]], List[str]]:
+        """Returns the enumeration members with values matching a sequence of
+        values, e.g., a column of raw values parsed off a batch of records.
+
+        Args:
+            values (Iterable[Optional[str]]): The values of the members to
+                match.
+
+        Returns:
+            Tuple[List[Optional[EnumBase]], List[str]]:
+                - The matching members in order of `values` with `None` for
+                    undefined values and values matching no member.
+                - The distinct values matching no member in order of first
+                    appearance.
+        """
+
+        index = cls.get_member_index()
+
+        members = []
+        unknown_values = {}
+        for value in values:
+            member = index.get(value) if value else None
+            if member is None and value:
+                unknown_values[value] = None
+            members.append(member)
+
+        return members, list(unknown_values)
 
 
 def return_first_item(func):
@@ -84,3 +155,55 @@ def lists_equal_length(func):
         return func(self, *args, **kwargs)
 
     return wrapper
+
+
+def sort_rows_by_keys(
+    rows: List[Dict[str, Any]],
+    keys: List[str],
+) -> List[Dict[str, Any]]:
+    """Sorts a list of rows, i.e., column-name:value `dict` objects, by the
+    values of the given keys.
+
+    Sorting the rows of bulk upserts by their conflict key ensures that
+    concurrent transactions acquire row-locks in the same order which
+    minimizes the chance of deadlocks.
+
+    Args:
+        rows (List[Dict[str, Any]]): The rows to be sorted.
+        keys (List[str]): The names of the columns to sort the rows by.
+
+    Returns:
+        List[Dict[str, Any]]: The sorted rows with `None` values placed first.
+    """
+
+    return sorted(
+        rows,
+        key=lambda row: [(row[key] is not None, row[key]) for key in keys],
+    )
+
+
+def parse_age_days(age: Optional[str]) -> Optional[int]:
+    """Parses a free-text eligibility age, e.g., `18 Years` or `6 Months`,
+    into a number of days rounded down.
+
+    Args:
+        age (str): The free-text age.
+
+    Returns:
+        int: The age in days or `None` if the age defines no limit, e.g.,
+            `N/A`, or cannot be parsed.
+    """
+
+    if not age:
+        return None
+
+    match = _age_regex.match(age)
+    if not match:
+        return None
+
+    number, unit = match.groups()
+    days = AGE_UNIT_DAYS.get(unit.lower().rstrip("s"))
+    if days is None:
+        return None
+
+    return int(math.floor(float(number) * days))
@@ -37,7 +37,7 @@ def create_journal(dal: DalPubmed, **kwargs) -> Tuple[int, Dict]:
     for k, v in refr.items():
         setattr(obj, k, v)
 
-    refr["md5"] = obj.md5
+    refr["md5"] = obj.update_md5()
 
     obj_id = dal.iodi_journal(**refr)
 
@@ -89,7 +89,7 @@ def create_article(
     for k, v in refr.items():
         setattr(obj, k, v)
 
-    refr["md5"] = obj.md5
+    refr["md5"] = obj.update_md5()
 
     obj_id = dal.iodi_article(**refr)
 
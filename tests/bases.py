@@ -8,6 +8,7 @@ from fform.dals_pubmed import DalPubmed
 from fform.dals_mt import DalMesh
 from fform.dals_app import DalApp
 from fform.orm_base import Base
+from fform.orm_base import load_orm_modules
 
 from tests.utils import load_config
 
@@ -24,6 +25,9 @@ class DalTestBase(unittest.TestCase):
 
         self.dal = self.setup_dal()
 
+        # Load all ORM modules so that the metadata covers all schemata.
+        load_orm_modules()
+
         # Drop any schema remnants and recreate it.
         Base.metadata.drop_all(self.dal.engine)
         Base.metadata.create_all(self.dal.engine)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `iter_columnar` method of the
+`DalFightForBase` class and the `columnar` module.
+"""
+
+import datetime
+import unittest
+import importlib.util
+
+from fform.orm_ct import Study
+from fform.orm_ct import OverallStatusType
+from fform.orm_ct import PhaseType
+
+from tests.bases import DalCtTestBase
+from tests.assets.items_ct import create_study
+
+
+def _is_installed(module_name: str) -> bool:
+    """Checks whether an optional dependency is installed."""
+
+    return importlib.util.find_spec(module_name) is not None
+
+
+class ColumnarTest(DalCtTestBase):
+
+    def setUp(self):
+        """Creates the `Study` records retrieved by the tests."""
+
+        super(ColumnarTest, self).setUp()
+
+        self.study_ids = [
+            create_study(dal=self.dal, nct_id=nct_id)[0]
+            for nct_id in ["NCT00000001", "NCT00000002", "NCT00000003"]
+        ]
+
+        self.columns = [
+            Study.study_id,
+            Study.start_date,
+            Study.phase,
+            Study.overall_status,
+        ]
+
+    @unittest.skipUnless(_is_installed("numpy"), "requires `numpy`")
+    def test_iter_columnar_numpy(self):
+        """ Tests the retrieval of `Study` columns as NumPy arrays via the
+            `iter_columnar` method."""
+
+        import numpy
+
+        chunks = list(self.dal.iter_columnar(
+            columns=self.columns,
+            order_by=[Study.study_id],
+            chunk_size=2,
+        ))
+
+        # Assert that the records were retrieved in two chunks.
+        self.assertEqual([len(chunk["study_id"]) for chunk in chunks], [2, 1])
+
+        arrays = {
+            name: numpy.concatenate([chunk[name] for chunk in chunks])
+            for name in chunks[0]
+        }
+
+        self.assertEqual(arrays["study_id"].dtype, numpy.int64)
+        self.assertEqual(arrays["study_id"].tolist(), self.study_ids)
+        self.assertEqual(arrays["start_date"].dtype, numpy.dtype("<M8[D]"))
+        self.assertEqual(
+            arrays["start_date"].tolist(),
+            [datetime.date(2019, 1, 1)] * 3,
+        )
+        # Assert that enumeration columns hold the member values.
+        self.assertEqual(
+            arrays["phase"].tolist(),
+            [PhaseType.PHASE_1.value] * 3,
+        )
+        self.assertEqual(
+            arrays["overall_status"].tolist(),
+            [OverallStatusType.ACTIVE_NOT.value] * 3,
+        )
+
+    @unittest.skipUnless(_is_installed("pyarrow"), "requires `pyarrow`")
+    def test_iter_columnar_arrow(self):
+        """ Tests the retrieval of `Study` columns as Arrow tables via the
+            `iter_columnar` method."""
+
+        import pyarrow
+
+        tables = list(self.dal.iter_columnar(
+            columns=self.columns,
+            clauses=[Study.study_id.in_(self.study_ids[:2])],
+            order_by=[Study.study_id],
+            do_arrow=True,
+        ))
+
+        self.assertEqual(len(tables), 1)
+
+        table = tables[0]
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field("study_id").type, pyarrow.int64())
+        self.assertEqual(
+            table.schema.field("start_date").type,
+            pyarrow.date32(),
+        )
+        self.assertEqual(
+            table.column("phase").to_pylist(),
+            [PhaseType.PHASE_1.value] * 2,
+        )
+
+    def test_iter_columnar_empty(self):
+        """ Tests that no chunks are yielded by the `iter_columnar` method when
+            no records match the clauses."""
+
+        chunks = list(self.dal.iter_columnar(
+            columns=self.columns,
+            clauses=[Study.study_id == -1],
+        ))
+
+        self.assertEqual(chunks, [])
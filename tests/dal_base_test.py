@@ -5,7 +5,23 @@ This module defines unit-tests for the `Dalbase` class and its different
 methods.
 """
 
+import sys
+import subprocess
+
+import sqlalchemy.exc
+import sqlalchemy.orm
+
+from fform.dals_mt import DalMesh
+from fform.dals_app import DalApp
 from fform.orm_mt import Descriptor
+from fform.orm_mt import TreeNumber
+from fform.excs import InvalidArgumentsError
+from fform.excs import MissingAttributeError
+from fform.excs import LazyLoadError
+from fform.lazy_loads import get_lazy_load_counter
+from fform.dal_base import with_session_scope
+from fform.dal_base import with_batch_bisection
+from fform.utils import sort_rows_by_keys
 
 from tests.bases import DalMtTestBase
 from tests.assets.items_mt import create_tree_number
@@ -13,6 +29,25 @@ from tests.assets.items_mt import create_concept
 from tests.assets.items_mt import create_descriptor
 
 
+class _DeadlockError(Exception):
+    """Stand-in for a `psycopg2` deadlock error."""
+
+    pgcode = "40P01"
+
+
+@with_batch_bisection(batch_args=["values"])
+@with_session_scope()
+def _bulk_failing(self, values, calls, session=None):
+    """Bulk method stand-in that deadlocks on batches of more than one row."""
+
+    calls.append(values)
+
+    if len(values) > 1:
+        raise sqlalchemy.exc.OperationalError("INSERT", {}, _DeadlockError())
+
+    return [value * 10 for value in values]
+
+
 class DalBase(DalMtTestBase):
 
     def test_get(self):
@@ -138,3 +173,317 @@ class DalBase(DalMtTestBase):
         self.assertEqual(obj.descriptor_id, descriptor_id)
         self.assertIsNotNone(obj.tree_numbers)
         self.assertIsNotNone(obj.concepts)
+
+    def test_with_session_scope_retry(self):
+        """ Tests that the `with_session_scope` decorator retries calls failing
+        with transient errors."""
+
+        self.dal.sql_retry_backoff = 0
+
+        calls = []
+
+        # Fail with a transient error on the first call only.
+        @with_session_scope()
+        def _failing_once(self, session=None):
+            calls.append(session)
+            if len(calls) == 1:
+                raise sqlalchemy.exc.OperationalError(
+                    "INSERT", {}, _DeadlockError()
+                )
+            return len(calls)
+
+        self.assertEqual(_failing_once(self.dal), 2)
+        # Assert that each attempt used a new session.
+        self.assertIsNot(calls[0], calls[1])
+
+    def test_with_session_scope_retry_exhausted(self):
+        """ Tests that the `with_session_scope` decorator raises transient
+        errors once the retries are exhausted."""
+
+        self.dal.sql_retry_backoff = 0
+        self.dal.sql_retry_attempts = 2
+
+        calls = []
+
+        # Always fail with a transient error.
+        @with_session_scope()
+        def _failing_always(self, session=None):
+            calls.append(session)
+            raise sqlalchemy.exc.OperationalError(
+                "INSERT", {}, _DeadlockError()
+            )
+
+        with self.assertRaises(sqlalchemy.exc.OperationalError):
+            _failing_always(self.dal)
+
+        # Assert that the call was attempted once and retried twice.
+        self.assertEqual(len(calls), 3)
+
+    def test_with_batch_bisection(self):
+        """ Tests that the `with_batch_bisection` decorator splits failing
+        batches and returns results aligned to the input."""
+
+        self.dal.sql_retry_backoff = 0
+        self.dal.sql_retry_attempts = 0
+
+        calls = []
+
+        obj_ids = _bulk_failing(self.dal, values=[1, 2, 3], calls=calls)
+
+        self.assertEqual(obj_ids, [10, 20, 30])
+        self.assertEqual(calls, [[1, 2, 3], [1], [2, 3], [2], [3]])
+
+    def test_sort_rows_by_keys(self):
+        """ Tests the `sort_rows_by_keys` function."""
+
+        rows = sort_rows_by_keys(
+            rows=[{"md5": b"b"}, {"md5": None}, {"md5": b"a"}],
+            keys=["md5"],
+        )
+
+        self.assertEqual(rows, [{"md5": None}, {"md5": b"a"}, {"md5": b"b"}])
+
+    def test_dispatch(self):
+        """ Tests the concurrent execution of independent DAL calls via the
+        `dispatch` method."""
+
+        tree_numbers = ["D000.001", "D000.002", "D000.003"]
+
+        obj_ids = self.dal.dispatch(
+            calls=[
+                (self.dal.iodi_tree_number, {"tree_number": tree_number})
+                for tree_number in tree_numbers
+            ]
+        )
+
+        self.assertEqual(len(obj_ids), len(tree_numbers))
+
+        # Assert that the results are returned in the order of the calls.
+        for tree_number, obj_id in zip(tree_numbers, obj_ids):
+            obj = self.dal.get(TreeNumber, obj_id)  # type: TreeNumber
+            self.assertEqual(obj.tree_number, tree_number)
+
+    def test_dispatch_error(self):
+        """ Tests that errors raised by dispatched calls are propagated."""
+
+        with self.assertRaises(MissingAttributeError):
+            self.dal.dispatch(
+                calls=[
+                    (self.dal.iodi_tree_number, {"tree_number": "D000.001"}),
+                    (
+                        self.dal.get_by_attr,
+                        {
+                            "orm_class": TreeNumber,
+                            "attr_name": "undefined",
+                            "attr_value": None,
+                        },
+                    ),
+                ]
+            )
+
+    def test_dispatch_session(self):
+        """ Tests that dispatched calls cannot be passed a session."""
+
+        with self.dal.session_scope() as session:
+            with self.assertRaises(InvalidArgumentsError):
+                self.dal.dispatch(
+                    calls=[
+                        (
+                            self.dal.iodi_tree_number,
+                            {"tree_number": "D000.001", "session": session},
+                        ),
+                    ]
+                )
+
+    def test_engine_lazy(self):
+        """ Tests that the engine is only created upon first use."""
+
+        dal = DalMesh(
+            sql_username=self.cfg.sql_username,
+            sql_password=self.cfg.sql_password,
+            sql_host=self.cfg.sql_host,
+            sql_port=self.cfg.sql_port,
+            sql_db=self.cfg.sql_db
+        )
+
+        self.assertIsNone(dal._engine)
+
+        # Retrieve a record which requires the engine.
+        dal.get(orm_class=Descriptor, pk=1)
+
+        self.assertIsNotNone(dal._engine)
+
+        dal.dispose()
+
+    def test_engine_shared(self):
+        """ Tests that DALs using the same URL share an engine when
+        `sql_engine_shared` is set."""
+
+        dals = [
+            dal_class(
+                sql_username=self.cfg.sql_username,
+                sql_password=self.cfg.sql_password,
+                sql_host=self.cfg.sql_host,
+                sql_port=self.cfg.sql_port,
+                sql_db=self.cfg.sql_db,
+                sql_engine_shared=True,
+            ) for dal_class in [DalMesh, DalApp]
+        ]
+
+        self.assertIs(dals[0].engine, dals[1].engine)
+        # Assert that non-shared engines are not affected.
+        self.assertIsNot(dals[0].engine, self.dal.engine)
+
+    def test_engine_shared_dispose(self):
+        """ Tests that disposing of a DAL using a shared engine leaves the
+        engine's pool intact for the other DALs."""
+
+        dals = [
+            dal_class(
+                sql_username=self.cfg.sql_username,
+                sql_password=self.cfg.sql_password,
+                sql_host=self.cfg.sql_host,
+                sql_port=self.cfg.sql_port,
+                sql_db=self.cfg.sql_db,
+                sql_engine_shared=True,
+            ) for dal_class in [DalMesh, DalApp]
+        ]
+
+        engine = dals[1].engine
+        pool = engine.pool
+
+        dals[0].get(orm_class=Descriptor, pk=1)
+        dals[0].dispose()
+
+        self.assertIsNone(dals[0]._engine)
+        # Assert that the shared pool was not replaced through disposal.
+        self.assertIs(dals[1].engine.pool, pool)
+        # Assert that the shared engine is retrieved again upon next use.
+        self.assertIs(dals[0].engine, engine)
+
+    def test_lazy_imports(self):
+        """ Tests that importing the package doesn't import its submodules
+        while ORM classes remain accessible as package attributes."""
+
+        code = (
+            "import sys\n"
+            "import fform\n"
+            "assert 'fform.orm_ct' not in sys.modules\n"
+            "assert fform.Study is fform.orm_ct.Study\n"
+            "assert fform.Descriptor is fform.orm_mt.Descriptor\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_get_records(self):
+        """ Tests the retrieval of read-model records via the `get_records` and
+            `get_record` methods."""
+
+        tree_numbers = ["A01", "A02", "A03"]
+        obj_ids = [
+            create_tree_number(dal=self.dal, tree_number=tree_number)[0]
+            for tree_number in tree_numbers
+        ]
+
+        records = self.dal.get_records(
+            orm_class=TreeNumber,
+            clauses=[TreeNumber.tree_number.in_(tree_numbers[1:])],
+            order_by=[TreeNumber.tree_number],
+        )
+
+        self.assertEqual(
+            [record.tree_number for record in records],
+            tree_numbers[1:],
+        )
+        self.assertEqual(type(records[0]).__name__, "TreeNumberRecord")
+
+        # Assert that records are immutable.
+        with self.assertRaises(AttributeError):
+            records[0].tree_number = "A04"
+
+        record = self.dal.get_record(orm_class=TreeNumber, pk=obj_ids[0])
+        obj = self.dal.get(orm_class=TreeNumber, pk=obj_ids[0])
+
+        self.assertEqual(record.tree_number_id, obj.tree_number_id)
+        self.assertEqual(record.tree_number, obj.tree_number)
+        self.assertEqual(record.md5, obj.md5)
+
+        self.assertIsNone(self.dal.get_record(orm_class=TreeNumber, pk=0))
+
+    def _create_descriptors_tree_numbers(self):
+        """Creates two `Descriptor` records linked to a `TreeNumber` record
+        each."""
+
+        for ui, tree_number in [("D000001", "A01"), ("D000002", "A02")]:
+            descriptor_id, _ = create_descriptor(dal=self.dal, ui=ui, name=ui)
+            tree_number_id, _ = create_tree_number(
+                dal=self.dal,
+                tree_number=tree_number,
+            )
+            self.dal.iodi_descriptor_tree_number(
+                descriptor_id=descriptor_id,
+                tree_number_id=tree_number_id,
+            )
+
+    def _create_dal(self, **kwargs) -> DalMesh:
+        """Creates a new `DalMesh` with additional keyword arguments."""
+
+        return DalMesh(
+            sql_username=self.cfg.sql_username,
+            sql_password=self.cfg.sql_password,
+            sql_host=self.cfg.sql_host,
+            sql_port=self.cfg.sql_port,
+            sql_db=self.cfg.sql_db,
+            **kwargs
+        )
+
+    def test_lazy_load_mode_raise(self):
+        """ Tests that lazy loads raise a `LazyLoadError` under the `raise`
+            lazy-load mode unless the relationship was eager-loaded."""
+
+        self._create_descriptors_tree_numbers()
+
+        dal = self._create_dal(lazy_load_mode="raise")
+
+        with dal.session_scope() as session:
+            objs = session.query(Descriptor).all()
+            with self.assertRaises(LazyLoadError):
+                _ = objs[0].tree_numbers
+
+        with dal.session_scope() as session:
+            objs = session.query(Descriptor).options(
+                sqlalchemy.orm.selectinload(Descriptor.tree_numbers),
+            ).all()
+
+            self.assertEqual(
+                sorted(obj.tree_numbers[0].tree_number for obj in objs),
+                ["A01", "A02"],
+            )
+            self.assertEqual(get_lazy_load_counter(session), {})
+
+        dal.dispose()
+
+    def test_lazy_load_mode_count(self):
+        """ Tests that repeated lazy loads are counted and reported per
+            relationship under the `count` lazy-load mode."""
+
+        self._create_descriptors_tree_numbers()
+
+        dal = self._create_dal(lazy_load_mode="count")
+
+        with dal.session_scope() as session:
+            for obj in session.query(Descriptor).all():
+                _ = obj.tree_numbers
+
+            self.assertEqual(
+                dal.report_lazy_loads(session=session),
+                {"Descriptor.tree_numbers": 2},
+            )
+
+        dal.dispose()
+
+    def test_lazy_load_mode_invalid(self):
+        """ Tests that an unsupported lazy-load mode is rejected."""
+
+        with self.assertRaises(InvalidArgumentsError):
+            self._create_dal(lazy_load_mode="ignore")
@@ -73,3 +73,17 @@ class DalCtAliasTest(DalCtTestBase):
         obj = self.dal.get(Alias, obj_id)  # type: Alias
 
         self.assertIsNone(obj)
+
+    def test_biodi_aliases(self):
+        """Tests the BIODI insertion of `Alias` records via the
+        `biodi_aliases` method of the `DalClinicalTrials` class."""
+
+        # BIODI new `Alias` records.
+        obj_ids = self.dal.biodi_aliases(aliases=["ASA", "Aspirin", "asa"])
+
+        # Assert that the IDs are aligned to the aliases.
+        self.assertEqual(obj_ids[0], obj_ids[2])
+        self.assertNotEqual(obj_ids[0], obj_ids[1])
+
+        obj = self.dal.get(Alias, obj_ids[0])  # type: Alias
+        self.assertEqual(obj.alias, "asa")
@@ -98,3 +98,22 @@ class DalCtConditionTest(DalCtTestBase):
         self.assertEqual(obj_updated.condition, "test")
         # Assert that the MD5 changes.
         self.assertNotEqual(obj_original.md5, obj_updated.md5)
+
+    def test_biodi_conditions(self):
+        """Tests the BIODI insertion of `Condition` records via the
+        `biodi_conditions` method of the `DalClinicalTrials` class."""
+
+        # BIODI new `Condition` records.
+        obj_ids = self.dal.biodi_conditions(
+            conditions=["Breast Cancer", "Lung Cancer", "breast cancer"],
+        )
+
+        # Assert that duplicates map to the same record.
+        self.assertEqual(obj_ids[0], obj_ids[2])
+        self.assertNotEqual(obj_ids[0], obj_ids[1])
+
+        # BIODI the same `Condition` records which should be left as is.
+        self.assertEqual(
+            self.dal.biodi_conditions(conditions=["Breast Cancer"]),
+            [obj_ids[0]],
+        )
@@ -137,3 +137,31 @@ class DalCtContactTest(DalCtTestBase):
         obj = self.dal.get(Contact, obj_id)  # type: Contact
 
         self.assertIsNone(obj)
+
+    def test_biodi_contacts(self):
+        """Tests the BIODI insertion of `Contact` records via the
+        `biodi_contacts` method of the `DalClinicalTrials` class."""
+
+        # Create fixtures.
+        person_ids = self.dal.biodi_persons(
+            names_first=["John", "Jane"],
+            names_middle=[None, None],
+            names_last=["Doe", "Doe"],
+            person_degrees=[None, None],
+        )
+
+        # BIODI new `Contact` records.
+        obj_ids = self.dal.biodi_contacts(
+            person_ids=person_ids + person_ids[:1],
+            phones=["1", "2", "1"],
+            phone_exts=[None, None, None],
+            emails=["John.Doe@Example.com", None, "john.doe@example.com"],
+        )
+
+        # Assert that contacts differing in email casing are deduplicated.
+        self.assertEqual(obj_ids[0], obj_ids[2])
+        self.assertNotEqual(obj_ids[0], obj_ids[1])
+
+        obj = self.dal.get(Contact, obj_ids[0])  # type: Contact
+        self.assertEqual(obj.person_id, person_ids[0])
+        self.assertEqual(obj.email, "john.doe@example.com")
@@ -2,9 +2,12 @@
 
 """
 This module defines unit-tests for the `Eligibility` class as well as the
-`insert_eligibility` method of the `DalClinicalTrials` class.
+`insert_eligibility` and `backfill_eligibility_ages` methods of the
+`DalClinicalTrials` class.
 """
 
+import sqlalchemy
+
 from fform.orm_ct import Eligibility
 from fform.orm_ct import SamplingMethodType
 from fform.orm_ct import GenderType
@@ -36,7 +39,11 @@ class DalCtEligibilityTest(DalCtTestBase):
         self.assertEqual(obj_id, 1)
 
         # Retrieve the new record.
-        obj = self.dal.get(Eligibility, obj_id)  # type: Eligibility
+        obj = self.dal.get(
+            Eligibility,
+            obj_id,
+            undefer_groups=["criteria"],
+        )  # type: Eligibility
 
         # Assert that the different fields of the record match.
         self.assertEqual(obj.eligibility_id, 1)
@@ -48,6 +55,8 @@ class DalCtEligibilityTest(DalCtTestBase):
         self.assertEqual(obj.gender_description, "gender_description")
         self.assertEqual(obj.minimum_age, "1 year")
         self.assertEqual(obj.maximum_age, "10 years")
+        self.assertEqual(obj.minimum_age_days, 365)
+        self.assertEqual(obj.maximum_age_days, 3652)
         self.assertEqual(obj.healthy_volunteers, "healthy_volunteers")
 
     def test_insert_eligibility_duplicate(self):
@@ -142,3 +151,49 @@ class DalCtEligibilityTest(DalCtTestBase):
         obj = self.dal.get(Eligibility, obj_id)  # type: Eligibility
 
         self.assertIsNone(obj)
+
+    def test_backfill_eligibility_ages(self):
+        """ Tests the population of the ages in days of existing `Eligibility`
+            records via the `backfill_eligibility_ages` method of the
+            `DalClinicalTrials` class.
+        """
+
+        obj_ids = []
+        for minimum_age, maximum_age in [
+            ("1 year", "10 years"),
+            ("6 Months", "N/A"),
+            ("N/A", "new 10 years"),
+        ]:
+            obj_ids.append(
+                self.dal.insert_eligibility(
+                    study_pop="study_pop",
+                    sampling_method=SamplingMethodType.PROBABILITY,
+                    criteria="criteria",
+                    gender=GenderType.ALL,
+                    gender_based=False,
+                    gender_description="gender_description",
+                    minimum_age=minimum_age,
+                    maximum_age=maximum_age,
+                    healthy_volunteers="healthy_volunteers",
+                )
+            )
+
+        # Clear the ages in days as in records predating the columns.
+        with self.dal.session_scope() as session:
+            session.execute(
+                sqlalchemy.update(Eligibility).values(
+                    minimum_age_days=None,
+                    maximum_age_days=None,
+                )
+            )
+
+        count = self.dal.backfill_eligibility_ages(batch_size=2)
+
+        self.assertEqual(count, 3)
+
+        ages = []
+        for obj_id in obj_ids:
+            obj = self.dal.get(Eligibility, obj_id)  # type: Eligibility
+            ages.append((obj.minimum_age_days, obj.maximum_age_days))
+
+        self.assertEqual(ages, [(365, 3652), (182, None), (None, None)])
@@ -2,15 +2,20 @@
 
 """
 This module defines unit-tests for the `FacilityCanonical` class as well as the
-`iodu_facility_canonical` method of the `DalClinicalTrials` class.
+`iodu_facility_canonical`, `find_studies_near`, and
+`find_facilities_canonical_nearest` methods of the `DalClinicalTrials` class.
 """
 
 import copy
 
 from fform.orm_ct import FacilityCanonical
+from fform.orm_ct import OverallStatusType
+from fform.excs import MissingAttributeError
 from geoalchemy2.shape import to_shape
 
 from tests.bases import DalCtTestBase
+from tests.assets.items_ct import create_facility
+from tests.assets.items_ct import create_study
 
 
 _iodu_facility_canonical_args = {
@@ -154,6 +159,70 @@ class DalCtFacilityTest(DalCtTestBase):
 
         self.assertEqual(obj_id, 3)
 
+    def test_iodu_facility_canonical_zero_coordinate(self):
+        """Tests the IODU insertion of a `FacilityCanonical` record on the
+        equator to ensure zero coordinates are stored."""
+
+        args = copy.deepcopy(_iodu_facility_canonical_args)
+        args["coordinate_latitude"] = 0.0
+
+        obj_id = self.dal.iodu_facility_canonical(**args)
+
+        obj = self.dal.get(FacilityCanonical, obj_id)  # type: FacilityCanonical
+
+        self.assertEqual(to_shape(obj.coordinates).wkt, "POINT (1 0)")
+
+    def test_biodu_facilities_canonical(self):
+        """Tests the BIODU insertion of `FacilityCanonical` records via the
+        `biodu_facilities_canonical` method of the `DalClinicalTrials`
+        class."""
+
+        # IODU an existing `FacilityCanonical` record.
+        obj_id = self.dal.iodu_facility_canonical(
+            **_iodu_facility_canonical_args
+        )
+
+        # BIODU the existing record with new coordinates, a new record, and a
+        # new record without coordinates.
+        facility_canonical_ids = self.dal.biodu_facilities_canonical(
+            rows=[
+                dict(
+                    _iodu_facility_canonical_args,
+                    coordinate_longitude=2.0,
+                    coordinate_latitude=-2.0,
+                ),
+                {
+                    "google_place_id": "google_place_id_02",
+                    "name": "name_02",
+                    "coordinate_longitude": 144.96,
+                    "coordinate_latitude": -37.81,
+                },
+                {"google_place_id": "google_place_id_03"},
+            ],
+        )
+
+        self.assertEqual(
+            set(facility_canonical_ids.keys()),
+            {"google_place_id", "google_place_id_02", "google_place_id_03"},
+        )
+        self.assertEqual(facility_canonical_ids["google_place_id"], obj_id)
+
+        obj = self.dal.get(FacilityCanonical, obj_id)  # type: FacilityCanonical
+        self.assertEqual(to_shape(obj.coordinates).wkt, "POINT (2 -2)")
+
+        obj = self.dal.get(
+            FacilityCanonical,
+            facility_canonical_ids["google_place_id_02"],
+        )  # type: FacilityCanonical
+        self.assertEqual(obj.name, "name_02")
+        self.assertEqual(to_shape(obj.coordinates).wkt, "POINT (144.96 -37.81)")
+
+        obj = self.dal.get(
+            FacilityCanonical,
+            facility_canonical_ids["google_place_id_03"],
+        )  # type: FacilityCanonical
+        self.assertIsNone(obj.coordinates)
+
     def test_delete_facility(self):
         """Tests the deletion of a `FacilityCanonical` record via the `delete`
         method of the `DalClinicalTrials` class."""
@@ -172,3 +241,108 @@ class DalCtFacilityTest(DalCtTestBase):
         obj = self.dal.get(FacilityCanonical, obj_id)  # type: FacilityCanonical
 
         self.assertIsNone(obj)
+
+    def _create_facility_canonical_near(
+        self,
+        google_place_id: str,
+        longitude: float,
+        latitude: float,
+    ) -> int:
+        """Creates a `FacilityCanonical` record at the given coordinates."""
+
+        args = copy.deepcopy(_iodu_facility_canonical_args)
+        args["google_place_id"] = google_place_id
+        args["coordinate_longitude"] = longitude
+        args["coordinate_latitude"] = latitude
+
+        return self.dal.iodu_facility_canonical(**args)
+
+    def test_find_studies_near(self):
+        """Tests the retrieval of studies within a radius of a point via the
+        `find_studies_near` method of the `DalClinicalTrials` class."""
+
+        # Create fixtures around Melbourne, Sydney, and London.
+        facility_id, _ = create_facility(dal=self.dal)
+        study_ids = []
+        for idx, (longitude, latitude) in enumerate([
+            (144.96, -37.81),
+            (151.21, -33.87),
+            (-0.13, 51.51),
+        ]):
+            study_id, _ = create_study(
+                dal=self.dal,
+                nct_id="nct_id_{}".format(idx),
+                overall_status=OverallStatusType.RECRUITING,
+            )
+            facility_canonical_id = self._create_facility_canonical_near(
+                google_place_id="google_place_id_{}".format(idx),
+                longitude=longitude,
+                latitude=latitude,
+            )
+            self.dal.iodu_study_facility(
+                study_id=study_id,
+                facility_id=facility_id,
+                facility_canonical_id=facility_canonical_id,
+            )
+            study_ids.append(study_id)
+
+        # Search within 1000km of Canberra.
+        results = self.dal.find_studies_near(
+            longitude=149.13,
+            latitude=-35.28,
+            radius_km=1000,
+        )
+
+        # Assert that Sydney precedes Melbourne and London is excluded.
+        self.assertEqual(
+            [study_id for study_id, _ in results],
+            [study_ids[1], study_ids[0]],
+        )
+        self.assertAlmostEqual(results[0][1], 248, delta=10)
+
+        results = self.dal.find_studies_near(
+            longitude=149.13,
+            latitude=-35.28,
+            radius_km=1000,
+            filters={"overall_status": [OverallStatusType.COMPLETED]},
+        )
+
+        self.assertEqual(results, [])
+
+        self.assertRaises(
+            MissingAttributeError,
+            self.dal.find_studies_near,
+            longitude=149.13,
+            latitude=-35.28,
+            radius_km=1000,
+            filters={"invalid": None},
+        )
+
+    def test_find_facilities_canonical_nearest(self):
+        """Tests the k-nearest-neighbour retrieval of canonical facilities via
+        the `find_facilities_canonical_nearest` method of the
+        `DalClinicalTrials` class."""
+
+        # Create fixtures around Melbourne, Sydney, and London.
+        facility_canonical_ids = [
+            self._create_facility_canonical_near(
+                google_place_id="google_place_id_{}".format(idx),
+                longitude=longitude,
+                latitude=latitude,
+            ) for idx, (longitude, latitude) in enumerate([
+                (144.96, -37.81),
+                (151.21, -33.87),
+                (-0.13, 51.51),
+            ])
+        ]
+
+        results = self.dal.find_facilities_canonical_nearest(
+            longitude=149.13,
+            latitude=-35.28,
+            limit=2,
+        )
+
+        self.assertEqual(
+            [facility_canonical_id for facility_canonical_id, _ in results],
+            [facility_canonical_ids[1], facility_canonical_ids[0]],
+        )
@@ -109,3 +109,33 @@ class DalCtFacilityTest(DalCtTestBase):
         obj = self.dal.get(Facility, obj_id)  # type: Facility
 
         self.assertIsNone(obj)
+
+    def test_biodi_facilities(self):
+        """Tests the BIODI insertion of `Facility` records via the
+        `biodi_facilities` method of the `DalClinicalTrials` class."""
+
+        # IODI a `Facility` record which the batch will include.
+        obj_id = self.dal.iodi_facility(
+            name="The Alfred",
+            city="Melbourne",
+            state="Victoria",
+            zip_code="3000",
+            country="Australia",
+        )
+
+        # BIODI new and existing `Facility` records.
+        obj_ids = self.dal.biodi_facilities(
+            names=["Royal Melbourne", "The Alfred"],
+            cities=["Melbourne", "Melbourne"],
+            states=[None, "Victoria"],
+            zip_codes=[None, "3000"],
+            countries=["Australia", "Australia"],
+        )
+
+        # Assert that the IDs are aligned to the facilities.
+        self.assertNotEqual(obj_ids[0], obj_id)
+        self.assertEqual(obj_ids[1], obj_id)
+
+        obj = self.dal.get(Facility, obj_ids[0])  # type: Facility
+        self.assertEqual(obj.name, "Royal Melbourne")
+        self.assertIsNone(obj.state)
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `ingest_studies` method of the
+`DalClinicalTrials` class.
+"""
+
+import datetime
+from typing import Dict
+
+from fform.orm_ct import Study
+from fform.orm_ct import Keyword
+from fform.orm_ct import Person
+from fform.orm_ct import Contact
+from fform.orm_ct import Location
+from fform.orm_ct import StudyKeyword
+from fform.orm_ct import StudyDates
+from fform.orm_ct import Eligibility
+from fform.orm_ct import ArmGroup
+from fform.orm_ct import ProtocolOutcome
+from fform.orm_ct import PatientData
+from fform.orm_ct import PatientDataIpdInfoType
+from fform.orm_ct import StudyDoc
+from fform.orm_ct import StudyArmGroup
+from fform.orm_ct import StudyOutcome
+from fform.orm_ct import StudyStudyDoc
+from fform.orm_ct import StudySponsor
+from fform.orm_ct import StudyLocation
+from fform.orm_ct import StudyFacility
+from fform.orm_ct import StudySecondaryId
+from fform.orm_ct import InterventionArmGroup
+from fform.orm_ct import AgencyClassType
+from fform.orm_ct import SponsorType
+from fform.orm_ct import RoleType
+from fform.orm_ct import RecruitmentStatusType
+from fform.orm_ct import InterventionType
+from fform.orm_ct import OverallStatusType
+from fform.orm_ct import PhaseType
+from fform.orm_ct import StudyType
+from fform.orm_ct import GenderType
+from fform.orm_ct import OutcomeType
+
+from tests.bases import DalCtTestBase
+
+
+def create_study_graph(nct_id: str, **kwargs) -> Dict:
+    """ Creates the graph of a study as expected by the `ingest_studies`
+    method.
+
+    Args:
+        nct_id (str): The NCT ID of the study.
+
+    Returns:
+        Dict: The study graph.
+    """
+
+    contact = {
+        "person": {
+            "name_first": "John",
+            "name_middle": None,
+            "name_last": "Doe",
+            "degrees": "MD",
+        },
+        "phone": "+123456789",
+        "phone_ext": None,
+        "email": "John.Doe@Example.com",
+    }
+
+    graph = {
+        "study": {
+            "org_study_id": "org_study_id",
+            "nct_id": nct_id,
+            "brief_title": "brief_title",
+            "source": "source",
+            "overall_status": OverallStatusType.RECRUITING,
+            "phase": PhaseType.PHASE_1,
+            "study_type": StudyType.INTERVENTIONAL,
+        },
+        "study_dates": {
+            "study_first_submitted": datetime.date(2019, 1, 1),
+        },
+        "eligibility": {
+            "gender": GenderType.ALL,
+            "minimum_age": "18 Years",
+            "maximum_age": "N/A",
+        },
+        "patient_data": {
+            "sharing_ipd": "Yes",
+            "ipd_info_types": ["Study Protocol"],
+        },
+        "contact_primary": contact,
+        "sponsors": [
+            {
+                "agency": "National Cancer Institute",
+                "agency_class": AgencyClassType.NIH,
+                "sponsor_type": SponsorType.LEAD,
+            },
+        ],
+        "keywords": ["Melanoma", "melanoma", "Ocular Melanoma"],
+        "arm_groups": [
+            {"label": "Arm A", "arm_group_type": "Experimental"},
+        ],
+        "protocol_outcomes": [
+            {
+                "measure": "Overall survival",
+                "time_frame": "5 years",
+                "outcome_type": OutcomeType.PRIMARY,
+            },
+        ],
+        "interventions": [
+            {
+                "intervention_type": InterventionType.DRUG,
+                "name": "Aspirin",
+                "aliases": ["ASA"],
+                "arm_group_labels": ["Arm A"],
+            },
+        ],
+        "locations": [
+            {
+                "facility": {
+                    "name": "The Alfred",
+                    "city": "Melbourne",
+                    "state": "Victoria",
+                    "zip_code": "3000",
+                    "country": "Australia",
+                },
+                "status": RecruitmentStatusType.RECRUITING,
+                "contact_primary": contact,
+                "investigators": [
+                    {
+                        "person": contact["person"],
+                        "role": RoleType.PRINCIPAL,
+                        "affiliation": "The Alfred",
+                    },
+                ],
+            },
+        ],
+    }
+
+    # Override any graph keys with values under `kwargs`.
+    for k, v in kwargs.items():
+        graph[k] = v
+
+    return graph
+
+
+class DalCtIngestTest(DalCtTestBase):
+
+    def test_ingest_studies(self):
+        """ Tests the ingestion of study graphs via the `ingest_studies`
+            method of the `DalClinicalTrials` class.
+        """
+
+        study_ids = self.dal.ingest_studies(
+            study_graphs=[
+                create_study_graph(nct_id="NCT00000001"),
+                create_study_graph(nct_id="NCT00000002"),
+            ],
+        )
+
+        self.assertEqual(set(study_ids.keys()), {"NCT00000001", "NCT00000002"})
+
+        # Retrieve the new `Study` record.
+        obj = self.dal.get_by_attr(
+            orm_class=Study,
+            attr_name="nct_id",
+            attr_value="NCT00000001",
+        )  # type: Study
+
+        self.assertEqual(obj.study_id, study_ids["NCT00000001"])
+        self.assertIsNotNone(obj.study_dates_id)
+        self.assertIsNotNone(obj.contact_primary_id)
+        self.assertIsNone(obj.contact_backup_id)
+
+        with self.dal.session_scope() as session:
+            # Assert that the shared records were deduplicated and lowercased.
+            self.assertEqual(session.query(Person).count(), 1)
+            self.assertEqual(session.query(Contact).count(), 1)
+            self.assertEqual(session.query(Location).count(), 1)
+            self.assertEqual(
+                sorted(keyword.keyword for keyword in session.query(Keyword)),
+                ["melanoma", "ocular melanoma"],
+            )
+            self.assertEqual(
+                session.query(Contact).one().email,
+                "john.doe@example.com",
+            )
+
+            # Assert that the links were created once per study.
+            self.assertEqual(session.query(StudyKeyword).count(), 4)
+            self.assertEqual(session.query(StudySponsor).count(), 2)
+            self.assertEqual(session.query(StudyLocation).count(), 2)
+            self.assertEqual(session.query(StudyFacility).count(), 2)
+            # Each study has its own arm group.
+            self.assertEqual(session.query(InterventionArmGroup).count(), 2)
+
+    def test_ingest_studies_repeated(self):
+        """ Tests the repeated ingestion of the same study graph via the
+            `ingest_studies` method of the `DalClinicalTrials` class to ensure
+            the study is updated and its links are not duplicated.
+        """
+
+        study_ids_first = self.dal.ingest_studies(
+            study_graphs=[create_study_graph(nct_id="NCT00000001")],
+        )
+
+        obj_first = self.dal.get(
+            Study,
+            study_ids_first["NCT00000001"],
+        )  # type: Study
+
+        graph = create_study_graph(nct_id="NCT00000001")
+        graph["study"]["brief_title"] = "brief_title_updated"
+        graph["sponsors"][0]["sponsor_type"] = SponsorType.COLLABORATOR
+
+        study_ids_second = self.dal.ingest_studies(study_graphs=[graph])
+
+        self.assertEqual(study_ids_first, study_ids_second)
+
+        obj = self.dal.get(
+            Study,
+            study_ids_second["NCT00000001"],
+        )  # type: Study
+
+        self.assertEqual(obj.brief_title, "brief_title_updated")
+        # Assert that the unchanged linked records were reused.
+        self.assertEqual(obj.study_dates_id, obj_first.study_dates_id)
+        self.assertEqual(obj.eligibility_id, obj_first.eligibility_id)
+        self.assertEqual(obj.patient_data_id, obj_first.patient_data_id)
+
+        with self.dal.session_scope() as session:
+            self.assertEqual(session.query(Keyword).count(), 2)
+            self.assertEqual(session.query(StudyKeyword).count(), 2)
+            # Assert that the records linked to a single study were not
+            # duplicated.
+            self.assertEqual(session.query(StudyDates).count(), 1)
+            self.assertEqual(session.query(Eligibility).count(), 1)
+            self.assertEqual(session.query(ArmGroup).count(), 1)
+            self.assertEqual(session.query(ProtocolOutcome).count(), 1)
+            self.assertEqual(session.query(PatientData).count(), 1)
+            self.assertEqual(
+                session.query(PatientDataIpdInfoType).count(),
+                1,
+            )
+            self.assertEqual(
+                session.query(StudySponsor).one().sponsor_type,
+                SponsorType.COLLABORATOR,
+            )
+
+    def test_ingest_studies_dropped_links(self):
+        """ Tests the repeated ingestion of a study graph via the
+            `ingest_studies` method of the `DalClinicalTrials` class to ensure
+            the associations the study no longer defines are deleted.
+        """
+
+        self.dal.ingest_studies(
+            study_graphs=[
+                create_study_graph(
+                    nct_id="NCT00000001",
+                    secondary_ids=["S1", "S2"],
+                    study_docs=[{"doc_id": "doc_id", "doc_type": "SAP"}],
+                ),
+            ],
+        )
+
+        graph = create_study_graph(
+            nct_id="NCT00000001",
+            keywords=["Melanoma"],
+            secondary_ids=["S1"],
+            arm_groups=[],
+            protocol_outcomes=[],
+        )
+        self.dal.ingest_studies(study_graphs=[graph])
+
+        with self.dal.session_scope() as session:
+            self.assertEqual(
+                [
+                    obj.keyword.keyword
+                    for obj in session.query(StudyKeyword)
+                ],
+                ["melanoma"],
+            )
+            self.assertEqual(
+                [obj.secondary_id for obj in session.query(StudySecondaryId)],
+                ["S1"],
+            )
+
+            # Assert that the records linked to the study alone were deleted
+            # along with their associations.
+            for orm_class in [
+                ArmGroup,
+                StudyArmGroup,
+                InterventionArmGroup,
+                ProtocolOutcome,
+                StudyOutcome,
+                StudyDoc,
+                StudyStudyDoc,
+            ]:
+                self.assertEqual(session.query(orm_class).count(), 0)
+
+    def test_ingest_studies_replaced_records(self):
+        """ Tests the repeated ingestion of a study graph with changed records
+            linked to the study via the `ingest_studies` method of the
+            `DalClinicalTrials` class to ensure the replaced records are
+            deleted.
+        """
+
+        self.dal.ingest_studies(
+            study_graphs=[create_study_graph(nct_id="NCT00000001")],
+        )
+
+        graph = create_study_graph(nct_id="NCT00000001")
+        graph["study_dates"]["study_first_submitted"] = datetime.date(
+            2019, 2, 1,
+        )
+        graph["eligibility"]["maximum_age"] = "65 Years"
+        graph["arm_groups"][0]["description"] = "description"
+        graph["protocol_outcomes"][0]["time_frame"] = "10 years"
+        del graph["patient_data"]
+
+        self.dal.ingest_studies(study_graphs=[graph])
+
+        obj = self.dal.get_by_attr(
+            orm_class=Study,
+            attr_name="nct_id",
+            attr_value="NCT00000001",
+        )  # type: Study
+
+        self.assertIsNone(obj.patient_data_id)
+
+        with self.dal.session_scope() as session:
+            self.assertEqual(
+                [
+                    obj.study_first_submitted
+                    for obj in session.query(StudyDates)
+                ],
+                [datetime.date(2019, 2, 1)],
+            )
+            self.assertEqual(
+                [obj.maximum_age for obj in session.query(Eligibility)],
+                ["65 Years"],
+            )
+            self.assertEqual(
+                [obj.description for obj in session.query(ArmGroup)],
+                ["description"],
+            )
+            self.assertEqual(
+                [obj.time_frame for obj in session.query(ProtocolOutcome)],
+                ["10 years"],
+            )
+            # Assert that the interventions were linked to the new arm group.
+            self.assertEqual(session.query(InterventionArmGroup).count(), 1)
+            self.assertEqual(session.query(PatientData).count(), 0)
+            self.assertEqual(session.query(PatientDataIpdInfoType).count(), 0)
+
+    def test_ingest_studies_empty(self):
+        """ Tests the ingestion of an empty batch via the `ingest_studies`
+            method of the `DalClinicalTrials` class.
+        """
+
+        self.assertEqual(self.dal.ingest_studies(study_graphs=[]), {})
@@ -97,3 +97,25 @@ class DalCtInterventionTest(DalCtTestBase):
         obj = self.dal.get(Intervention, obj_id)  # type: Intervention
 
         self.assertIsNone(obj)
+
+    def test_biodi_interventions(self):
+        """Tests the BIODI insertion of `Intervention` records via the
+        `biodi_interventions` method of the `DalClinicalTrials` class."""
+
+        # BIODI new `Intervention` records.
+        obj_ids = self.dal.biodi_interventions(
+            intervention_types=[InterventionType.DRUG, InterventionType.DRUG],
+            names=["Aspirin", "Ibuprofen"],
+            descriptions=[None, "description"],
+        )
+
+        self.assertNotEqual(obj_ids[0], obj_ids[1])
+
+        # IODI an existing `Intervention` record.
+        obj_id = self.dal.iodi_intervention(
+            intervention_type=InterventionType.DRUG,
+            name="Ibuprofen",
+            description="description",
+        )
+
+        self.assertEqual(obj_id, obj_ids[1])
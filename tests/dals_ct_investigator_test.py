@@ -135,3 +135,29 @@ class DalCtInvestigatorTest(DalCtTestBase):
         obj = self.dal.get(Investigator, obj_id)  # type: Investigator
 
         self.assertIsNone(obj)
+
+    def test_biodi_investigators(self):
+        """Tests the BIODI insertion of `Investigator` records via the
+        `biodi_investigators` method of the `DalClinicalTrials` class."""
+
+        # Create fixtures.
+        person_ids = self.dal.biodi_persons(
+            names_first=["John"],
+            names_middle=[None],
+            names_last=["Doe"],
+            person_degrees=[None],
+        )
+
+        # BIODI new `Investigator` records.
+        obj_ids = self.dal.biodi_investigators(
+            person_ids=person_ids * 3,
+            roles=[RoleType.PRINCIPAL, RoleType.SUB, RoleType.PRINCIPAL],
+            affiliations=["Alfred", "Alfred", "Alfred"],
+        )
+
+        # Assert that the IDs are aligned to the investigators.
+        self.assertEqual(obj_ids[0], obj_ids[2])
+        self.assertNotEqual(obj_ids[0], obj_ids[1])
+
+        obj = self.dal.get(Investigator, obj_ids[1])  # type: Investigator
+        self.assertEqual(obj.role, RoleType.SUB)
@@ -70,3 +70,28 @@ class DalCtKeywordTest(DalCtTestBase):
         obj = self.dal.get(Keyword, obj_id)  # type: Keyword
 
         self.assertIsNone(obj)
+
+    def test_biodi_keywords(self):
+        """Tests the BIODI insertion of `Keyword` records via the
+        `biodi_keywords` method of the `DalClinicalTrials` class."""
+
+        # IODI a `Keyword` record which the batch will include.
+        obj_id = self.dal.iodi_keyword(keyword="Ocular Melanoma")
+
+        # BIODI new and existing `Keyword` records.
+        obj_ids = self.dal.biodi_keywords(
+            keywords=[
+                "Rheumatoid Diseases",
+                "ocular melanoma",
+                "RHEUMATOID DISEASES",
+            ],
+        )
+
+        # Assert that the IDs are aligned to the keywords.
+        self.assertEqual(obj_ids[1], obj_id)
+        self.assertEqual(obj_ids[0], obj_ids[2])
+        self.assertNotEqual(obj_ids[0], obj_id)
+
+        # Assert that lowercasing kicked in.
+        obj = self.dal.get(Keyword, obj_ids[0])  # type: Keyword
+        self.assertEqual(obj.keyword, "rheumatoid diseases")
@@ -102,3 +102,30 @@ class DalCtPersonTest(DalCtTestBase):
         obj = self.dal.get(Person, obj_id)  # type: Person
 
         self.assertIsNone(obj)
+
+    def test_biodi_persons(self):
+        """Tests the BIODI insertion of `Person` records via the
+        `biodi_persons` method of the `DalClinicalTrials` class."""
+
+        # IODI a `Person` record which the batch will include.
+        obj_id = self.dal.iodi_person(
+            name_first="John",
+            name_middle=None,
+            name_last="Doe",
+            degrees="MD",
+        )
+
+        # BIODI new and existing `Person` records.
+        obj_ids = self.dal.biodi_persons(
+            names_first=["Jane", "John"],
+            names_middle=[None, None],
+            names_last=["Doe", "Doe"],
+            person_degrees=[None, "MD"],
+        )
+
+        # Assert that the IDs are aligned to the persons.
+        self.assertNotEqual(obj_ids[0], obj_id)
+        self.assertEqual(obj_ids[1], obj_id)
+
+        obj = self.dal.get(Person, obj_ids[0])  # type: Person
+        self.assertEqual(obj.name_first, "Jane")
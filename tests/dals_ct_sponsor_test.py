@@ -100,3 +100,26 @@ class DalCtSponsorTest(DalCtTestBase):
         obj = self.dal.get(Sponsor, obj_id)  # type: Sponsor
 
         self.assertIsNone(obj)
+
+    def test_biodi_sponsors(self):
+        """Tests the BIODI insertion of `Sponsor` records via the
+        `biodi_sponsors` method of the `DalClinicalTrials` class."""
+
+        # IODI a `Sponsor` record which the batch will include.
+        obj_id = self.dal.iodi_sponsor(
+            agency="Novartis",
+            agency_class=AgencyClassType.INDUSTRY,
+        )
+
+        # BIODI new and existing `Sponsor` records.
+        obj_ids = self.dal.biodi_sponsors(
+            agencies=["Novartis", "Novartis"],
+            agency_classes=[AgencyClassType.NIH, AgencyClassType.INDUSTRY],
+        )
+
+        # Assert that the IDs are aligned to the sponsors.
+        self.assertNotEqual(obj_ids[0], obj_id)
+        self.assertEqual(obj_ids[1], obj_id)
+
+        obj = self.dal.get(Sponsor, obj_ids[0])  # type: Sponsor
+        self.assertEqual(obj.agency_class, AgencyClassType.NIH)
@@ -8,6 +8,8 @@ This module defines unit-tests for the `StudyKeyword` class as well as the
 import sqlalchemy.exc
 
 from fform.orm_ct import StudyKeyword
+from fform.orm_ct import StudySponsor
+from fform.excs import InvalidArgumentsError
 
 from tests.bases import DalCtTestBase
 from tests.assets.items_ct import create_study
@@ -128,3 +130,103 @@ class DalCtStudyKeywordTest(DalCtTestBase):
         obj = self.dal.get(StudyKeyword, obj_id)  # type: StudyKeyword
 
         self.assertIsNone(obj)
+
+    def test_biodi_study_keywords(self):
+        """ Tests the BIODI insertion of `StudyKeyword` records via the
+            `biodi_study_keywords` method of the `DalClinicalTrials` class.
+        """
+
+        # Create fixtures.
+        study_01_id, _ = create_study(dal=self.dal, nct_id="nct_id_01")
+        study_02_id, _ = create_study(dal=self.dal, nct_id="nct_id_02")
+        keyword_ids = self.dal.biodi_keywords(keywords=["keyword", "other"])
+
+        # BIODI new `StudyKeyword` records including a duplicate pair.
+        self.dal.biodi_study_keywords(
+            study_ids=[study_01_id, study_01_id, study_02_id, study_01_id],
+            keyword_ids=keyword_ids + keyword_ids[:1] + keyword_ids[:1],
+        )
+
+        # BIODI an existing `StudyKeyword` record.
+        self.dal.biodi_study_keywords(
+            study_ids=[study_02_id],
+            keyword_ids=keyword_ids[:1],
+        )
+
+        with self.dal.session_scope() as session:
+            pairs = sorted(
+                (obj.study_id, obj.keyword_id)
+                for obj in session.query(StudyKeyword)
+            )
+
+        self.assertEqual(
+            pairs,
+            sorted([
+                (study_01_id, keyword_ids[0]),
+                (study_01_id, keyword_ids[1]),
+                (study_02_id, keyword_ids[0]),
+            ]),
+        )
+
+    def test_sync_study_links(self):
+        """ Tests the replacement of `StudyKeyword` records via the
+            `sync_study_links` method of the `DalClinicalTrials` class.
+        """
+
+        # Create fixtures.
+        study_01_id, _ = create_study(dal=self.dal, nct_id="nct_id_01")
+        study_02_id, _ = create_study(dal=self.dal, nct_id="nct_id_02")
+        study_03_id, _ = create_study(dal=self.dal, nct_id="nct_id_03")
+        keyword_ids = self.dal.biodi_keywords(keywords=["a", "b", "c"])
+
+        self.dal.biodi_study_keywords(
+            study_ids=[study_01_id, study_01_id, study_02_id, study_03_id],
+            keyword_ids=keyword_ids[:2] + keyword_ids[:1] + keyword_ids[:1],
+        )
+
+        with self.dal.session_scope() as session:
+            ids_unchanged = {
+                obj.study_keyword_id for obj in session.query(StudyKeyword)
+                if (obj.study_id, obj.keyword_id) ==
+                (study_01_id, keyword_ids[1])
+            }
+
+        # Replace the keywords of the first two studies.
+        self.dal.sync_study_links(
+            orm_class=StudyKeyword,
+            study_ids=[study_01_id, study_02_id],
+            new_ids=[keyword_ids[1:], []],
+        )
+
+        with self.dal.session_scope() as session:
+            objs = session.query(StudyKeyword).all()
+            pairs = sorted((obj.study_id, obj.keyword_id) for obj in objs)
+            ids = {obj.study_keyword_id for obj in objs}
+
+        # Assert that the third study's keywords were left untouched.
+        self.assertEqual(
+            pairs,
+            sorted([
+                (study_01_id, keyword_ids[1]),
+                (study_01_id, keyword_ids[2]),
+                (study_03_id, keyword_ids[0]),
+            ]),
+        )
+        # Assert that the unchanged record was not re-inserted.
+        self.assertTrue(ids_unchanged.issubset(ids))
+
+    def test_sync_study_links_invalid(self):
+        """ Tests the replacement of `StudySponsor` records via the
+            `sync_study_links` method of the `DalClinicalTrials` class to
+            ensure associations with additional columns are rejected.
+        """
+
+        study_id, _ = create_study(dal=self.dal)
+
+        self.assertRaises(
+            InvalidArgumentsError,
+            self.dal.sync_study_links,
+            orm_class=StudySponsor,
+            study_ids=[study_id],
+            new_ids=[[]],
+        )
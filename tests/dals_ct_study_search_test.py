@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `search_studies` method of the
+`DalClinicalTrials` class.
+"""
+
+import datetime
+
+from fform.orm_ct import GenderType
+from fform.orm_ct import MeshTermType
+from fform.orm_ct import OverallStatusType
+from fform.orm_ct import PhaseType
+from fform.dals_mt import DalMesh
+
+from tests.bases import DalCtTestBase
+from tests.assets.items_ct import create_study
+from tests.assets.items_ct import create_eligibility
+from tests.assets.items_mt import create_descriptor
+
+
+class DalCtStudySearchTest(DalCtTestBase):
+
+    def setUp(self):
+
+        super(DalCtStudySearchTest, self).setUp()
+
+        self.dal_mesh = DalMesh(
+            sql_username=self.cfg.sql_username,
+            sql_password=self.cfg.sql_password,
+            sql_host=self.cfg.sql_host,
+            sql_port=self.cfg.sql_port,
+            sql_db=self.cfg.sql_db
+        )
+
+        self.descriptor_01_id, _ = create_descriptor(
+            dal=self.dal_mesh,
+            ui="D000001",
+        )
+        self.descriptor_02_id, _ = create_descriptor(
+            dal=self.dal_mesh,
+            ui="D000002",
+        )
+
+        # Create studies differing in every searched attribute.
+        self.study_ids = []
+        fixtures = [
+            (
+                GenderType.ALL,
+                ("18 Years", "65 Years"),
+                2019,
+                OverallStatusType.RECRUITING,
+                PhaseType.PHASE_1,
+                self.descriptor_01_id,
+            ),
+            (
+                GenderType.FEMALE,
+                ("6 Months", "17 Years"),
+                2015,
+                OverallStatusType.RECRUITING,
+                PhaseType.PHASE_2,
+                self.descriptor_01_id,
+            ),
+            (
+                GenderType.MALE,
+                ("N/A", "N/A"),
+                2010,
+                OverallStatusType.COMPLETED,
+                PhaseType.PHASE_1,
+                self.descriptor_02_id,
+            ),
+        ]
+        for idx, fixture in enumerate(fixtures):
+            gender, ages, year, status, phase, descriptor_id = fixture
+            eligibility_id, _ = create_eligibility(
+                dal=self.dal,
+                gender=gender,
+                minimum_age=ages[0],
+                maximum_age=ages[1],
+            )
+            study_id, _ = create_study(
+                dal=self.dal,
+                nct_id="nct_id_{}".format(idx),
+                eligibility_id=eligibility_id,
+                start_date=datetime.date(year, 6, 1),
+                overall_status=status,
+                phase=phase,
+            )
+            self.dal.iodu_study_descriptor(
+                study_id=study_id,
+                descriptor_id=descriptor_id,
+                study_descriptor_type=MeshTermType.CONDITION,
+            )
+            self.study_ids.append(study_id)
+
+    def test_search_studies(self):
+        """ Tests the search of `Study` records via the `search_studies`
+            method of the `DalClinicalTrials` class.
+        """
+
+        study_ids, count = self.dal.search_studies()
+        self.assertEqual(study_ids, sorted(self.study_ids))
+        self.assertEqual(count, 3)
+
+        study_ids, count = self.dal.search_studies(
+            descriptor_ids=[self.descriptor_01_id, self.descriptor_02_id],
+        )
+        self.assertEqual(count, 3)
+
+        study_ids, _ = self.dal.search_studies(
+            descriptor_ids=[self.descriptor_01_id],
+        )
+        self.assertEqual(study_ids, self.study_ids[:2])
+
+        study_ids, _ = self.dal.search_studies(gender=GenderType.FEMALE)
+        self.assertEqual(study_ids, self.study_ids[:2])
+
+        study_ids, _ = self.dal.search_studies(year_range=(2014, 2016))
+        self.assertEqual(study_ids, [self.study_ids[1]])
+
+        study_ids, _ = self.dal.search_studies(year_range=(None, 2015))
+        self.assertEqual(study_ids, self.study_ids[1:])
+
+        study_ids, _ = self.dal.search_studies(
+            overall_statuses=[OverallStatusType.RECRUITING],
+            phases=[PhaseType.PHASE_1],
+        )
+        self.assertEqual(study_ids, [self.study_ids[0]])
+
+    def test_search_studies_age_range(self):
+        """ Tests the search of `Study` records by an age range via the
+            `search_studies` method of the `DalClinicalTrials` class.
+        """
+
+        # Studies without age limits match any age range.
+        study_ids, _ = self.dal.search_studies(age_range=(5, 10))
+        self.assertEqual(study_ids, self.study_ids[1:])
+
+        study_ids, _ = self.dal.search_studies(age_range=(70, None))
+        self.assertEqual(study_ids, [self.study_ids[2]])
+
+        study_ids, _ = self.dal.search_studies(age_range=(17, 18))
+        self.assertEqual(study_ids, self.study_ids)
+
+    def test_search_studies_pagination(self):
+        """ Tests the keyset pagination of `Study` records via the
+            `search_studies` method of the `DalClinicalTrials` class.
+        """
+
+        study_ids_01, count = self.dal.search_studies(limit=2)
+        self.assertEqual(study_ids_01, self.study_ids[:2])
+        self.assertEqual(count, 3)
+
+        study_ids_02, count = self.dal.search_studies(
+            limit=2,
+            cursor=study_ids_01[-1],
+            do_count=False,
+        )
+        self.assertEqual(study_ids_02, self.study_ids[2:])
+        self.assertIsNone(count)
@@ -152,3 +152,41 @@ class DalCtStudySponsorTest(DalCtTestBase):
         obj = self.dal.get(StudySponsor, obj_id)  # type: StudySponsor
 
         self.assertIsNone(obj)
+
+    def test_biodu_study_sponsors(self):
+        """ Tests the BIODU insertion of `StudySponsor` records via the
+            `biodu_study_sponsors` method of the `DalClinicalTrials` class.
+        """
+
+        # Create fixtures.
+        study_id, _ = create_study(dal=self.dal)
+        sponsor_01_id, _ = create_sponsor(dal=self.dal, agency="agency_01")
+        sponsor_02_id, _ = create_sponsor(dal=self.dal, agency="agency_02")
+
+        # BIODU new `StudySponsor` records.
+        self.dal.biodu_study_sponsors(
+            study_ids=[study_id, study_id],
+            sponsor_ids=[sponsor_01_id, sponsor_02_id],
+            sponsor_types=[SponsorType.LEAD, SponsorType.COLLABORATOR],
+        )
+
+        # BIODU an existing `StudySponsor` record with a different type.
+        self.dal.biodu_study_sponsors(
+            study_ids=[study_id],
+            sponsor_ids=[sponsor_01_id],
+            sponsor_types=[SponsorType.COLLABORATOR],
+        )
+
+        with self.dal.session_scope() as session:
+            sponsor_types = {
+                obj.sponsor_id: obj.sponsor_type
+                for obj in session.query(StudySponsor)
+            }
+
+        self.assertEqual(
+            sponsor_types,
+            {
+                sponsor_01_id: SponsorType.COLLABORATOR,
+                sponsor_02_id: SponsorType.COLLABORATOR,
+            },
+        )
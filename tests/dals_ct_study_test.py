@@ -12,6 +12,7 @@ from fform.orm_ct import OverallStatusType
 from fform.orm_ct import StudyType
 from fform.orm_ct import PhaseType
 from fform.orm_ct import BiospecRetentionType
+from fform.excs import InvalidArgumentsError
 
 from tests.bases import DalCtTestBase
 from tests.assets.items_ct import create_oversight_info
@@ -24,6 +25,7 @@ from tests.assets.items_ct import create_responsible_party
 from tests.assets.items_ct import create_patient_data
 from tests.assets.items_ct import create_person
 from tests.assets.items_ct import create_contact
+from tests.assets.items_ct import create_study
 
 
 class DalCtStudyTest(DalCtTestBase):
@@ -90,7 +92,11 @@ class DalCtStudyTest(DalCtTestBase):
         self.assertEqual(obj_id, 1)
 
         # Retrieve the new record.
-        obj = self.dal.get(Study, obj_id)  # type: Study
+        obj = self.dal.get(
+            Study,
+            obj_id,
+            undefer_groups=["descriptions"],
+        )  # type: Study
 
         # Assert that the different fields of the record match.
         self.assertEqual(obj.study_id, obj_id)
@@ -128,6 +134,39 @@ class DalCtStudyTest(DalCtTestBase):
         self.assertEqual(obj.responsible_party_id, responsible_party_id)
         self.assertEqual(obj.patient_data_id, patient_data_id)
 
+    def test_get_study_deferred_descriptions(self):
+        """ Tests that the `descriptions` group of `Study` columns is only
+            loaded when undeferred through the `undefer_groups` argument."""
+
+        study_id, _ = create_study(dal=self.dal)
+
+        # Retrieve the record without its deferred columns.
+        obj = self.dal.get(Study, study_id)  # type: Study
+
+        self.assertEqual(obj.brief_title, "brief_title")
+        self.assertNotIn("brief_summary", obj.__dict__)
+        self.assertNotIn("detailed_description", obj.__dict__)
+        self.assertNotIn("brief_summary", obj.to_dict())
+
+        # Retrieve the record alongside its deferred columns.
+        obj = self.dal.get(
+            Study,
+            study_id,
+            undefer_groups=["descriptions"],
+        )  # type: Study
+
+        self.assertEqual(obj.brief_summary, "brief_summary")
+        self.assertEqual(obj.detailed_description, "detailed_description")
+
+        # Assert that undefined groups are rejected.
+        self.assertRaises(
+            InvalidArgumentsError,
+            self.dal.get,
+            Study,
+            study_id,
+            undefer_groups=["undefined"],
+        )
+
     def test_iodu_study_duplicate(self):
         """ Tests the IODU insertion of duplicate `Study` records to ensure
             deduplication functions as intended.
@@ -405,3 +444,72 @@ class DalCtStudyTest(DalCtTestBase):
         obj = self.dal.get(Study, obj_id)  # type: Study
 
         self.assertIsNone(obj)
+
+    def test_biodu_studies(self):
+        """ Tests the BIODU insertion of `Study` records via the
+            `biodu_studies` method of the `DalClinicalTrials` class.
+        """
+
+        # Create fixtures.
+        study_id, refr = create_study(dal=self.dal)
+
+        # BIODU an existing and a new `Study` record.
+        study_ids = self.dal.biodu_studies(
+            rows=[
+                dict(refr, brief_title="brief_title_updated"),
+                dict(refr, nct_id="nct_id_02"),
+            ],
+        )
+
+        self.assertEqual(set(study_ids.keys()), {"nct_id", "nct_id_02"})
+        self.assertEqual(study_ids["nct_id"], study_id)
+        self.assertNotEqual(study_ids["nct_id_02"], study_id)
+
+        # Assert that the existing record was updated.
+        obj = self.dal.get(Study, study_id)  # type: Study
+        self.assertEqual(obj.brief_title, "brief_title_updated")
+
+        obj = self.dal.get(Study, study_ids["nct_id_02"])  # type: Study
+        self.assertEqual(obj.brief_title, "brief_title")
+
+    def test_iodu_study_unchanged(self):
+        """ Tests the IODU insertion of an unchanged `Study` record to ensure
+            the update is skipped while its ID is still returned and the
+            outcomes are counted.
+        """
+
+        # Create fixtures.
+        study_id, refr = create_study(dal=self.dal)
+
+        # IODU the same `Study` record anew.
+        obj_id = self.dal.iodu_study(**refr)
+
+        self.assertEqual(obj_id, study_id)
+        self.assertEqual(self.dal.iodu_counts[("studies", "inserted")], 1)
+        self.assertEqual(self.dal.iodu_counts[("studies", "unchanged")], 1)
+        self.assertEqual(self.dal.iodu_counts[("studies", "updated")], 0)
+
+        # IODU the same `Study` record with a changed title.
+        obj_id = self.dal.iodu_study(
+            **dict(refr, brief_title="brief_title_updated")
+        )
+
+        self.assertEqual(obj_id, study_id)
+        self.assertEqual(self.dal.iodu_counts[("studies", "updated")], 1)
+
+    def test_biodu_studies_unchanged(self):
+        """ Tests the BIODU insertion of unchanged `Study` records via the
+            `biodu_studies` method to ensure their IDs are still returned.
+        """
+
+        # Create fixtures.
+        study_id, refr = create_study(dal=self.dal)
+
+        study_ids = self.dal.biodu_studies(
+            rows=[refr, dict(refr, nct_id="nct_id_02")],
+        )
+
+        self.assertEqual(study_ids["nct_id"], study_id)
+        self.assertIn("nct_id_02", study_ids)
+        self.assertEqual(self.dal.iodu_counts[("studies", "unchanged")], 1)
+        self.assertEqual(self.dal.iodu_counts[("studies", "inserted")], 2)
@@ -47,6 +47,7 @@ class DalMtDescriptorDefinitionTest(DalMtTestBase):
         obj = self.dal.get(
             DescriptorDefinition,
             obj_id,
+            undefer_groups=["definition"],
         )  # type: DescriptorDefinition
 
         # Assert that the different fields of the record match.
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `iter_json` and `dump_json` functions of
+the `encoders` module.
+"""
+
+import io
+import json
+
+import sqlalchemy
+
+from fform.encoders import dump_json
+from fform.encoders import iter_json
+from fform.orm_ct import Keyword
+
+from tests.bases import DalCtTestBase
+from tests.assets.items_ct import create_keyword
+
+
+class EncodersTest(DalCtTestBase):
+
+    def setUp(self):
+        """Creates the `Keyword` records encoded by the tests."""
+
+        super(EncodersTest, self).setUp()
+
+        self.keywords = ["keyword_01", "keyword_02", "keyword_03"]
+        for keyword in self.keywords:
+            create_keyword(dal=self.dal, keyword=keyword)
+
+    def test_dump_json_orm(self):
+        """ Tests the encoding of `Keyword` objects as a JSON array via the
+            `dump_json` function."""
+
+        fout = io.BytesIO()
+
+        with self.dal.session_scope() as session:
+            query = session.query(Keyword).order_by(Keyword.keyword_id)
+            num_bytes = dump_json(records=query.yield_per(2), fout=fout)
+
+        self.assertEqual(num_bytes, len(fout.getvalue()))
+
+        objs = json.loads(fout.getvalue())
+
+        self.assertEqual([obj["keyword"] for obj in objs], self.keywords)
+        # Assert that the binary MD5 hashes are hex-encoded.
+        for obj in objs:
+            self.assertEqual(len(obj["md5"]), 32)
+
+    def test_dump_json_core_ndjson(self):
+        """ Tests the encoding of Core rows as NDJSON via the `dump_json`
+            function."""
+
+        fout = io.BytesIO()
+
+        with self.dal.session_scope() as session:
+            query = sqlalchemy.select([Keyword.__table__]).order_by(
+                Keyword.__table__.c.keyword_id,
+            )
+            dump_json(
+                records=session.execute(query),
+                fout=fout,
+                do_ndjson=True,
+            )
+
+        lines = fout.getvalue().splitlines()
+
+        self.assertEqual(len(lines), len(self.keywords))
+        self.assertEqual(
+            [json.loads(line)["keyword"] for line in lines],
+            self.keywords,
+        )
+
+    def test_iter_json_empty(self):
+        """ Tests the encoding of no records via the `iter_json` function."""
+
+        self.assertEqual(b"".join(iter_json(records=[])), b"[]")
+        self.assertEqual(b"".join(iter_json(records=[], do_ndjson=True)), b"")
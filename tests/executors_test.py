@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `IngestionExecutor` class and the
+`shard_items` function.
+"""
+
+import unittest
+
+from fform.dals_ct import DalClinicalTrials
+from fform.executors import IngestionExecutor
+from fform.executors import shard_items
+from fform.orm_ct import Keyword
+
+from tests.bases import DalCtTestBase
+
+
+def _iodi_keyword(dal: DalClinicalTrials, keyword: str) -> int:
+    """IODIs a `Keyword` record through a worker's DAL."""
+
+    return dal.iodi_keyword(keyword=keyword)
+
+
+class ShardItemsTest(unittest.TestCase):
+
+    def test_shard_items(self):
+        """Tests that the `shard_items` function places all work-items sharing
+        a key in the same shard."""
+
+        items = ["NCT01", "NCT02", "NCT01", "NCT03", "NCT02"]
+
+        shards = shard_items(items=items, key=lambda item: item, num_shards=2)
+
+        self.assertEqual(len(shards), 2)
+        self.assertEqual(sum(map(len, shards)), len(items))
+
+        # Assert that each key appears in a single shard.
+        for item in set(items):
+            shards_with_item = [
+                shard for shard in shards
+                if item in [shard_item for _, shard_item in shard]
+            ]
+            self.assertEqual(len(shards_with_item), 1)
+
+
+class IngestionExecutorTest(DalCtTestBase):
+
+    def test_run(self):
+        """Tests the processing of work-items across worker processes and the
+        merging of their results and metrics."""
+
+        executor = IngestionExecutor(
+            dal_class=DalClinicalTrials,
+            dal_kwargs={
+                "sql_username": self.cfg.sql_username,
+                "sql_password": self.cfg.sql_password,
+                "sql_host": self.cfg.sql_host,
+                "sql_port": self.cfg.sql_port,
+                "sql_db": self.cfg.sql_db,
+            },
+            num_workers=2,
+        )
+
+        keywords = ["keyword_{}".format(idx) for idx in range(10)]
+
+        obj_ids, metrics = executor.run(
+            func=_iodi_keyword,
+            items=keywords,
+            key=lambda keyword: keyword,
+        )
+
+        self.assertEqual(metrics["items"], len(keywords))
+        self.assertEqual(
+            sum(worker["items"] for worker in metrics["workers"].values()),
+            len(keywords),
+        )
+
+        # Assert that the results are aligned to the work-items.
+        for keyword, obj_id in zip(keywords, obj_ids):
+            obj = self.dal.get(Keyword, obj_id)  # type: Keyword
+            self.assertEqual(obj.keyword, keyword)
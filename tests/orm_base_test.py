@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `OrmBase` class and its serialization
+methods.
+"""
+
+import sqlalchemy.orm
+
+from fform.orm_base import SerializationSpec
+from fform.orm_ct import Study
+from fform.orm_ct import StudyDates
+from fform.orm_ct import Keyword
+from fform.orm_ct import Facility
+
+from tests.bases import DalCtTestBase
+from tests.assets.items_ct import create_study
+from tests.assets.items_ct import create_study_dates
+from tests.assets.items_ct import create_keyword
+
+
+class OrmBaseTest(DalCtTestBase):
+
+    def test_to_dict(self):
+        """ Tests the conversion of a `StudyDates` record into a `dict` via the
+            `to_dict` method."""
+
+        obj_id, refr = create_study_dates(dal=self.dal)
+
+        obj = self.dal.get(StudyDates, obj_id)  # type: StudyDates
+
+        obj_dict = obj.to_dict()
+        obj_dict_serialisable = obj.to_dict(serialisable=True)
+
+        self.assertEqual(obj_dict["study_dates_id"], obj_id)
+        self.assertEqual(obj_dict_serialisable["study_dates_id"], obj_id)
+        for key, value in refr.items():
+            self.assertEqual(obj_dict[key], value)
+            self.assertEqual(obj_dict_serialisable[key], value.isoformat())
+
+    def test_to_dict_fields_cached(self):
+        """ Tests that the fields used by the `to_dict` method are compiled
+            once per class and exclude private attributes."""
+
+        obj_id, _ = create_keyword(dal=self.dal)
+
+        obj = self.dal.get(Keyword, obj_id)  # type: Keyword
+
+        fields = Keyword._get_fields()
+
+        self.assertIs(Keyword._get_fields(), fields)
+        self.assertIn("keyword", fields)
+        self.assertIn("studies", fields)
+        self.assertFalse(any(name.startswith("_") for name in fields))
+        self.assertEqual(obj.to_dict()["keyword"], obj.keyword)
+        # Assert that relationships are only included when `deep=True`.
+        self.assertNotIn("studies", obj.to_dict())
+
+    def test_to_dict_spec(self):
+        """ Tests the deep conversion of a `Study` record with keywords loaded
+            in both directions into a `dict` via the `to_dict` method with a
+            `SerializationSpec`."""
+
+        study_id, _ = create_study(dal=self.dal)
+        for keyword in ["keyword_01", "keyword_02"]:
+            keyword_id, _ = create_keyword(dal=self.dal, keyword=keyword)
+            self.dal.iodi_study_keyword(
+                study_id=study_id,
+                keyword_id=keyword_id,
+            )
+
+        with self.dal.session_scope() as session:
+            query = session.query(Study)
+            query = query.options(
+                sqlalchemy.orm.joinedload("keywords").joinedload("studies")
+            )
+            obj = query.get(study_id)  # type: Study
+
+        # Assert that the back-reference to the study isn't followed.
+        obj_dict = obj.to_dict(deep=True)
+        self.assertEqual(len(obj_dict["keywords"]), 2)
+        for keyword_dict in obj_dict["keywords"]:
+            self.assertEqual(keyword_dict["studies"], [])
+
+        # Assert that only the specified attributes are included.
+        obj_dict = obj.to_dict(spec=SerializationSpec(
+            include=["nct_id", "keywords.keyword"],
+        ))
+        self.assertEqual(
+            sorted(obj_dict.keys()),
+            ["keywords", "nct_id"],
+        )
+        self.assertEqual(
+            sorted(obj_dict["keywords"], key=lambda item: item["keyword"]),
+            [{"keyword": "keyword_01"}, {"keyword": "keyword_02"}],
+        )
+
+        # Assert that relationships aren't followed beyond `max_depth`.
+        obj_dict = obj.to_dict(spec=SerializationSpec(
+            max_depth=0,
+            exclude=["md5"],
+        ))
+        self.assertNotIn("keywords", obj_dict)
+        self.assertNotIn("md5", obj_dict)
+        self.assertEqual(obj_dict["study_id"], study_id)
+
+    def test_to_dict_no_lazy_loads(self):
+        """ Tests that the deep conversion of a detached `Study` record into a
+            `dict` doesn't attempt to lazy-load its relationships."""
+
+        study_id, _ = create_study(dal=self.dal)
+
+        obj = self.dal.get(Study, study_id)  # type: Study
+
+        obj_dict = obj.to_dict(deep=True)
+
+        self.assertEqual(obj_dict["study_id"], study_id)
+        self.assertNotIn("keywords", obj_dict)
+
+    def test_update_md5_flush(self):
+        """ Tests that the MD5 hash of a `Keyword` record is calculated once
+            the record is flushed through the ORM."""
+
+        obj = Keyword()
+        obj.keyword = "Keyword"
+
+        # Assert that the hash isn't calculated upon assignment.
+        self.assertIsNone(obj.md5)
+
+        with self.dal.session_scope() as session:
+            session.add(obj)
+            session.flush()
+
+            self.assertEqual(
+                obj.md5,
+                Keyword.calculate_md5(
+                    attrs={"keyword": "keyword"},
+                    do_lowercase=True,
+                ),
+            )
+
+    def test_calculate_md5_batch(self):
+        """ Tests that the `calculate_md5_batch` method calculates the same MD5
+            hashes as those of the records."""
+
+        rows = [
+            {
+                "name": "Facility {}".format(idx),
+                "city": "City",
+                "state": None,
+                "zip_code": "12345",
+                "country": "Country",
+            } for idx in range(3)
+        ]
+
+        md5s = Facility.calculate_md5_batch(rows=rows)
+
+        for row, md5 in zip(rows, md5s):
+            obj_id = self.dal.iodi_facility(**row)
+            obj = self.dal.get(Facility, obj_id)  # type: Facility
+            self.assertEqual(obj.md5, md5)
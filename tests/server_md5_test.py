@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the server-side calculation of MD5 hashes
+set up through the `server_md5` module.
+"""
+
+import sqlalchemy
+from sqlalchemy.dialects.postgresql import insert
+
+from fform.orm_ct import AgencyClassType
+from fform.orm_ct import Facility
+from fform.orm_ct import Keyword
+from fform.orm_ct import Sponsor
+from fform.server_md5 import create_md5_triggers
+from fform.server_md5 import drop_md5_triggers
+from fform.server_md5 import get_md5_classes
+
+from tests.bases import DalCtTestBase
+
+
+class ServerMd5Test(DalCtTestBase):
+
+    def setUp(self):
+        """Creates the triggers calculating the MD5 hashes."""
+
+        super(ServerMd5Test, self).setUp()
+
+        self.orm_classes = [Keyword, Sponsor, Facility]
+
+        create_md5_triggers(self.dal.engine, orm_classes=self.orm_classes)
+
+    def tearDown(self):
+        """Drops the triggers calculating the MD5 hashes."""
+
+        drop_md5_triggers(self.dal.engine, orm_classes=self.orm_classes)
+
+        super(ServerMd5Test, self).tearDown()
+
+    def _insert_and_compare(self, orm_class, rows):
+        """Inserts rows without MD5 hashes and asserts that the hashes
+        calculated by the server match the ones calculated in Python."""
+
+        # Key the row values by column as the attribute names may differ.
+        columns = sqlalchemy.inspect(orm_class).c
+        values = [
+            {columns[name].key: value for name, value in row.items()}
+            for row in rows
+        ]
+
+        with self.dal.session_scope() as session:
+            statement = insert(orm_class).values(values).returning(
+                orm_class.md5,
+            ).on_conflict_do_nothing()
+            md5s = [row.md5 for row in session.execute(statement)]
+
+        self.assertEqual(
+            [bytes(md5) for md5 in md5s],
+            orm_class.calculate_md5_batch(rows=rows),
+        )
+
+    def test_get_md5_classes(self):
+        """Tests that all classes defining an MD5 hash are retrieved."""
+
+        orm_classes = get_md5_classes()
+
+        for orm_class in self.orm_classes:
+            self.assertIn(orm_class, orm_classes)
+
+    def test_keyword(self):
+        """Tests the server-side MD5 hash of `Keyword` records."""
+
+        self._insert_and_compare(
+            orm_class=Keyword,
+            rows=[{"keyword": "Keyword"}, {"keyword": "Ψ-keyword"}],
+        )
+
+    def test_sponsor(self):
+        """Tests the server-side MD5 hash of `Sponsor` records with enumeration
+        and missing values."""
+
+        self._insert_and_compare(
+            orm_class=Sponsor,
+            rows=[
+                {"agency": "Agency", "agency_class": AgencyClassType.NIH},
+                {"agency": "Agency", "agency_class": None},
+            ],
+        )
+
+    def test_facility(self):
+        """Tests the server-side MD5 hash of `Facility` records with missing
+        values."""
+
+        self._insert_and_compare(
+            orm_class=Facility,
+            rows=[
+                {
+                    "name": "Facility",
+                    "city": None,
+                    "state": "State",
+                    "zip_code": None,
+                    "country": "Country",
+                },
+            ],
+        )
+
+    def test_deduplication(self):
+        """Tests that rows differing only in casing are deduplicated by the
+        server."""
+
+        with self.dal.session_scope() as session:
+            statement = insert(Keyword).values(
+                [{"keyword": "keyword"}, {"keyword": "KEYWORD"}],
+            ).on_conflict_do_nothing()
+            session.execute(statement)
+
+            self.assertEqual(session.query(Keyword).count(), 1)
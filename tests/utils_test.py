@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+This module defines unit-tests for the `EnumBase` class and the
+`parse_age_days` function of the `utils` module.
+"""
+
+import unittest
+
+from fform.utils import EnumBase
+from fform.utils import parse_age_days
+
+
+class EnumTest(EnumBase):
+    """ Enumeration used by the tests."""
+
+    ONE = "One"
+    UNO = "One"
+    TWO = "Two"
+
+
+class EnumBaseTest(unittest.TestCase):
+
+    def test_get_member(self):
+        """ Tests the retrieval of members by value via the `get_member`
+            method."""
+
+        self.assertEqual(EnumTest.get_member("Two"), EnumTest.TWO)
+        # Assert that aliased values resolve to the first member defined.
+        self.assertIs(EnumTest.get_member("One"), EnumTest.ONE)
+        self.assertIsNone(EnumTest.get_member("Three"))
+        self.assertIsNone(EnumTest.get_member(""))
+        self.assertIsNone(EnumTest.get_member(None))
+
+    def test_get_member_index_cached(self):
+        """ Tests that the index of members is built once per enumeration
+            class."""
+
+        index = EnumTest.get_member_index()
+
+        self.assertIs(EnumTest.get_member_index(), index)
+        self.assertEqual(index, {"One": EnumTest.ONE, "Two": EnumTest.TWO})
+
+    def test_get_members(self):
+        """ Tests the retrieval of members for a sequence of values via the
+            `get_members` method."""
+
+        members, unknown_values = EnumTest.get_members(
+            ["Two", None, "Three", "One", "Four", "Three", ""],
+        )
+
+        self.assertEqual(
+            members,
+            [EnumTest.TWO, None, None, EnumTest.ONE, None, None, None],
+        )
+        self.assertEqual(unknown_values, ["Three", "Four"])
+
+
+class ParseAgeDaysTest(unittest.TestCase):
+
+    def test_parse_age_days(self):
+        """ Tests the parsing of free-text eligibility ages into days via the
+            `parse_age_days` function."""
+
+        self.assertEqual(parse_age_days("18 Years"), 6574)
+        self.assertEqual(parse_age_days("1 year"), 365)
+        self.assertEqual(parse_age_days("6 Months"), 182)
+        self.assertEqual(parse_age_days("2 Weeks"), 14)
+        self.assertEqual(parse_age_days("28 Days"), 28)
+        self.assertEqual(parse_age_days("36 Hours"), 1)
+        self.assertEqual(parse_age_days(" 1.5 Years "), 547)
+
+    def test_parse_age_days_no_limit(self):
+        """ Tests that ages defining no limit or that cannot be parsed are
+            parsed into `None` via the `parse_age_days` function."""
+
+        for age in [None, "", "N/A", "new 10 years", "10 Decades", "Years"]:
+            self.assertIsNone(parse_age_days(age))